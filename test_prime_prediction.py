@@ -6,106 +6,162 @@ Test known primes against our validation criteria to see where prediction is fai
 
 import numpy as np
 
+from ufrf_primes import is_prime_array
+from ufrf_kernels import harmonic_unity, phi_power, direct_angle_to_source, multi_scale_unity_rate
+
 class UFRFPrimeDiagnostic:
     def __init__(self):
         self.phi = (1 + np.sqrt(5)) / 2
         self.scale_range = range(-5, 6)
+        self.prime_contexts = [2, 3, 5, 7, 11, 13]
+        self.cycle_positions = [2, 3, 5, 7, 11, 0]
         
     def check_prime_at_scale(self, candidate, scale):
         """Check if candidate is prime at specific scale"""
-        scale_adjusted = int(candidate * (self.phi ** scale)) % 1000
-        if scale_adjusted < 2:
-            return False
-        
-        for i in range(2, int(np.sqrt(scale_adjusted)) + 1):
-            if scale_adjusted % i == 0:
-                return False
-        return True
+        return bool(self.check_prime_at_scale_batch([candidate], scale)[0])
+    
+    def check_prime_at_scale_batch(self, candidates, scale):
+        """Check an array of candidates for primality at specific scale"""
+        scale_adjusted = (np.asarray(candidates) * (self.phi ** scale)).astype(np.int64) % 1000
+        return is_prime_array(scale_adjusted)
+    
+    def scale_unity_deviation_batch(self, candidates, scale):
+        """|U_p(n) - 1| for n = candidate * φ^scale in context p = max(scale + 2, 1)"""
+        n = np.asarray(candidates) * (self.phi ** scale)
+        return np.abs(harmonic_unity(n, max(scale + 2, 1)) - 1)
     
     def is_prime_via_scale_intersection(self, candidate, scale1, scale2):
         """Validate prime through multi-scale criteria"""
-        if candidate < 2:
-            return False
+        return bool(self.is_prime_via_scale_intersection_batch([candidate], scale1, scale2)[0])
+    
+    def is_prime_via_scale_intersection_batch(self, candidates, scale1, scale2):
+        """Validate an array of candidates through multi-scale criteria"""
+        candidates = np.asarray(candidates)
         
         # Check primality at both scales
-        scale1_valid = self.check_prime_at_scale(candidate, scale1)
-        scale2_valid = self.check_prime_at_scale(candidate, scale2)
-        
-        # Cross-scale harmonic unity check with bounds
-        n1 = candidate * (self.phi ** scale1)
-        n2 = candidate * (self.phi ** scale2)
-        p1 = max(scale1 + 2, 1)
-        p2 = max(scale2 + 2, 1)
+        scale1_valid = self.check_prime_at_scale_batch(candidates, scale1)
+        scale2_valid = self.check_prime_at_scale_batch(candidates, scale2)
         
-        if p1 <= 0 or p2 <= 0:
-            return False
+        # Cross-scale harmonic unity check
+        unity_deviation = (self.scale_unity_deviation_batch(candidates, scale1) +
+                           self.scale_unity_deviation_batch(candidates, scale2))
         
-        try:
-            unity1 = abs(np.cos(n1 * np.pi / p1)) + abs(np.sin(n1 * np.pi / p1)) + ((n1 / p1) % 1)
-            unity2 = abs(np.cos(n2 * np.pi / p2)) + abs(np.sin(n2 * np.pi / p2)) + ((n2 / p2) % 1)
-            
-            harmonic_unity = abs(unity1 - 1) + abs(unity2 - 1)
-            
-            return scale1_valid and scale2_valid and harmonic_unity < 1/10
-        except (ValueError, ZeroDivisionError, RuntimeWarning):
-            return False
+        return (candidates >= 2) & scale1_valid & scale2_valid & (unity_deviation < 1/10)
     
     def has_direct_angle_to_source(self, candidate):
         """Check if number has direct angle to source (0)"""
-        if candidate <= 1:
-            return False
-        
-        angle_to_source = candidate % 360
-        
-        for scale in range(-5, 6):
-            scale_angle = (angle_to_source + scale * 360/13) % 360
-            if abs(scale_angle) < 1:
-                return True
-        
-        return False
+        return bool(self.has_direct_angle_to_source_batch([candidate])[0])
+    
+    def has_direct_angle_to_source_batch(self, candidates):
+        """Check which candidates have a direct angle to source (0)"""
+        return direct_angle_to_source(candidates, self.scale_range)
     
     def check_multi_scale_harmonic_unity(self, candidate):
         """Check harmonic unity across multiple scales"""
-        unity_checks = []
-        
-        for scale in range(-5, 6):
-            for prime_context in [2, 3, 5, 7, 11, 13]:
-                n = candidate * (self.phi ** scale)
-                p = prime_context
-                
-                unity_value = (abs(np.cos(n * np.pi / p)) + 
-                              abs(np.sin(n * np.pi / p)) + 
-                              ((n / p) % 1))
-                
-                unity_checks.append(abs(unity_value - 1) < 1/10)
-        
-        return sum(unity_checks) / len(unity_checks) > 3/5
+        return bool(self.check_multi_scale_harmonic_unity_batch([candidate])[0])
+    
+    def check_multi_scale_harmonic_unity_batch(self, candidates):
+        """Check harmonic unity across multiple scales for an array of candidates"""
+        unity_rate = multi_scale_unity_rate(candidates, self.scale_range, self.prime_contexts, 1/10)
+        return unity_rate > 3/5
     
     def calculate_multi_scale_resonance(self, candidate):
         """Calculate resonance across all scales"""
-        total_resonance = 0
+        return float(self.calculate_multi_scale_resonance_batch([candidate])[0])
+    
+    def calculate_multi_scale_resonance_batch(self, candidates):
+        """Calculate resonance across all scales for an array of candidates"""
+        candidates = np.asarray(candidates, dtype=float)
+        scales = np.arange(-10, 11)
         
-        for scale in range(-10, 11):
-            scale_resonance = 0
-            
-            scale_adjusted_candidate = candidate * (self.phi ** scale)
-            
-            golden_phase = scale_adjusted_candidate % (2 * np.pi)
-            golden_resonance = abs(np.cos(golden_phase))
-            
-            krystal_phase = scale_adjusted_candidate % (2 * np.pi)
-            krystal_resonance = abs(np.cos(-krystal_phase))
+        # Golden and krystal spiral resonance: |cos(φ)| * |cos(-φ)| = cos²(φ)
+        phase = np.mod(np.multiply.outer(candidates, phi_power(scales)), 2 * np.pi)
+        resonance = np.cos(phase) ** 2 @ phi_power(-np.abs(scales))
+        
+        cycle_resonance = np.where(np.isin(candidates % 13, self.cycle_positions), 1.0, 0.1)
+        return resonance * cycle_resonance
+    
+    def cross_scale_rate_batch(self, candidates):
+        """Fraction of scale pairs (scale1 < scale2) whose intersection validates each candidate"""
+        candidates = np.asarray(candidates)
+        scales = list(self.scale_range)
+        
+        # Per-scale primality and unity deviation, reused by every pair
+        valid = {s: self.check_prime_at_scale_batch(candidates, s) for s in scales}
+        deviation = {s: self.scale_unity_deviation_batch(candidates, s) for s in scales}
+        
+        passes = np.zeros(len(candidates), dtype=np.int64)
+        total_tests = 0
+        for i, scale1 in enumerate(scales):
+            for scale2 in scales[i+1:]:
+                total_tests += 1
+                passes += valid[scale1] & valid[scale2] & (deviation[scale1] + deviation[scale2] < 1/10)
+        
+        return np.where(candidates >= 2, passes / total_tests, 0.0)
+    
+    def evaluate_criteria_batch(self, candidates):
+        """Evaluate every validation criterion for an array of candidates"""
+        candidates = np.asarray(candidates, dtype=np.int64)
+        
+        cross_scale_rate = self.cross_scale_rate_batch(candidates)
+        has_direct_angle = self.has_direct_angle_to_source_batch(candidates)
+        harmonic_unity_ok = self.check_multi_scale_harmonic_unity_batch(candidates)
+        valid_cycle_position = np.isin(candidates % 13, self.cycle_positions)
+        
+        return {
+            'cross_scale_rate': cross_scale_rate,
+            'has_direct_angle': has_direct_angle,
+            'harmonic_unity': harmonic_unity_ok,
+            'valid_cycle_position': valid_cycle_position,
+            'passes_criteria': ((cross_scale_rate > 0.5) & has_direct_angle &
+                                harmonic_unity_ok & valid_cycle_position)
+        }
+    
+    def assess_range(self, range_stop, range_start=2, block_size=1 << 18):
+        """
+        Assess the criteria as a prime classifier over every integer in
+        [range_start, range_stop) and return its confusion matrix.
+        """
+        confusion = {'true_positive': 0, 'false_positive': 0,
+                     'false_negative': 0, 'true_negative': 0}
+        criteria_failures = {'cross_scale': 0, 'direct_angle': 0,
+                             'harmonic_unity': 0, 'cycle_position': 0}
+        
+        for start in range(range_start, range_stop, block_size):
+            candidates = np.arange(start, min(start + block_size, range_stop))
+            actual = is_prime_array(candidates)
+            criteria = self.evaluate_criteria_batch(candidates)
+            predicted = criteria['passes_criteria']
             
-            cycle_position = candidate % 13
-            cycle_resonance = 1.0 if cycle_position in [2, 3, 5, 7, 11, 0] else 0.1
+            confusion['true_positive'] += int(np.count_nonzero(predicted & actual))
+            confusion['false_positive'] += int(np.count_nonzero(predicted & ~actual))
+            confusion['false_negative'] += int(np.count_nonzero(~predicted & actual))
+            confusion['true_negative'] += int(np.count_nonzero(~predicted & ~actual))
             
-            scale_resonance = golden_resonance * krystal_resonance * cycle_resonance
-            total_resonance += scale_resonance * (self.phi ** (-abs(scale)))
+            # Which criteria reject the known primes
+            criteria_failures['cross_scale'] += int(np.count_nonzero(actual & (criteria['cross_scale_rate'] <= 0.5)))
+            criteria_failures['direct_angle'] += int(np.count_nonzero(actual & ~criteria['has_direct_angle']))
+            criteria_failures['harmonic_unity'] += int(np.count_nonzero(actual & ~criteria['harmonic_unity']))
+            criteria_failures['cycle_position'] += int(np.count_nonzero(actual & ~criteria['valid_cycle_position']))
         
-        return total_resonance
+        tp, fp, fn = confusion['true_positive'], confusion['false_positive'], confusion['false_negative']
+        return {
+            'range': (range_start, range_stop),
+            'confusion': confusion,
+            'precision': tp / (tp + fp) if tp + fp else 0.0,
+            'recall': tp / (tp + fn) if tp + fn else 0.0,
+            'criteria_failures': criteria_failures
+        }
     
-    def test_known_primes(self):
-        """Test known primes against our criteria"""
+    def test_known_primes(self, limit=None):
+        """
+        Test known primes against our criteria.
+        With a limit, every integer below it is assessed in bulk and a
+        precision/recall confusion matrix is reported instead of per-prime lines.
+        """
+        if limit is not None:
+            return self.test_prime_range(limit)
+        
         known_primes = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67, 71, 73, 79, 83, 89, 97]
         
         print("=== UFRF Prime Prediction Diagnostic ===")
@@ -197,6 +253,30 @@ class UFRFPrimeDiagnostic:
         
         return results
 
+    def test_prime_range(self, limit):
+        """Assess the criteria as a prime classifier over [2, limit)"""
+        print("=== UFRF Prime Prediction Diagnostic ===")
+        print(f"Assessing all integers in [2, {limit}) against UFRF criteria")
+        print()
+        
+        assessment = self.assess_range(limit)
+        confusion = assessment['confusion']
+        known_primes = confusion['true_positive'] + confusion['false_negative']
+        
+        print("Confusion matrix (rows: actual, columns: predicted):")
+        print(f"  {'':>10} {'prime':>12} {'composite':>12}")
+        print(f"  {'prime':>10} {confusion['true_positive']:>12} {confusion['false_negative']:>12}")
+        print(f"  {'composite':>10} {confusion['false_positive']:>12} {confusion['true_negative']:>12}")
+        print()
+        print(f"Precision: {assessment['precision']:.2%}")
+        print(f"Recall: {assessment['recall']:.2%}")
+        
+        print("\nCriteria failure analysis:")
+        for criterion, failures in assessment['criteria_failures'].items():
+            print(f"  {criterion}: {failures}/{known_primes} fail ({failures/max(known_primes, 1):.1%})")
+        
+        return assessment
+
 if __name__ == "__main__":
     diagnostic = UFRFPrimeDiagnostic()
     results = diagnostic.test_known_primes() 
\ No newline at end of file
@@ -6,34 +6,20 @@ Focused testing of the fundamental mathematical principles
 of the Unified Fractal Resonance Framework.
 """
 
+import os
+import tempfile
 import numpy as np
 import matplotlib.pyplot as plt
 
-# Golden ratio constant
-PHI = (1 + np.sqrt(5)) / 2
-
-def is_prime(n):
-    """Check if a number is prime."""
-    if n < 2:
-        return False
-    for i in range(2, int(np.sqrt(n)) + 1):
-        if n % i == 0:
-            return False
-    return True
-
-def get_primes_up_to(n):
-    """Get all prime numbers up to n."""
-    return [i for i in range(2, n + 1) if is_prime(i)]
-
-def harmonic_unity(n, p):
-    """
-    Calculate harmonic unity value U_p(n).
-    U_p(n) = |cos(nπ/p)| + |sin(nπ/p)| + (n/p mod 1)
-    """
-    cos_term = abs(np.cos(n * np.pi / p))
-    sin_term = abs(np.sin(n * np.pi / p))
-    mod_term = (n / p) % 1
-    return cos_term + sin_term + mod_term
+from ufrf_io import (write_array_file, read_array_file, DiagnosticsWriter, read_diagnostics,
+                     save_results, load_results)
+from ufrf_primes import PrimeOracle, get_primes_up_to, is_prime_array
+from ufrf_kernels import (PHI, harmonic_unity, cross_scale_ratio_unity, interference_factor,
+                          cross_scale_interference, cross, spiral_intersection_mask,
+                          intersection_candidates, phi_power)
+from ufrftest2 import (InfiniteRecursiveUFRF, SpiralIntersectionIndex, PrimeCenterRegistry,
+                       DerivedFieldCache, field_energy)
+from test_prime_prediction import UFRFPrimeDiagnostic
 
 def cross_scale_unity(k, p, s1, s2):
     """
@@ -42,21 +28,7 @@ def cross_scale_unity(k, p, s1, s2):
     U_cross = φ^|s1-s2| * (|cos(ratio * π)| + |sin(ratio * π)| + (ratio % 1))
     where ratio = k * φ^{s1-s2}
     """
-    ratio = k * PHI**(s1 - s2)
-    cos_term = abs(np.cos(ratio * np.pi))
-    sin_term = abs(np.sin(ratio * np.pi))
-    mod_term = ratio % 1
-    return PHI**abs(s1 - s2) * (cos_term + sin_term + mod_term)
-
-def interference_factor(s1, s2):
-    """
-    Calculate cross-scale interference factor I(s1, s2).
-    I(s1,s2) = φ^|s1-s2| * cos(2π(s1-s2)/13) * exp(i*π(s1+s2)/7)
-    """
-    scale_diff = abs(s1 - s2)
-    phase_13 = np.cos(2 * np.pi * (s1 - s2) / 13)
-    phase_7 = np.exp(1j * np.pi * (s1 + s2) / 7)
-    return PHI**(-scale_diff) * phase_13 * phase_7  # Note: negative exponent for decay
+    return cross_scale_ratio_unity(k, s1, s2)
 
 def compute_s_matrix(scales):
     """
@@ -73,6 +45,106 @@ def compute_s_matrix(scales):
     
     return S
 
+# Per-candidate reference versions of the vectorized criteria, kept as
+# they were before the batch paths replaced them
+def reference_is_prime(n):
+    """Trial division"""
+    if n < 2:
+        return False
+    for i in range(2, int(np.sqrt(n)) + 1):
+        if n % i == 0:
+            return False
+    return True
+
+def reference_unity_value(n, p):
+    """|cos(nπ/p)| + |sin(nπ/p)| + (n/p mod 1) for a single n"""
+    return abs(np.cos(n * np.pi / p)) + abs(np.sin(n * np.pi / p)) + ((n / p) % 1)
+
+def reference_multi_scale_resonance(candidate, rest_resonance=True):
+    """Golden/krystal resonance summed over scales -10..10, one scale at a time"""
+    total_resonance = 0
+    for scale in range(-10, 11):
+        phase = (candidate * PHI ** scale) % (2 * np.pi)
+        cycle_position = candidate % 13
+        if cycle_position == 10 and rest_resonance:
+            cycle_resonance = (abs(np.cos(candidate * np.pi / 10)) + abs(np.sin(candidate * np.pi / 10))) / 2
+        elif cycle_position in [0, 2, 3, 5, 7, 11]:
+            cycle_resonance = 1.0
+        else:
+            cycle_resonance = 0.1
+        total_resonance += abs(np.cos(phase)) * abs(np.cos(-phase)) * cycle_resonance * PHI ** (-abs(scale))
+    return total_resonance
+
+def reference_geometric_resonance(candidate, scale):
+    """Five-spiral resonance above 3/5, with trial division below 1000"""
+    if candidate < 2:
+        return False
+    n = candidate * PHI ** scale
+    total_resonance = (abs(np.cos((n % (2 * np.pi)) * PHI)) + abs(np.cos(-(n % (2 * np.pi)) / PHI)) +
+                       abs(np.cos(n % np.pi)) + abs(np.cos((n % (2 * np.pi / 3)) * PHI / 3)) +
+                       abs(np.cos(n % (2 * np.pi * 13 / PHI)))) / 5
+    if candidate < 1000 and not reference_is_prime(candidate):
+        return False
+    return total_resonance > 3/5
+
+def reference_direct_angle_to_source(candidate):
+    """Direct angle to source at any of the scales -5..5"""
+    if candidate <= 1:
+        return False
+    angle_to_source = candidate % 360
+    return any(abs((angle_to_source + scale * 360/13) % 360) < 1 for scale in range(-5, 6))
+
+def reference_multi_scale_harmonic_unity(candidate):
+    """Unity within 1/10 in over 3/5 of the (scale, prime context) checks"""
+    unity_checks = [abs(reference_unity_value(candidate * PHI ** scale, p) - 1) < 1/10
+                    for scale in range(-5, 6) for p in [2, 3, 5, 7, 11, 13]]
+    return sum(unity_checks) / len(unity_checks) > 3/5
+
+def reference_check_prime_at_scale(candidate, scale):
+    """InfiniteRecursiveUFRF's geometric-necessity check at one scale"""
+    cycle_position = candidate % 13
+    if cycle_position == 10 and abs(np.cos(candidate * np.pi / 10)) + abs(np.sin(candidate * np.pi / 10)) > 1.5:
+        return True
+    if cycle_position not in [0, 2, 3, 5, 7, 11, 13]:
+        return False
+    n = candidate * PHI ** scale
+    if sum(abs(reference_unity_value(n, p) - 1) < 1/1000 for p in [2, 3, 5, 7, 11, 13]) < 3:
+        return False
+    return reference_multi_scale_resonance(candidate) >= 0.5 and reference_direct_angle_to_source(candidate)
+
+def reference_diagnostic_prime_at_scale(candidate, scale):
+    """UFRFPrimeDiagnostic's check: int(candidate φ^scale) mod 1000 is prime"""
+    return reference_is_prime(int(candidate * PHI ** scale) % 1000)
+
+def reference_unity_deviation(candidate, scale):
+    """|U_p(candidate φ^scale) - 1| in context p = max(scale + 2, 1)"""
+    return abs(reference_unity_value(candidate * PHI ** scale, max(scale + 2, 1)) - 1)
+
+def reference_scale_intersection(candidate, scale1, scale2, check_prime_at_scale, threshold):
+    """Prime at both scales with summed unity deviation below threshold"""
+    if candidate < 2:
+        return False
+    deviation = reference_unity_deviation(candidate, scale1) + reference_unity_deviation(candidate, scale2)
+    return check_prime_at_scale(candidate, scale1) and check_prime_at_scale(candidate, scale2) and deviation < threshold
+
+def reference_modulated_spirals(scale, resolution=1000):
+    """Prime, unity and harmonic spirals with their modulation filled point by point"""
+    t = np.linspace(0, 4*np.pi, resolution)
+    scale_factor = PHI ** scale
+    prime = scale_factor * np.exp(1j * t * np.pi)
+    unity = scale_factor * np.exp(1j * t * PHI / 3)
+    harmonic = scale_factor * np.exp(1j * t * 13 / PHI)
+    for i, time_val in enumerate(t):
+        prime_position = int(time_val * scale_factor) % 100
+        if reference_geometric_resonance(prime_position, scale):
+            prime[i] += PHI * np.exp(1j * prime_position * np.pi / 13)
+        unity_index = int(time_val * scale_factor) % 3
+        unity[i] += 2 * PHI * np.exp(1j * unity_index * 2 * np.pi / 3)
+        cycle_position = int(time_val * scale_factor) % 13
+        if cycle_position in [2, 5, 8, 11]:
+            harmonic[i] += PHI * np.exp(1j * cycle_position * np.pi / 6)
+    return {'prime': prime, 'unity': unity, 'harmonic': harmonic}
+
 def test_harmonic_unity():
     """Test the harmonic unity principle."""
     print("Testing Harmonic Unity Principle...")
@@ -225,6 +297,629 @@ def test_prime_distribution():
     
     return gap_ok
 
+def test_prime_oracle():
+    """Test the sieve-backed prime oracle against trial division."""
+    print("\nTesting Prime Oracle...")
+    
+    def trial_division(n):
+        return n >= 2 and all(n % i for i in range(2, int(np.sqrt(n)) + 1))
+    
+    # Tiny segments force growth across many segment boundaries
+    oracle = PrimeOracle(limit=8, segment_size=64)
+    values = np.arange(-3, 5000)
+    expected = np.array([trial_division(int(n)) for n in values])
+    
+    membership_ok = all(oracle.is_prime(int(n)) == e for n, e in zip(values, expected))
+    array_ok = np.array_equal(oracle.is_prime_array(values), expected)
+    range_ok = oracle.primes_in_range(1000, 1100).tolist() == [n for n in range(1000, 1100) if trial_division(n)]
+    
+    print(f"  Scalar membership: {membership_ok}")
+    print(f"  Array membership: {array_ok}")
+    print(f"  Range query: {range_ok}")
+    print(f"  Sieved limit: {oracle.limit}")
+    
+    return membership_ok and array_ok and range_ok
+
+def test_kernel_broadcasting():
+    """Test that broadcast kernel evaluation matches point-by-point evaluation."""
+    print("\nTesting Kernel Broadcasting...")
+    
+    ks = np.array([1, 2, 3, 5, 8, 13])
+    scales = np.arange(-3, 4)
+    
+    # Whole (k, s1, s2) grid in one call, written into a preallocated buffer
+    grid = np.empty((len(ks), len(scales), len(scales)))
+    cross_scale_ratio_unity(ks[:, None, None], scales[None, :, None], scales[None, None, :], out=grid)
+    
+    pointwise = np.empty_like(grid)
+    for a, k in enumerate(ks):
+        for b, s1 in enumerate(scales):
+            for c, s2 in enumerate(scales):
+                ratio = k * PHI**(s1 - s2)
+                pointwise[a, b, c] = PHI**abs(s1 - s2) * (abs(np.cos(ratio * np.pi)) +
+                                                          abs(np.sin(ratio * np.pi)) +
+                                                          ratio % 1)
+    unity_ok = np.allclose(grid, pointwise, atol=1e-12)
+    
+    I = interference_factor(scales[:, None], scales[None, :])
+    interference_ok = all(np.isclose(I[i, j], interference_factor(int(s1), int(s2)))
+                          for i, s1 in enumerate(scales) for j, s2 in enumerate(scales))
+    
+    print(f"  Cross-scale unity grid matches pointwise: {unity_ok}")
+    print(f"  Interference grid matches pointwise: {interference_ok}")
+    
+    return unity_ok and interference_ok
+
+def test_cross_scale_interference():
+    """Test the O(S) cross-scale interference recurrence against the pairwise sum."""
+    print("\nTesting Cross-Scale Interference Contraction...")
+    
+    rng = np.random.default_rng(13)
+    fields = rng.normal(size=(21, 4, 4, 4, 3))
+    
+    pairwise = np.zeros_like(fields)
+    for s1 in range(len(fields)):
+        for s2 in range(len(fields)):
+            if s1 != s2:
+                weight = PHI**(-abs(s2 - s1)) * np.cos(2 * np.pi * (s2 - s1) / 13)
+                pairwise[s1] += weight * fields[s2]
+    
+    max_error = np.max(np.abs(cross_scale_interference(fields) - pairwise))
+    print(f"  Max deviation from pairwise sum: {max_error:.2e}")
+    
+    return max_error < 1e-12
+
+def test_cross_product():
+    """Test the buffer-reusing cross product against np.cross."""
+    print("\nTesting Cross Product Kernel...")
+    
+    rng = np.random.default_rng(3)
+    a = rng.normal(size=(4, 4, 4, 3))
+    out = np.empty_like(a)
+    scratch = np.empty(a.shape[:-1])
+    
+    matches = True
+    for b in (rng.normal(size=3), rng.normal(size=a.shape)):
+        result = cross(a, b, out=out, scratch=scratch)
+        matches &= result is out and np.array_equal(result, np.cross(a, b))
+    print(f"  Matches np.cross in the reused buffer: {matches}")
+    
+    return bool(matches)
+
+def test_array_file():
+    """Test the binary array file round trip and its memory-mapped loader."""
+    print("\nTesting Array File Round Trip...")
+    
+    arrays = {
+        'field': np.random.default_rng(5).normal(size=(4, 4, 4, 3)).astype(np.float32),
+        'phases': np.arange(1, 14),
+        'empty': np.zeros(0, dtype=np.int64)
+    }
+    metadata = {'step': 7, 'scale_range': [-2, 3]}
+    
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'state.ufrf')
+        write_array_file(path, arrays, metadata)
+        loaded, loaded_metadata = read_array_file(path)
+        
+        matches = loaded_metadata == metadata and all(
+            loaded[name].dtype == array.dtype and np.array_equal(loaded[name], array)
+            for name, array in arrays.items())
+        mapped = all(not loaded[name].flags.writeable for name in arrays)
+        leftovers = os.listdir(directory) == ['state.ufrf']
+        del loaded
+    
+    print(f"  Arrays and metadata round trip: {matches}")
+    print(f"  Loaded as read-only memory maps: {mapped}")
+    print(f"  No temporary files left behind: {leftovers}")
+    
+    return matches and mapped and leftovers
+
+def test_diagnostics_writer():
+    """Test the chunked diagnostics sink, including reads during a run and resuming."""
+    print("\nTesting Diagnostics Writer...")
+    
+    with tempfile.TemporaryDirectory() as directory:
+        writer = DiagnosticsWriter(directory, flush_every=2)
+        for i in range(5):
+            writer.append({'time': i / 10, 'scale_energies': [i, 2 * i, 3 * i]})
+        visible = len(read_diagnostics(directory)['time'])
+        writer.close()
+        data = read_diagnostics(directory)
+        complete = (np.allclose(data['time'], np.arange(5) / 10) and
+                    data['scale_energies'].shape == (5, 3) and writer.chunks == 3)
+        
+        # Resuming from a checkpoint taken after the first chunk drops the rest
+        resumed = DiagnosticsWriter(directory, flush_every=2, resume_chunks=1)
+        truncated = resumed.records == 2 and len(read_diagnostics(directory)['time']) == 2
+    
+    print(f"  Flushed chunks readable mid-run: {visible == 4}")
+    print(f"  All records read back: {complete}")
+    print(f"  Resume truncates to the checkpoint: {truncated}")
+    
+    return visible == 4 and complete and truncated
+
+def test_results_file():
+    """Test that typed results files keep types and load arrays memory-mapped."""
+    print("\nTesting Typed Results File...")
+    
+    results = {
+        'energy_history': np.linspace(1, 2, 500),
+        'scale_distribution': {0: 3, 1: 2},
+        'max_error': np.float32(1e-7),
+        'valid': True,
+        'range': (2, 2001),
+        'shape': (np.int64(4), 0.5, 'x'),
+        'intersections': [{'spiral_type': 'golden', 'candidate': 7, 'resonance_score': 0.5},
+                          {'spiral_type': 'krystal', 'candidate': 11, 'resonance_score': 0.25}]
+    }
+    
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'results.ufrf')
+        save_results(path, results)
+        loaded = load_results(path)
+        
+        arrays_ok = (np.array_equal(loaded['energy_history'], results['energy_history']) and
+                     not loaded['energy_history'].flags.writeable)
+        types_ok = (loaded['scale_distribution'] == {0: 3, 1: 2} and loaded['valid'] is True and
+                    loaded['max_error'].dtype == np.float32 and
+                    loaded['range'] == (2, 2001) and type(loaded['range']) is tuple and
+                    loaded['shape'] == (4, 0.5, 'x') and loaded['shape'][0].dtype == np.int64)
+        records_ok = (list(loaded['intersections']['spiral_type']) == ['golden', 'krystal'] and
+                      np.array_equal(loaded['intersections']['candidate'], [7, 11]))
+        del loaded
+    
+    print(f"  Arrays round trip memory-mapped: {arrays_ok}")
+    print(f"  Key, scalar and tuple types preserved: {types_ok}")
+    print(f"  Records stored column-wise: {records_ok}")
+    
+    return arrays_ok and types_ok and records_ok
+
+def test_workspace_reuse():
+    """Test that time steps stop allocating field buffers after one 13-cycle."""
+    print("\nTesting Workspace Buffer Reuse...")
+    
+    stable = {}
+    for contiguous_fields in (False, True):
+        ufrf = InfiniteRecursiveUFRF(N=8, scale_range=(-2, 3), contiguous_fields=contiguous_fields)
+        for _ in range(13):
+            ufrf.time_step(1/100)
+        allocations = ufrf.workspace.allocations
+        requests = ufrf.workspace.requests
+        for _ in range(26):
+            ufrf.time_step(1/100)
+        stable[contiguous_fields] = (ufrf.workspace.allocations == allocations and
+                                     ufrf.workspace.requests > requests)
+        print(f"  No new buffers after a 13-cycle (contiguous_fields={contiguous_fields}): "
+              f"{stable[contiguous_fields]} ({allocations} buffers)")
+    
+    return all(stable.values())
+
+class UncachedDerivedFields(DerivedFieldCache):
+    """DerivedFieldCache that recomputes every quantity on every request."""
+    
+    def _get(self, scale, u, name, compute):
+        self.computed[name] += 1
+        return compute()
+
+def test_transfer_invalidates_cache():
+    """Test that a 13-cycle transfer drops the receiving scale's cached quantities."""
+    print("\nTesting Derived Field Cache After Transfers...")
+    
+    forces = []
+    for derived_fields in (DerivedFieldCache, UncachedDerivedFields):
+        ufrf = InfiniteRecursiveUFRF(N=8, scale_range=(-2, 3))
+        ufrf.derived_fields = derived_fields(ufrf)
+        ufrf.phase_cycles = {scale: 11 for scale in ufrf.scale_range}
+        # Cache every scale's vorticity and energy before the transfers
+        ufrf.compute_max_vorticity()
+        ufrf.compute_total_energy()
+        forces.append(ufrf.compute_total_ufrf_force().copy())
+        
+        if derived_fields is DerivedFieldCache:
+            # Every scale but the first has received a transfer
+            u = ufrf.scale_systems[1]['velocity_field']
+            recomputed = (np.allclose(ufrf.derived_fields.vorticity(1, u), ufrf.compute_vorticity(u)) and
+                          ufrf.derived_fields.energy(1, u) == field_energy(u) and
+                          ufrf.derived_fields.invalidations >= len(ufrf.scale_range) - 1)
+    
+    same_force = np.array_equal(forces[0], forces[1])
+    
+    print(f"  Receiving scale's vorticity and energy recomputed: {recomputed}")
+    print(f"  Total force identical with the cache on and off: {same_force}")
+    
+    return recomputed and same_force
+
+def test_single_precision():
+    """Test that float32 mode reaches every field buffer and records drift."""
+    print("\nTesting Single-Precision Mode...")
+    
+    ufrf = InfiniteRecursiveUFRF(N=8, scale_range=(-2, 3), precision='float32', drift_check_interval=5)
+    for _ in range(10):
+        ufrf.time_step(1/100)
+    
+    u = ufrf.scale_systems[0]['velocity_field']
+    fields_ok = all(ufrf.scale_systems[scale]['velocity_field'].dtype == np.float32
+                    for scale in ufrf.scale_range)
+    buffers_ok = {buffer.dtype for buffer in ufrf.workspace.buffers.values()} <= {np.dtype(np.float32),
+                                                                                np.dtype(np.complex64)}
+    spectral_ok = (ufrf.spectral.diffusion_factor(1/100, 1/100).dtype == np.float32 and
+                   ufrf.spectral.forward(u).dtype == np.complex64 and
+                   ufrf.compute_vorticity(u).dtype == np.float32)
+    
+    monitor = ufrf.precision_monitor
+    drifts = [[record['energy_drift'], record['max_vorticity_drift']] for record in monitor.history]
+    monitor_ok = (monitor.reference.dtype == np.float64 and monitor.twin.dtype == np.float32 and
+                  [record['step'] for record in monitor.history] == [5, 10] and
+                  bool(np.all(np.isfinite(drifts))))
+    
+    print(f"  Velocity fields stored as float32: {fields_ok}")
+    print(f"  Workspace buffers float32/complex64: {buffers_ok}")
+    print(f"  Spectra and diffusion factors single precision: {spectral_ok}")
+    print(f"  Drift against the float64 shadow recorded: {monitor_ok} (max {np.max(drifts):.1e})")
+    
+    return fields_ok and buffers_ok and spectral_ok and monitor_ok
+
+def test_prime_force_aggregation():
+    """Test aggregated prime-center forces against the exact per-center sum."""
+    print("\nTesting Prime-Center Force Aggregation...")
+    
+    def make_ufrf(**kwargs):
+        ufrf = InfiniteRecursiveUFRF(N=8, scale_range=(-2, 3), **kwargs)
+        # Dynamic centers spread over twelve scale levels
+        for i, prime in enumerate(get_primes_up_to(400)[12:52]):
+            ufrf.register_dynamic_prime(prime, i % 12 - 3)
+        return ufrf
+    
+    aggregated = make_ufrf(prime_force_sources=3)
+    exact = make_ufrf()
+    
+    # The error bound is relative to sum |v| over the sources, per unit |omega|
+    max_error = 0.0
+    within_budget = True
+    for scale in aggregated.scale_range:
+        u = aggregated.scale_systems[scale]['velocity_field']
+        error = np.linalg.norm(aggregated.compute_prime_center_forces(u, scale) -
+                               exact.compute_prime_center_forces(u, scale), axis=-1)
+        _, vectors = exact.prime_center_level_sources(scale)
+        omega_mag = np.linalg.norm(exact.compute_vorticity(u), axis=-1)
+        max_error = max(max_error, np.max(error / (omega_mag * np.linalg.norm(vectors, axis=1).sum())))
+        within_budget &= len(aggregated.aggregate_prime_center_sources(scale)[0]) <= 3
+    
+    stats = aggregated.prime_force_stats
+    bound_ok = 0 < max_error <= stats['max_error_bound']
+    budget_ok = within_budget and stats['sources'] <= 3 * stats['calls'] < stats['centers']
+    
+    print(f"  Max relative error {max_error:.2e} within bound {stats['max_error_bound']:.2e}: {bound_ok}")
+    print(f"  {stats['centers']} centers merged into at most 3 sources per scale: {budget_ok}")
+    
+    return bound_ok and budget_ok
+
+def test_checkpoint_resume():
+    """Test that a run resumed from a checkpoint matches an uninterrupted run."""
+    print("\nTesting Checkpoint Resume...")
+    
+    def make_ufrf(**kwargs):
+        ufrf = InfiniteRecursiveUFRF(N=8, scale_range=(-2, 3), **kwargs)
+        ufrf.register_dynamic_prime(37, 0)
+        return ufrf
+    
+    with tempfile.TemporaryDirectory() as directory:
+        reference = make_ufrf()
+        expected = reference.run_simulation(T=3.0, dt=1/100, flush_every=2,
+                                            diagnostics_dir=os.path.join(directory, 'reference'))
+        
+        # The finished run stands in for one interrupted after its step-150 checkpoint
+        checkpoint = os.path.join(directory, 'checkpoint.ufrf')
+        make_ufrf().run_simulation(T=3.0, dt=1/100, flush_every=2, checkpoint_every=150,
+                                   checkpoint_path=checkpoint,
+                                   diagnostics_dir=os.path.join(directory, 'resumed'))
+        resumed = InfiniteRecursiveUFRF(N=8, scale_range=(-2, 3))
+        result = resumed.run_simulation(T=3.0, dt=1/100, flush_every=2, resume_from=checkpoint)
+        
+        fields_ok = (all(np.array_equal(reference.scale_systems[scale]['velocity_field'],
+                                        resumed.scale_systems[scale]['velocity_field'])
+                         for scale in reference.scale_range) and
+                     reference.phase_cycles == resumed.phase_cycles and
+                     reference.dynamic_primes == resumed.dynamic_primes)
+        expected_diagnostics = read_diagnostics(os.path.join(directory, 'reference'))
+        resumed_diagnostics = read_diagnostics(os.path.join(directory, 'resumed'))
+        diagnostics_ok = (all(np.array_equal(expected[i], result[i]) for i in (0, 1, 3)) and
+                          all(np.array_equal(expected[2][scale], result[2][scale]) for scale in expected[2]) and
+                          len(result[0]) == 3 and expected_diagnostics.keys() == resumed_diagnostics.keys() and
+                          all(np.array_equal(expected_diagnostics[name], resumed_diagnostics[name])
+                              for name in expected_diagnostics))
+        
+        # A checkpoint only restores into an identically configured solver
+        mismatches_rejected = True
+        for kwargs in ({'N': 16, 'scale_range': (-2, 3)}, {'N': 8, 'scale_range': (-2, 4)},
+                       {'N': 8, 'scale_range': (-2, 3), 'precision': 'float32'}):
+            try:
+                InfiniteRecursiveUFRF(**kwargs).load_checkpoint(checkpoint)
+                mismatches_rejected = False
+            except ValueError:
+                pass
+    
+    print(f"  Resumed fields match the uninterrupted run: {fields_ok}")
+    print(f"  Resumed diagnostics match the uninterrupted run: {diagnostics_ok}")
+    print(f"  Mismatched solvers rejected: {mismatches_rejected}")
+    
+    return fields_ok and diagnostics_ok and mismatches_rejected
+
+def test_prediction_pool():
+    """Test that process-pool predictions match the serial path."""
+    print("\nTesting Parallel Prime Prediction...")
+    
+    runs = {}
+    for workers in (1, 2):
+        ufrf = InfiniteRecursiveUFRF(N=8, scale_range=(-2, 3), spiral_resolution=200)
+        # The second pass also pairs the dynamic centers the first one registered
+        predictions = [ufrf.predict_primes_multi_scale(n_primes=1000, workers=workers),
+                       ufrf.predict_primes_multi_scale(n_primes=1000, workers=workers, include_dynamic=True)]
+        runs[workers] = predictions, ufrf.prime_center_registry.columns()
+    
+    (serial, serial_registry), (parallel, parallel_registry) = runs[1], runs[2]
+    predictions_ok = serial == parallel and len(serial[0]) > 0
+    registry_ok = (serial_registry.keys() == parallel_registry.keys() and
+                   all(np.array_equal(serial_registry[name], parallel_registry[name])
+                       for name in serial_registry) and
+                   np.any(serial_registry['type_code'] == PrimeCenterRegistry.TYPES.index('dynamic_prime')))
+    
+    print(f"  Predictions identical with workers=2: {predictions_ok}")
+    print(f"  Prime centers registered in the same order: {registry_ok}")
+    
+    return predictions_ok and registry_ok
+
+def test_incremental_prediction():
+    """Test that incremental prediction passes match full recomputations."""
+    print("\nTesting Incremental Prime Prediction...")
+    
+    matches = {}
+    for include_dynamic in (False, True):
+        incremental = InfiniteRecursiveUFRF(N=8, scale_range=(-2, 3), spiral_resolution=200)
+        full = InfiniteRecursiveUFRF(N=8, scale_range=(-2, 3), spiral_resolution=200)
+        matches[include_dynamic] = True
+        for new_center in (None, (37, 0), (41, 2), (43, 1)):
+            # New dynamic centers registered between passes
+            if new_center is not None:
+                incremental.register_dynamic_prime(*new_center)
+                full.register_dynamic_prime(*new_center)
+            predictions = incremental.predict_primes_multi_scale(
+                n_primes=1000, incremental=True, include_dynamic=include_dynamic)
+            expected = full.predict_primes_multi_scale(n_primes=1000, include_dynamic=include_dynamic)
+            matches[include_dynamic] &= (predictions == expected and
+                                         incremental.dynamic_primes == full.dynamic_primes)
+        skipped = incremental.pair_ledger.get_statistics()['skipped_pairs']
+        print(f"  Incremental passes match full passes (include_dynamic={include_dynamic}): "
+              f"{matches[include_dynamic]} ({skipped} pairs skipped)")
+    
+    return all(matches.values())
+
+def brute_force_crossings(spiral1, spiral2):
+    """(samples1, samples2) of every near-crossing, checking all sample pairs."""
+    mask = spiral_intersection_mask(np.abs(spiral1)[:, None], np.abs(spiral2)[None, :],
+                                    np.angle(spiral1)[:, None], np.angle(spiral2)[None, :])
+    return np.nonzero(mask)
+
+def brute_force_center_crossings(ufrf, prime1, prime2):
+    """All-crossings meetings of two prime centers, checking all sample pairs."""
+    registry = ufrf.prime_center_registry
+    scale1 = registry.scale_of(prime1)
+    scale2 = registry.scale_of(prime2)
+    mid_scale = (scale1 + scale2) / 2
+    meetings = []
+    for spiral_type in ['golden', 'krystal', 'log', 'prime', 'unity', 'harmonic']:
+        spiral1 = ufrf.create_prime_center_spiral(prime1, spiral_type)
+        spiral2 = ufrf.create_prime_center_spiral(prime2, spiral_type)
+        samples1, samples2 = brute_force_crossings(spiral1, spiral2)
+        candidates = np.unique(intersection_candidates(np.abs(spiral1[samples1]), np.abs(spiral2[samples2]),
+                                                       phi_power(mid_scale)))
+        creates_prime = ufrf.is_prime_via_geometric_resonance_batch(candidates, mid_scale)
+        meetings.extend((int(candidate), max(scale1, scale2) + 1)
+                        for candidate in candidates[creates_prime])
+    return meetings
+
+def test_candidate_scoring():
+    """Test the batch resonance scores against the per-candidate formulas."""
+    print("\nTesting Batch Candidate Scoring...")
+    
+    ufrf = InfiniteRecursiveUFRF(N=8, scale_range=(-2, 3))
+    candidates = np.arange(0, 2001)
+    
+    expected = [reference_multi_scale_resonance(candidate) for candidate in candidates.tolist()]
+    resonance_ok = np.allclose(ufrf.calculate_multi_scale_resonance_batch(candidates, block_size=256),
+                               expected, rtol=1e-12, atol=1e-12)
+    
+    geometric_ok = True
+    for scale in (-3, -1, 0, 1/2, 2, 5):
+        expected = [reference_geometric_resonance(candidate, scale) for candidate in candidates.tolist()]
+        geometric_ok &= np.array_equal(ufrf.is_prime_via_geometric_resonance_batch(candidates, scale), expected)
+    
+    print(f"  Multi-scale resonance matches per-candidate sums: {resonance_ok}")
+    print(f"  Geometric resonance masks match per-candidate checks: {geometric_ok}")
+    
+    return resonance_ok and geometric_ok
+
+def test_validation_criteria():
+    """Test the batch prime criteria and assess_range against per-candidate checks."""
+    print("\nTesting Batch Validation Criteria...")
+    
+    ufrf = InfiniteRecursiveUFRF(N=8, scale_range=(-2, 3))
+    diagnostic = UFRFPrimeDiagnostic()
+    candidates = np.arange(0, 2001)
+    values = candidates.tolist()
+    
+    shared_ok = True
+    for validator in (ufrf, diagnostic):
+        shared_ok &= (np.array_equal(validator.has_direct_angle_to_source_batch(candidates),
+                                     [reference_direct_angle_to_source(c) for c in values]) and
+                      np.array_equal(validator.check_multi_scale_harmonic_unity_batch(candidates),
+                                     [reference_multi_scale_harmonic_unity(c) for c in values]))
+    
+    scale_ok = True
+    for scale in range(-5, 6):
+        scale_ok &= (np.array_equal(ufrf.check_prime_at_scale_batch(candidates, scale),
+                                    [reference_check_prime_at_scale(c, scale) for c in values]) and
+                     np.array_equal(diagnostic.check_prime_at_scale_batch(candidates, scale),
+                                    [reference_diagnostic_prime_at_scale(c, scale) for c in values]) and
+                     np.allclose(ufrf.scale_unity_deviation_batch(candidates, scale),
+                                 [reference_unity_deviation(c, scale) for c in values], rtol=1e-9, atol=1e-9))
+    
+    intersection_ok = True
+    for scale1, scale2 in ((-4, -2), (-3, -1), (-1, 5), (0, 1)):
+        intersection_ok &= (
+            np.array_equal(ufrf.is_prime_via_scale_intersection_batch(candidates, scale1, scale2),
+                           [reference_scale_intersection(c, scale1, scale2, reference_check_prime_at_scale, 1/3)
+                            for c in values]) and
+            np.array_equal(diagnostic.is_prime_via_scale_intersection_batch(candidates, scale1, scale2),
+                           [reference_scale_intersection(c, scale1, scale2, reference_diagnostic_prime_at_scale, 1/10)
+                            for c in values]))
+    
+    # Confusion matrix and criteria failures counted one candidate at a time
+    confusion = {'true_positive': 0, 'false_positive': 0, 'false_negative': 0, 'true_negative': 0}
+    failures = {'cross_scale': 0, 'direct_angle': 0, 'harmonic_unity': 0, 'cycle_position': 0}
+    scales = list(diagnostic.scale_range)
+    scale_pairs = [(scale1, scale2) for i, scale1 in enumerate(scales) for scale2 in scales[i+1:]]
+    for candidate in range(2, 2001):
+        prime_at = {scale: reference_diagnostic_prime_at_scale(candidate, scale) for scale in scales}
+        deviation = {scale: reference_unity_deviation(candidate, scale) for scale in scales}
+        passes = sum(prime_at[scale1] and prime_at[scale2] and deviation[scale1] + deviation[scale2] < 1/10
+                     for scale1, scale2 in scale_pairs)
+        criteria = {'cross_scale': passes / len(scale_pairs) > 0.5,
+                    'direct_angle': reference_direct_angle_to_source(candidate),
+                    'harmonic_unity': reference_multi_scale_harmonic_unity(candidate),
+                    'cycle_position': candidate % 13 in [2, 3, 5, 7, 11, 0]}
+        predicted = all(criteria.values())
+        actual = reference_is_prime(candidate)
+        confusion[('true_' if predicted == actual else 'false_') + ('positive' if predicted else 'negative')] += 1
+        if actual:
+            for name, passed in criteria.items():
+                failures[name] += not passed
+    
+    assessment = diagnostic.assess_range(2001, block_size=256)
+    assessment_ok = (assessment['range'] == (2, 2001) and assessment['confusion'] == confusion and
+                     assessment['criteria_failures'] == failures)
+    
+    print(f"  Direct angle and multi-scale unity masks match: {shared_ok}")
+    print(f"  Per-scale checks and unity deviations match: {scale_ok}")
+    print(f"  Scale intersection masks match: {intersection_ok}")
+    print(f"  assess_range matches a per-candidate confusion matrix: {assessment_ok}")
+    
+    return shared_ok and scale_ok and intersection_ok and assessment_ok
+
+def test_modulated_spirals():
+    """Test the vectorized spiral builders against the per-point formulas."""
+    print("\nTesting Vectorized Spiral Builders...")
+    
+    ufrf = InfiniteRecursiveUFRF(N=8, scale_range=(-2, 3))
+    matches = {'prime': True, 'unity': True, 'harmonic': True}
+    modulated = 0
+    for scale in range(-3, 9):
+        expected = reference_modulated_spirals(scale, ufrf.spiral_resolution)
+        for spiral_type in matches:
+            spiral = getattr(ufrf, f'create_{spiral_type}_spiral')(scale)
+            matches[spiral_type] &= np.allclose(spiral, expected[spiral_type], rtol=1e-12, atol=1e-12)
+        # Samples the prime-residue lookup actually modulates
+        unmodulated = PHI ** scale * np.exp(1j * ufrf.spiral_parameter() * np.pi)
+        modulated += np.count_nonzero(expected['prime'] != unmodulated)
+    
+    for spiral_type, spiral_ok in matches.items():
+        print(f"  {spiral_type.capitalize()} spiral matches point-by-point modulation: {spiral_ok}")
+    print(f"  Prime spiral samples modulated: {modulated}")
+    
+    return all(matches.values()) and modulated > 0
+
+def test_resumable_prediction():
+    """Test that a chunked prediction stopped and resumed matches a single pass."""
+    print("\nTesting Resumable Prime Prediction...")
+    
+    def make_ufrf(sieve_blocks):
+        ufrf = InfiniteRecursiveUFRF(N=8, scale_range=(-2, 3))
+        ufrf.register_dynamic_prime(37, 0)
+        ufrf.register_dynamic_prime(1009, 1)
+        if sieve_blocks:
+            # The geometric criteria accept almost no integers; a sieve-backed
+            # block validator gives every chunk values, scores and sources
+            ufrf.predict_primes_in_block = lambda candidates, scale_pairs: candidates[is_prime_array(candidates)]
+        return ufrf
+    
+    def same_chunks(chunks1, chunks2):
+        return len(chunks1) == len(chunks2) and all(
+            chunk1.keys() == chunk2.keys() and
+            all(np.array_equal(chunk1[name], chunk2[name]) for name in chunk1)
+            for chunk1, chunk2 in zip(chunks1, chunks2))
+    
+    resumed_ok = True
+    for sieve_blocks in (False, True):
+        single_pass = list(make_ufrf(sieve_blocks).predict_primes(2, 5000, chunk=700))
+        
+        # Stop after three chunks, then resume in a new solver from the last 'stop'
+        stream = make_ufrf(sieve_blocks).predict_primes(2, 5000, chunk=700)
+        chunks = [next(stream) for _ in range(3)]
+        stream.close()
+        chunks += list(make_ufrf(sieve_blocks).predict_primes(chunks[-1]['stop'], 5000, chunk=700))
+        
+        values = np.concatenate([chunk['values'] for chunk in chunks])
+        resumed_ok &= (same_chunks(chunks, single_pass) and np.all(np.diff(values) > 0) and
+                       chunks[-1]['stop'] == 5000)
+        if sieve_blocks:
+            sources = np.concatenate([chunk['sources'] for chunk in chunks])
+            resumed_ok &= (np.array_equal(values, get_primes_up_to(4999)) and
+                           set(values[sources == 'prime_center_intersection'].tolist()) == {37, 1009})
+        print(f"  Resumed run matches a single pass ({len(values)} predictions): {resumed_ok}")
+    
+    return resumed_ok
+
+def test_spiral_crossings():
+    """Test the KD-tree crossing search against a brute-force pairwise check."""
+    print("\nTesting Spiral Crossing Search...")
+    
+    ufrf = InfiniteRecursiveUFRF(N=8, scale_range=(-2, 3), spiral_resolution=60)
+    ufrf.register_dynamic_prime(37, 0)
+    spirals = [ufrf.create_golden_spiral(0), ufrf.create_krystal_spiral(1), ufrf.create_log_spiral(2)]
+    
+    # Cross-index join, and the self-join of several spirals indexed together
+    index_ok = True
+    for spiral1 in spirals:
+        for spiral2 in spirals:
+            _, samples1, _, samples2 = SpiralIntersectionIndex(spiral1).query(SpiralIntersectionIndex(spiral2))
+            expected1, expected2 = brute_force_crossings(spiral1, spiral2)
+            index_ok &= np.array_equal(samples1, expected1) and np.array_equal(samples2, expected2)
+    
+    index = SpiralIntersectionIndex(np.stack(spirals))
+    found = set(zip(*(indices.tolist() for indices in index.query())))
+    expected = set()
+    for i, spiral1 in enumerate(spirals):
+        for j in range(i, len(spirals)):
+            for sample1, sample2 in zip(*brute_force_crossings(spiral1, spirals[j])):
+                if i < j or sample1 <= sample2:
+                    expected.add((i, int(sample1), j, int(sample2)))
+    self_join_ok = found == expected and len(found) > 0
+    
+    samples1, samples2, candidates = ufrf.find_spiral_crossings(spirals[0], spirals[1], 0.5)
+    expected1, expected2 = brute_force_crossings(spirals[0], spirals[1])
+    crossings_ok = (np.array_equal(samples1, expected1) and np.array_equal(samples2, expected2) and
+                    np.array_equal(candidates, intersection_candidates(
+                        np.abs(spirals[0][expected1]), np.abs(spirals[1][expected2]), phi_power(0.5))))
+    
+    # Batched search over every center pair, including the dynamic center
+    batch = ufrf.find_center_crossing_primes_batch()
+    primes = ufrf.prime_center_registry.spiral_primes().tolist()
+    expected_batch = {}
+    for i, prime1 in enumerate(primes):
+        for prime2 in primes[i + 1:]:
+            meetings = brute_force_center_crossings(ufrf, prime1, prime2)
+            if meetings:
+                expected_batch[(prime1, prime2)] = meetings
+    batch_ok = batch == expected_batch and len(batch) > 0
+    
+    print(f"  Index join matches brute force: {index_ok}")
+    print(f"  Batched self-join matches brute force: {self_join_ok}")
+    print(f"  find_spiral_crossings matches brute force: {crossings_ok}")
+    print(f"  Batched center crossings match brute force ({len(batch)} pairs): {batch_ok}")
+    
+    return index_ok and self_join_ok and crossings_ok and batch_ok
+
 def main():
     """Run all core UFRF tests."""
     print("=" * 60)
@@ -238,6 +933,25 @@ def main():
         ("S-Matrix Properties", test_s_matrix_properties),
         ("Interference Factor", test_interference_factor),
         ("Prime Distribution", test_prime_distribution),
+        ("Prime Oracle", test_prime_oracle),
+        ("Kernel Broadcasting", test_kernel_broadcasting),
+        ("Cross-Scale Interference", test_cross_scale_interference),
+        ("Cross Product", test_cross_product),
+        ("Array File", test_array_file),
+        ("Diagnostics Writer", test_diagnostics_writer),
+        ("Results File", test_results_file),
+        ("Workspace Reuse", test_workspace_reuse),
+        ("Checkpoint Resume", test_checkpoint_resume),
+        ("Transfer Cache Invalidation", test_transfer_invalidates_cache),
+        ("Single Precision", test_single_precision),
+        ("Prime Force Aggregation", test_prime_force_aggregation),
+        ("Candidate Scoring", test_candidate_scoring),
+        ("Validation Criteria", test_validation_criteria),
+        ("Modulated Spirals", test_modulated_spirals),
+        ("Resumable Prediction", test_resumable_prediction),
+        ("Spiral Crossings", test_spiral_crossings),
+        ("Parallel Prediction", test_prediction_pool),
+        ("Incremental Prediction", test_incremental_prediction),
     ]
     
     results = {}
@@ -19,58 +19,17 @@ from scipy.linalg import expm
 import time
 from dataclasses import dataclass
 from typing import List, Tuple, Dict, Optional
-import json
 import warnings
 warnings.filterwarnings('ignore')
 
-# Golden ratio constant
-PHI = (1 + np.sqrt(5)) / 2
+from ufrf_io import save_results
+from ufrf_primes import get_primes_up_to
+from ufrf_kernels import PHI, phi_power, harmonic_unity, cross_scale_unity
 
 # ==============================================================================
 # Core Mathematical Functions
 # ==============================================================================
 
-def is_prime(n: int) -> bool:
-    """Check if a number is prime."""
-    if n < 2:
-        return False
-    for i in range(2, int(np.sqrt(n)) + 1):
-        if n % i == 0:
-            return False
-    return True
-
-def get_primes_up_to(n: int) -> List[int]:
-    """Get all prime numbers up to n."""
-    return [i for i in range(2, n + 1) if is_prime(i)]
-
-def harmonic_unity(n: float, p: int) -> float:
-    """
-    Calculate harmonic unity value U_p(n).
-    U_p(n) = |cos(nπ/p)| + |sin(nπ/p)| + (n/p mod 1)
-    """
-    cos_term = abs(np.cos(n * np.pi / p))
-    sin_term = abs(np.sin(n * np.pi / p))
-    mod_term = (n / p) % 1
-    return cos_term + sin_term + mod_term
-
-def cross_scale_unity(n: float, p: int, scale_diff: int) -> float:
-    """
-    Calculate cross-scale unity value.
-    U_cross = φ^|scale_diff| * U_p(n)
-    """
-    within_scale = harmonic_unity(n, p)
-    return PHI**abs(scale_diff) * within_scale
-
-def interference_factor(s1: int, s2: int) -> complex:
-    """
-    Calculate cross-scale interference factor I(s1, s2).
-    I(s1,s2) = φ^|s1-s2| * cos(2π(s1-s2)/13) * exp(i*π(s1+s2)/7)
-    """
-    scale_diff = abs(s1 - s2)
-    phase_13 = np.cos(2 * np.pi * (s1 - s2) / 13)
-    phase_7 = np.exp(1j * np.pi * (s1 + s2) / 7)
-    return PHI**scale_diff * phase_13 * phase_7
-
 def compute_s_matrix(scales: List[int]) -> np.ndarray:
     """
     Compute the Scale Synchronization Matrix.
@@ -120,9 +79,12 @@ class MultiScaleField:
     """Manages the infinite recursive scale structure."""
     
     def __init__(self, base_grid: int = 64, base_domain: float = 2*np.pi,
-                 scale_range: Tuple[int, int] = (-2, 2)):
+                 scale_range: Tuple[int, int] = (-2, 2), precision: str = 'float64'):
+        if precision not in ('float64', 'float32'):
+            raise ValueError("precision must be 'float64' or 'float32'")
         self.base_grid = base_grid
         self.base_domain = base_domain
+        self.dtype = np.dtype(precision)  # Storage precision of u and omega
         self.scale_range = range(scale_range[0], scale_range[1] + 1)
         self.scales = {}
         self.primes = get_primes_up_to(100)
@@ -144,7 +106,7 @@ class MultiScaleField:
         
         # Initialize velocity field (Taylor-Green vortex scaled)
         scale_factor = PHI**scale
-        u = np.zeros((grid_size, grid_size, grid_size, 3))
+        u = np.zeros((grid_size, grid_size, grid_size, 3), dtype=self.dtype)
         u[..., 0] = scale_factor * np.sin(X) * np.cos(Y) * np.cos(Z)
         u[..., 1] = -scale_factor * np.cos(X) * np.sin(Y) * np.cos(Z)
         u[..., 2] = 0
@@ -153,7 +115,7 @@ class MultiScaleField:
         omega = self._compute_vorticity(u, self.base_domain / grid_size)
         
         # Compute energy
-        energy = 0.5 * np.sum(u**2) * (self.base_domain / grid_size)**3
+        energy = 0.5 * float(np.sum(u**2, dtype=np.float64)) * (self.base_domain / grid_size)**3
         
         return ScaleLevel(
             scale=scale,
@@ -484,6 +446,32 @@ class UFRFRegularization:
 # Validation Tests
 # ==============================================================================
 
+@dataclass
+class RunningErrorStats:
+    """Streaming mean/max/count of absolute errors (constant memory)."""
+    tolerance: float = 1e-10
+    count: int = 0
+    total: float = 0.0
+    max_error: float = 0.0
+    within_tolerance: int = 0
+    
+    def update(self, errors: np.ndarray):
+        """Fold a chunk of errors into the running statistics."""
+        if errors.size == 0:
+            return
+        self.count += errors.size
+        self.total += float(np.sum(errors))
+        self.max_error = max(self.max_error, float(np.max(errors)))
+        self.within_tolerance += int(np.count_nonzero(errors < self.tolerance))
+    
+    @property
+    def mean_error(self) -> float:
+        return self.total / self.count if self.count else 0.0
+    
+    @property
+    def success_rate(self) -> float:
+        return self.within_tolerance / self.count if self.count else 0
+
 class ValidationSuite:
     """Comprehensive validation tests for UFRF theory."""
     
@@ -491,8 +479,19 @@ class ValidationSuite:
         self.field = multi_scale_field
         self.results = {}
     
-    def test_harmonic_unity(self, num_tests: int = 1000) -> Dict[str, float]:
-        """Test harmonic unity rule within and across scales."""
+    def test_harmonic_unity(self, num_tests: int = 1000, bulk: bool = False,
+                            seed: Optional[int] = None,
+                            chunk_size: int = 1_000_000) -> Dict[str, float]:
+        """
+        Test harmonic unity rule within and across scales.
+        With bulk=True samples are drawn chunk_size at a time from a seeded
+        np.random.Generator and reduced into running statistics, so memory is
+        bounded by the chunk size and a given seed reproduces exactly.
+        Both modes return the same keys.
+        """
+        if bulk:
+            return self._test_harmonic_unity_bulk(num_tests, seed, chunk_size)
+        
         results = {
             'within_scale_accuracy': [],
             'cross_scale_accuracy': [],
@@ -527,7 +526,61 @@ class ValidationSuite:
             'cross_scale_mean_error': np.mean(results['cross_scale_accuracy']),
             'cross_scale_max_error': np.max(results['cross_scale_accuracy']),
             'multi_context_success': np.sum(np.array(results['multi_context_resonance']) < 1e-10) 
-                                    / len(results['multi_context_resonance']) if results['multi_context_resonance'] else 0
+                                    / len(results['multi_context_resonance']) if results['multi_context_resonance'] else 0,
+            'num_tests': num_tests
+        }
+    
+    def _test_harmonic_unity_bulk(self, num_tests: int, seed: Optional[int],
+                                  chunk_size: int) -> Dict[str, float]:
+        """Vectorized, chunked form of test_harmonic_unity."""
+        rng = np.random.default_rng(seed)
+        primes = np.asarray(self.field.primes[:20])
+        chunk_size = max(1, min(chunk_size, num_tests))
+        
+        within_scale = RunningErrorStats()
+        cross_scale = RunningErrorStats()
+        multi_context = RunningErrorStats()
+        
+        # Multi-context resonance of n = 30 in contexts 2, 3, 5 is fixed
+        multi_context_errors = np.abs(harmonic_unity(30, np.array([2, 3, 5])) - 1.0)
+        
+        # Scratch buffers reused by every chunk
+        unity = np.empty(chunk_size)
+        cross_unity = np.empty(chunk_size)
+        
+        remaining = num_tests
+        while remaining > 0:
+            m = min(chunk_size, remaining)
+            remaining -= m
+            
+            # Random primes, values and scale differences for the whole chunk
+            p = rng.choice(primes, size=m)
+            k = rng.integers(1, 100, size=m)
+            scale_diff = rng.integers(-2, 3, size=m)
+            n = k * p
+            
+            # Test within scale
+            u = harmonic_unity(n, p, out=unity[:m])
+            u -= 1.0
+            within_scale.update(np.abs(u, out=u))
+            
+            # Test cross-scale
+            c = cross_scale_unity(n, p, scale_diff, out=cross_unity[:m])
+            c -= phi_power(np.abs(scale_diff))
+            cross_scale.update(np.abs(c, out=c))
+            
+            # Test multi-context resonance
+            hits = int(np.count_nonzero(n == 30))
+            if hits:
+                multi_context.update(np.tile(multi_context_errors, hits))
+        
+        return {
+            'within_scale_mean_error': within_scale.mean_error,
+            'within_scale_max_error': within_scale.max_error,
+            'cross_scale_mean_error': cross_scale.mean_error,
+            'cross_scale_max_error': cross_scale.max_error,
+            'multi_context_success': multi_context.success_rate,
+            'num_tests': within_scale.count
         }
     
     def test_scale_invariance(self) -> Dict[str, float]:
@@ -661,7 +714,7 @@ class UFRFVisualizer:
         
         # Within scale unity
         n_values = np.arange(0, 10*p, 0.1)
-        unity_values = [harmonic_unity(n, p) for n in n_values]
+        unity_values = harmonic_unity(n_values, p)
         
         ax1.plot(n_values/p, unity_values, 'b-', linewidth=2)
         ax1.axhline(y=1, color='r', linestyle='--', label='Unity')
@@ -918,17 +971,16 @@ def run_complete_validation():
     
     # Save results
     print("\nSaving results...")
-    with open('ufrf_validation_results.json', 'w') as f:
-        # Convert numpy arrays to lists for JSON serialization
-        json_results = {
-            'summary': results['summary'],
-            'harmonic_unity': results['harmonic_unity'],
-            's_matrix': {k: bool(v) for k, v in results['s_matrix'].items()},
-            'energy_history': results['energy_conservation']['energy_history'][:20]  # First 20 points
-        }
-        json.dump(json_results, f, indent=2)
-    
-    print("\nValidation complete! Results saved to 'ufrf_validation_results.json'")
+    # Typed results file: arrays stay binary, so the full energy history fits
+    save_results('ufrf_validation_results.ufrf', {
+        'summary': results['summary'],
+        'harmonic_unity': results['harmonic_unity'],
+        's_matrix': results['s_matrix'],
+        'energy_history': np.asarray(results['energy_conservation']['energy_history']),
+        'phase_history': np.asarray(results['energy_conservation']['phase_history'])
+    })
+    
+    print("\nValidation complete! Results saved to 'ufrf_validation_results.ufrf'")
     
     return field, regularization, results, figs
 
@@ -0,0 +1,296 @@
+"""
+UFRF Array Files
+================
+Single-file binary container for named NumPy arrays plus a small JSON
+metadata header, used for simulation checkpoints and typed result files,
+and an append-only chunked sink for diagnostics recorded while a
+simulation runs.
+
+Layout: an 8-byte magic, the header length as a little-endian uint64, the
+JSON header, then every array's raw C-order bytes, each starting on a
+64-byte boundary. Files are written to a temporary name and renamed into
+place, so readers never see a partial file, and arrays are read back as
+zero-copy views of one read-only memory map.
+"""
+
+import glob
+import json
+import os
+import numpy as np
+from numbers import Number
+from typing import Any, Dict, Optional, Tuple, Union
+
+ArrayLike = Union[float, int, np.ndarray]
+
+MAGIC = b'UFRFARR1'
+ALIGNMENT = 64
+
+
+def _aligned(offset: int) -> int:
+    """Round offset up to the next ALIGNMENT boundary."""
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def write_array_file(path: str, arrays: Dict[str, np.ndarray],
+                     metadata: Optional[dict] = None):
+    """
+    Atomically write named arrays and JSON-serializable metadata to path.
+    The file is fsynced under a temporary name before replacing path.
+    """
+    arrays = {name: np.asarray(array) for name, array in arrays.items()}
+
+    # Array offsets are relative to the end of the header block
+    entries = {}
+    offset = 0
+    for name, array in arrays.items():
+        entries[name] = {'dtype': array.dtype.str, 'shape': list(array.shape), 'offset': offset}
+        offset = _aligned(offset + array.nbytes)
+
+    header = json.dumps({'metadata': metadata or {}, 'arrays': entries}).encode()
+    data_start = _aligned(len(MAGIC) + 8 + len(header))
+    header += b' ' * (data_start - len(MAGIC) - 8 - len(header))
+
+    def write(f):
+        f.write(MAGIC)
+        f.write(np.uint64(len(header)).tobytes())
+        f.write(header)
+        for name, array in arrays.items():
+            f.seek(data_start + entries[name]['offset'])
+            f.write(np.ascontiguousarray(array).data)
+        f.truncate(data_start + offset)
+
+    _write_atomically(path, write)
+
+
+def read_array_file(path: str, mmap: bool = True) -> Tuple[Dict[str, np.ndarray], dict]:
+    """
+    Read (arrays, metadata) from a file written by write_array_file.
+    With mmap=True the arrays are read-only views of a memory map of the
+    file; otherwise they are loaded into memory.
+    """
+    with open(path, 'rb') as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a UFRF array file")
+        header_length = int(np.frombuffer(f.read(8), dtype='<u8')[0])
+        header = json.loads(f.read(header_length))
+    data_start = len(MAGIC) + 8 + header_length
+
+    if mmap and os.path.getsize(path) > data_start:
+        buffer = np.memmap(path, dtype=np.uint8, mode='r')
+    else:
+        with open(path, 'rb') as f:
+            buffer = np.frombuffer(f.read(), dtype=np.uint8)
+
+    arrays = {}
+    for name, entry in header['arrays'].items():
+        dtype = np.dtype(entry['dtype'])
+        shape = tuple(entry['shape'])
+        start = data_start + entry['offset']
+        count = int(np.prod(shape))
+        arrays[name] = np.asarray(buffer[start:start + count * dtype.itemsize]).view(dtype).reshape(shape)
+    return arrays, header['metadata']
+
+
+def _write_atomically(path: str, write):
+    """Call write(f) on a temporary file, fsync it and rename it to path."""
+    tmp_path = f'{path}.tmp-{os.getpid()}'
+    try:
+        with open(tmp_path, 'wb') as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _chunk_paths(directory: str):
+    """Diagnostics chunk files in directory, in record order."""
+    return sorted(glob.glob(os.path.join(directory, 'chunk_*.npz')))
+
+
+def _chunk_length(path: str) -> int:
+    """Number of records in a diagnostics chunk."""
+    with np.load(path) as chunk:
+        return len(chunk[chunk.files[0]]) if chunk.files else 0
+
+
+class DiagnosticsWriter:
+    """
+    Append-only columnar sink for diagnostic records.
+
+    Each record maps column names to scalars or fixed-shape arrays. Records
+    are buffered in preallocated per-column arrays and written every
+    `flush_every` records as one numbered NPZ chunk, so memory stays
+    constant however long the run. Chunks appear atomically, which lets
+    other processes read_diagnostics the directory while the run goes on.
+    """
+
+    def __init__(self, directory: str, flush_every: int = 64,
+                 resume_chunks: Optional[int] = None):
+        if flush_every <= 0:
+            raise ValueError("flush_every must be positive")
+        self.directory = directory
+        self.flush_every = flush_every
+        self.buffers = None  # column -> (flush_every, *shape) array
+        self.pending = 0
+        os.makedirs(directory, exist_ok=True)
+
+        # Start fresh, or keep only the chunks a checkpoint knows about
+        paths = _chunk_paths(directory)
+        self.chunks = 0 if resume_chunks is None else resume_chunks
+        if self.chunks > len(paths):
+            raise ValueError(f"{directory} has {len(paths)} diagnostics chunks, expected {self.chunks}")
+        for path in paths[self.chunks:]:
+            os.remove(path)
+        self.records = sum(_chunk_length(path) for path in paths[:self.chunks])
+
+    def append(self, record: Dict[str, ArrayLike]):
+        """Buffer one record, flushing when the buffer is full"""
+        if self.buffers is None:
+            self.buffers = {}
+            for name, value in record.items():
+                value = np.asarray(value)
+                self.buffers[name] = np.empty((self.flush_every,) + value.shape, dtype=value.dtype)
+        for name, buffer in self.buffers.items():
+            buffer[self.pending] = record[name]
+        self.pending += 1
+        self.records += 1
+        if self.pending == self.flush_every:
+            self.flush()
+
+    def flush(self):
+        """Write the buffered records as the next chunk"""
+        if self.pending == 0:
+            return
+        columns = {name: buffer[:self.pending] for name, buffer in self.buffers.items()}
+        path = os.path.join(self.directory, f'chunk_{self.chunks:06d}.npz')
+        _write_atomically(path, lambda f: np.savez(f, **columns))
+        self.chunks += 1
+        self.pending = 0
+
+    def close(self):
+        """Flush any buffered records"""
+        self.flush()
+
+
+def read_diagnostics(directory: str) -> Dict[str, np.ndarray]:
+    """Columns of every complete chunk in a DiagnosticsWriter directory"""
+    parts = {}
+    for path in _chunk_paths(directory):
+        with np.load(path) as chunk:
+            for name in chunk.files:
+                parts.setdefault(name, []).append(chunk[name])
+    return {name: np.concatenate(arrays) for name, arrays in parts.items()}
+
+
+# Tag of encoded values in a results header
+RESULTS_TAG = '__ufrf__'
+
+
+class _ResultsEncoder:
+    """Split a nested results structure into a JSON tree and named arrays."""
+
+    def __init__(self):
+        self.arrays = {}
+
+    def array(self, array: np.ndarray) -> dict:
+        name = f'a{len(self.arrays)}'
+        self.arrays[name] = array
+        return {RESULTS_TAG: 'array', 'name': name}
+
+    def encode(self, value: Any):
+        if value is None or isinstance(value, (bool, str)):
+            return value
+        if isinstance(value, np.generic):
+            return {RESULTS_TAG: 'scalar', 'dtype': value.dtype.str, 'value': value.item()}
+        if isinstance(value, (int, float)):
+            return value
+        if isinstance(value, np.ndarray):
+            return self.array(value)
+        if isinstance(value, tuple):
+            return {RESULTS_TAG: 'tuple', 'items': [self.encode(item) for item in value]}
+        if isinstance(value, list):
+            return self.encode_sequence(value)
+        if isinstance(value, (set, frozenset)):
+            return {RESULTS_TAG: 'set', 'items': [self.encode(item) for item in value]}
+        if isinstance(value, dict):
+            if all(isinstance(key, str) for key in value) and RESULTS_TAG not in value:
+                return {key: self.encode(item) for key, item in value.items()}
+            return {RESULTS_TAG: 'dict', 'items': [[self.encode(key), self.encode(item)]
+                                                    for key, item in value.items()]}
+        raise TypeError(f"Cannot store {type(value).__name__} in a results file")
+
+    def encode_sequence(self, value):
+        # Numeric lists become arrays, lists of same-keyed flat records become columns
+        if value and all(isinstance(item, Number) and not isinstance(item, (bool, np.bool_))
+                         for item in value):
+            array = np.asarray(value)
+            if array.dtype != object:
+                return self.array(array)
+        if value and all(isinstance(item, dict) for item in value):
+            keys = list(value[0])
+            if (all(isinstance(key, str) for key in keys) and
+                    all(list(item) == keys for item in value) and
+                    all(np.ndim(item[key]) == 0 and not isinstance(item[key], (dict, list, tuple))
+                        for item in value for key in keys)):
+                columns = {key: np.asarray([item[key] for item in value]) for key in keys}
+                if all(column.dtype != object for column in columns.values()):
+                    return {RESULTS_TAG: 'records',
+                            'columns': {key: self.array(column) for key, column in columns.items()}}
+        return [self.encode(item) for item in value]
+
+
+def _decode_results(value: Any, arrays: Dict[str, np.ndarray]):
+    """Rebuild a results structure from its JSON tree and arrays."""
+    if isinstance(value, list):
+        return [_decode_results(item, arrays) for item in value]
+    if not isinstance(value, dict):
+        return value
+
+    kind = value.get(RESULTS_TAG)
+    if kind is None:
+        return {key: _decode_results(item, arrays) for key, item in value.items()}
+    if kind == 'array':
+        return arrays[value['name']]
+    if kind == 'scalar':
+        return np.dtype(value['dtype']).type(value['value'])
+    if kind == 'records':
+        return {key: arrays[column['name']] for key, column in value['columns'].items()}
+    if kind == 'tuple':
+        return tuple(_decode_results(item, arrays) for item in value['items'])
+    if kind == 'set':
+        return {_decode_results(item, arrays) for item in value['items']}
+    if kind == 'dict':
+        return {_decode_results(key, arrays): _decode_results(item, arrays) for key, item in value['items']}
+    raise ValueError(f"Unknown results entry {kind!r}")
+
+
+def save_results(path: str, results: Any):
+    """
+    Atomically write a nested results structure (dicts, lists, tuples, sets,
+    Python and NumPy scalars, NumPy arrays) to a typed results file.
+
+    Arrays, numeric lists and lists of same-keyed flat records (stored
+    column by column) go into binary blobs; everything else, with NumPy
+    scalars keeping their dtype, dicts their key types and tuples staying
+    tuples, goes into the JSON header. Anything else raises TypeError
+    instead of being stringified.
+    """
+    encoder = _ResultsEncoder()
+    tree = encoder.encode(results)
+    write_array_file(path, encoder.arrays, {'format': 'ufrf-results', 'version': 1, 'results': tree})
+
+
+def load_results(path: str, mmap: bool = True) -> Any:
+    """
+    Load a results file written by save_results. Arrays (and numeric
+    lists) come back as read-only zero-copy views of a memory map of the
+    file, and record lists as {column: array} dicts.
+    """
+    arrays, metadata = read_array_file(path, mmap=mmap)
+    if metadata.get('format') != 'ufrf-results':
+        raise ValueError(f"{path} is not a UFRF results file")
+    return _decode_results(metadata['results'], arrays)
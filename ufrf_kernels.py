@@ -0,0 +1,257 @@
+"""
+UFRF Core Kernels
+=================
+Vectorized implementations of the core UFRF formulas shared by the
+validation suite, the core tests and the multi-scale simulation.
+
+Every kernel accepts scalars or broadcastable NumPy arrays and an optional
+`out=` buffer, so large (n, p, s1, s2) sweeps run as a handful of array
+operations instead of one interpreter round-trip per point.
+"""
+
+import numpy as np
+from typing import Optional, Union
+
+ArrayLike = Union[float, int, np.ndarray]
+
+# Golden ratio constant
+PHI = (1 + np.sqrt(5)) / 2
+
+# Precomputed φ^k for integer k in [-PHI_TABLE_RANGE, PHI_TABLE_RANGE]
+PHI_TABLE_RANGE = 64
+PHI_TABLE = PHI ** np.arange(-PHI_TABLE_RANGE, PHI_TABLE_RANGE + 1)
+PHI_TABLE.flags.writeable = False
+
+
+def _empty(*operands, dtype=np.float64) -> np.ndarray:
+    """Allocate an output array with the broadcast shape of the operands."""
+    return np.empty(np.broadcast(*operands).shape, dtype=dtype)
+
+
+def _finish(result: np.ndarray, out: Optional[np.ndarray]):
+    """Return plain scalars for scalar inputs, arrays otherwise."""
+    if out is None and result.ndim == 0:
+        return result[()]
+    return result
+
+
+def phi_power(k: ArrayLike, out: Optional[np.ndarray] = None):
+    """
+    Calculate φ^k.
+    Integer exponents inside the table range are looked up, anything else
+    falls back to np.power.
+    """
+    k = np.asarray(k)
+    result = _empty(k) if out is None else out
+    if k.dtype.kind in 'iu' and (k.size == 0 or np.max(np.abs(k)) <= PHI_TABLE_RANGE):
+        np.take(PHI_TABLE, k + PHI_TABLE_RANGE, out=result)
+    else:
+        np.power(PHI, k, out=result)
+    return _finish(result, out)
+
+
+def _harmonic_unity(n: ArrayLike, p: ArrayLike, out: Optional[np.ndarray]) -> np.ndarray:
+    """Array-only core of harmonic_unity, reusing two scratch arrays."""
+    ratio = np.true_divide(n, p, out=_empty(n, p))
+    theta = np.multiply(ratio, np.pi, out=np.empty_like(ratio))
+
+    result = np.cos(theta, out=np.empty_like(ratio) if out is None else out)
+    np.abs(result, out=result)
+    np.sin(theta, out=theta)
+    np.abs(theta, out=theta)
+    np.add(result, theta, out=result)
+    np.mod(ratio, 1, out=ratio)
+    np.add(result, ratio, out=result)
+    return result
+
+
+def harmonic_unity(n: ArrayLike, p: ArrayLike, out: Optional[np.ndarray] = None):
+    """
+    Calculate harmonic unity value U_p(n).
+    U_p(n) = |cos(nπ/p)| + |sin(nπ/p)| + (n/p mod 1)
+    """
+    return _finish(_harmonic_unity(n, p, out), out)
+
+
+def cross_scale_unity(n: ArrayLike, p: ArrayLike, scale_diff: ArrayLike,
+                      out: Optional[np.ndarray] = None):
+    """
+    Calculate cross-scale unity value.
+    U_cross = φ^|scale_diff| * U_p(n)
+    """
+    # Broadcast n up front so the result already has the full output shape
+    n = np.broadcast_to(n, np.broadcast(n, p, scale_diff).shape)
+    result = _harmonic_unity(n, p, out)
+    np.multiply(result, phi_power(np.abs(scale_diff)), out=result)
+    return _finish(result, out)
+
+
+def cross_scale_ratio_unity(k: ArrayLike, s1: ArrayLike, s2: ArrayLike,
+                            out: Optional[np.ndarray] = None):
+    """
+    Calculate cross-scale unity using only ratios of φ.
+    For n = k * p * φ^s1 at scale s1 and p * φ^s2 at scale s2:
+    U_cross = φ^|s1-s2| * (|cos(ratio * π)| + |sin(ratio * π)| + (ratio % 1))
+    where ratio = k * φ^{s1-s2}
+    """
+    scale_diff = np.subtract(s1, s2)
+    ratio = np.multiply(k, phi_power(scale_diff))
+    return cross_scale_unity(ratio, 1, scale_diff, out=out)
+
+
+def interference_factor(s1: ArrayLike, s2: ArrayLike, out: Optional[np.ndarray] = None):
+    """
+    Calculate cross-scale interference factor I(s1, s2).
+    I(s1,s2) = φ^-|s1-s2| * cos(2π(s1-s2)/13) * exp(i*π(s1+s2)/7)
+    """
+    scale_diff = np.subtract(s1, s2)
+    result = _empty(s1, s2, dtype=np.complex128) if out is None else out
+
+    np.multiply(np.add(s1, s2), 1j * np.pi / 7, out=result)
+    np.exp(result, out=result)
+    np.multiply(result, np.cos(scale_diff * (2 * np.pi / 13)), out=result)
+    np.multiply(result, phi_power(-np.abs(scale_diff)), out=result)
+    return _finish(result, out)
+
+
+# Cross-scale interference weights φ^-|Δ| * cos(2πΔ/13) are Re(INTERFERENCE_RATIO^|Δ|)
+INTERFERENCE_RATIO = np.exp(2j * np.pi / 13) / PHI
+
+
+def _interference_recurrence(fields: np.ndarray, order: range, out: np.ndarray,
+                             scratch: Optional[np.ndarray]) -> np.ndarray:
+    """Accumulate Re(Σ r^k fields[s ∓ k]) along order, one step per scale."""
+    dtype = np.result_type(fields.dtype, np.complex64)
+    acc = np.empty(fields.shape[1:], dtype=dtype) if scratch is None else scratch
+    acc.fill(0)
+    ratio = acc.dtype.type(INTERFERENCE_RATIO)
+    out[order[0]] = 0
+    for previous, s in zip(order, order[1:]):
+        acc += fields[previous]
+        acc *= ratio
+        out[s] = acc.real
+    return out
+
+
+def interference_from_lower_scales(fields: np.ndarray, out: Optional[np.ndarray] = None,
+                                   scratch: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Interference on each of a stack of real fields (axis 0, consecutive
+    integer scales) from the scales below it:
+    out[s] = Σ_{s' < s} φ^-(s-s') * cos(2π(s'-s)/13) * fields[s']
+    `scratch` is an optional complex buffer of one field's shape.
+    """
+    result = np.empty_like(fields) if out is None else out
+    return _interference_recurrence(fields, range(len(fields)), result, scratch)
+
+
+def interference_from_higher_scales(fields: np.ndarray, out: Optional[np.ndarray] = None,
+                                   scratch: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Interference on each of a stack of real fields (axis 0, consecutive
+    integer scales) from the scales above it:
+    out[s] = Σ_{s' > s} φ^-(s'-s) * cos(2π(s'-s)/13) * fields[s']
+    `scratch` is an optional complex buffer of one field's shape.
+    """
+    result = np.empty_like(fields) if out is None else out
+    return _interference_recurrence(fields, range(len(fields) - 1, -1, -1), result, scratch)
+
+
+def cross_scale_interference(fields: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Cross-scale interference of real fields stacked along axis 0 at
+    consecutive integer scales:
+    out[s] = Σ_{s' != s} φ^-|s-s'| * cos(2π(s'-s)/13) * fields[s']
+    The weights are Re(r^|s-s'|) with r = φ^-1 * exp(2πi/13), so one upward
+    and one downward recurrence replace the O(S²) pairwise sum.
+    """
+    result = interference_from_lower_scales(fields, out)
+    result += interference_from_higher_scales(fields)
+    return result
+
+
+def cross(a: np.ndarray, b: np.ndarray, out: Optional[np.ndarray] = None,
+          scratch: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Cross product a x b over the last axis (length 3), like np.cross but
+    writing into `out` with one reusable component-sized `scratch` buffer.
+    """
+    shape = np.broadcast(a, b).shape
+    dtype = np.result_type(a, b)
+    result = np.empty(shape, dtype=dtype) if out is None else out
+    tmp = np.empty(shape[:-1], dtype=dtype) if scratch is None else scratch
+    for i in range(3):
+        j, k = (i + 1) % 3, (i + 2) % 3
+        np.multiply(a[..., j], b[..., k], out=result[..., i])
+        np.multiply(a[..., k], b[..., j], out=tmp)
+        result[..., i] -= tmp
+    return result
+
+
+def direct_angle_to_source(candidates: ArrayLike, scales: ArrayLike = range(-5, 6),
+                           tolerance: float = 1) -> np.ndarray:
+    """
+    Check which candidates have a direct angle to source (0).
+    A candidate connects when (candidate mod 360 + scale * 360/13) mod 360
+    falls within `tolerance` degrees of 0 for any scale.
+    """
+    candidates = np.asarray(candidates)
+    angle_to_source = np.mod(candidates, 360)
+    offsets = np.asarray(scales) * (360 / 13)
+
+    scale_angle = np.mod(np.add.outer(angle_to_source, offsets), 360)
+    return np.any(np.abs(scale_angle) < tolerance, axis=-1) & (candidates > 1)
+
+
+def multi_scale_unity_rate(candidates: ArrayLike, scales: ArrayLike = range(-5, 6),
+                           contexts: ArrayLike = (2, 3, 5, 7, 11, 13),
+                           tolerance: float = 1/10,
+                           block_size: int = 1 << 14) -> np.ndarray:
+    """
+    Fraction of (scale, prime context) pairs where candidate * φ^scale
+    satisfies harmonic unity, |U_p(n) - 1| < tolerance.
+    """
+    candidates = np.asarray(candidates, dtype=np.float64).ravel()
+    phi_s = phi_power(np.asarray(scales))
+    contexts = np.asarray(contexts)
+
+    rate = np.empty(len(candidates))
+    unity = np.empty((min(block_size, len(candidates)), len(phi_s), len(contexts)))
+    for start in range(0, len(candidates), block_size):
+        block = candidates[start:start + block_size]
+        u = unity[:len(block)]
+
+        # (candidates x scales x contexts) unity values in one kernel call
+        n = np.multiply.outer(block, phi_s)[..., None]
+        _harmonic_unity(n, contexts, u)
+        u -= 1
+        np.abs(u, out=u)
+        rate[start:start + len(block)] = np.mean(u < tolerance, axis=(1, 2))
+
+    return rate
+
+
+def spiral_intersection_mask(mag1: np.ndarray, mag2: np.ndarray,
+                             phase1: np.ndarray, phase2: np.ndarray,
+                             mag_tolerance: float = 1/10,
+                             phase_tolerance: float = np.pi / 6) -> np.ndarray:
+    """
+    Mask of aligned samples where two spirals intersect:
+    |mag1 - mag2| / max(mag1, mag2) < mag_tolerance and
+    |phase1 - phase2| mod 2π < phase_tolerance
+    """
+    # Samples where both magnitudes vanish give NaN and never intersect
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mag_diff = np.abs(mag1 - mag2) / np.maximum(mag1, mag2)
+    phase_diff = np.mod(np.abs(phase1 - phase2), 2 * np.pi)
+    return (mag_diff < mag_tolerance) & (phase_diff < phase_tolerance)
+
+
+def intersection_candidates(mag1: np.ndarray, mag2: np.ndarray, scale_factor: float,
+                            modulus: int = 1000) -> np.ndarray:
+    """
+    Candidates generated at spiral meeting points:
+    max(2, int((mag1 + mag2) / 2 * scale_factor) mod modulus)
+    """
+    candidates = ((mag1 + mag2) / 2 * scale_factor).astype(np.int64) % modulus
+    return np.maximum(candidates, 2)
@@ -0,0 +1,160 @@
+"""
+UFRF Prime Oracle
+=================
+Shared prime lookup for the UFRF scripts, backed by a segmented sieve.
+
+The oracle keeps a packed bitset (one bit per integer) covering [0, limit)
+and grows it on demand, so membership tests are O(1) once the range has
+been sieved and range queries come back as NumPy arrays.
+"""
+
+import numpy as np
+from typing import List, Union
+
+# Default number of integers sieved per segment (multiple of 8 so that
+# segments pack into whole bytes of the bitset)
+SEGMENT_SIZE = 1 << 20
+
+
+class PrimeOracle:
+    """Segmented sieve of Eratosthenes with a cached, growable bitset."""
+
+    def __init__(self, limit: int = 1024, segment_size: int = SEGMENT_SIZE):
+        if segment_size <= 0 or segment_size % 8 != 0:
+            raise ValueError("segment_size must be a positive multiple of 8")
+        self.segment_size = segment_size
+        self._bits = np.zeros(0, dtype=np.uint8)  # bit i set <=> i is prime
+        self._limit = 0
+        self._base_primes = np.zeros(0, dtype=np.int64)
+        self._base_limit = 0  # Base primes cover [2, _base_limit)
+        self.extend(limit)
+
+    @property
+    def limit(self) -> int:
+        """Exclusive upper bound of the sieved range."""
+        return self._limit
+
+    def extend(self, limit: int):
+        """Sieve up to (at least) `limit`, one segment at a time."""
+        limit = -(-int(limit) // 8) * 8  # Round up to whole bytes
+        if limit <= self._limit:
+            return
+
+        self._ensure_base_primes(int(np.sqrt(limit)) + 1)
+
+        packed = [self._bits]
+        lo = self._limit
+        while lo < limit:
+            hi = min(lo + self.segment_size, limit)
+            packed.append(np.packbits(self._sieve_segment(lo, hi), bitorder='little'))
+            lo = hi
+
+        self._bits = np.concatenate(packed)
+        self._limit = limit
+
+    def _ensure_base_primes(self, n: int):
+        """Make sure all primes below n are available for segment sieving."""
+        if n <= self._base_limit:
+            return
+        if n <= self._limit:
+            self._base_primes = self.primes_in_range(2, n)
+            self._base_limit = n
+            return
+
+        # Plain sieve for the (small) base range
+        flags = np.ones(max(n, 2), dtype=bool)
+        flags[:2] = False
+        for p in range(2, int(np.sqrt(n)) + 1):
+            if flags[p]:
+                flags[p*p::p] = False
+        self._base_primes = np.flatnonzero(flags[:n]).astype(np.int64)
+        self._base_limit = n
+
+    def _sieve_segment(self, lo: int, hi: int) -> np.ndarray:
+        """Return a boolean primality mask for the integers in [lo, hi)."""
+        segment = np.ones(hi - lo, dtype=bool)
+        if lo < 2:
+            segment[:2 - lo] = False
+
+        for p in self._base_primes:
+            p = int(p)
+            if p * p >= hi:
+                break
+            start = max(p * p, -(-lo // p) * p)
+            segment[start - lo::p] = False
+
+        return segment
+
+    def is_prime(self, n: int) -> bool:
+        """O(1) primality lookup, growing the sieve if n is out of range."""
+        n = int(n)
+        if n < 2:
+            return False
+        if n >= self._limit:
+            self.extend(max(n + 1, 2 * self._limit))
+        return bool((self._bits[n >> 3] >> (n & 7)) & 1)
+
+    def is_prime_array(self, values: Union[np.ndarray, List[int]]) -> np.ndarray:
+        """Vectorized primality lookup returning a boolean mask."""
+        values = np.asarray(values, dtype=np.int64)
+        mask = values >= 2
+        if not np.any(mask):
+            return mask
+
+        top = int(values.max())
+        if top >= self._limit:
+            self.extend(max(top + 1, 2 * self._limit))
+
+        idx = np.where(mask, values, 0)
+        bits = (self._bits[idx >> 3] >> (idx & 7).astype(np.uint8)) & 1
+        return mask & bits.astype(bool)
+
+    def primes_in_range(self, a: int, b: int) -> np.ndarray:
+        """Return all primes p with a <= p < b as an int64 array."""
+        a = max(int(a), 0)
+        b = int(b)
+        if b <= a:
+            return np.zeros(0, dtype=np.int64)
+        if b > self._limit:
+            self.extend(b)
+
+        # Unpack only the bytes overlapping [a, b)
+        first_byte = a >> 3
+        last_byte = (b + 7) >> 3
+        flags = np.unpackbits(self._bits[first_byte:last_byte], bitorder='little')
+        offset = first_byte * 8
+        flags = flags[a - offset:b - offset]
+        return np.flatnonzero(flags).astype(np.int64) + a
+
+    def primes_up_to(self, n: int) -> np.ndarray:
+        """Return all primes p <= n as an int64 array."""
+        return self.primes_in_range(2, int(n) + 1)
+
+
+# Shared oracle used by all UFRF scripts
+_default_oracle = PrimeOracle()
+
+
+def get_prime_oracle() -> PrimeOracle:
+    """Return the process-wide shared prime oracle."""
+    return _default_oracle
+
+
+def is_prime(n: int) -> bool:
+    """Check if a number is prime."""
+    return _default_oracle.is_prime(n)
+
+
+def is_prime_array(values: Union[np.ndarray, List[int]]) -> np.ndarray:
+    """Check an array of numbers for primality."""
+    return _default_oracle.is_prime_array(values)
+
+
+def primes_in_range(a: int, b: int) -> np.ndarray:
+    """Get all prime numbers in [a, b) as a NumPy array."""
+    return _default_oracle.primes_in_range(a, b)
+
+
+def get_primes_up_to(n: int) -> List[int]:
+    """Get all prime numbers up to n."""
+    return _default_oracle.primes_up_to(n).tolist()
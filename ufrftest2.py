@@ -1,10 +1,23 @@
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.fftpack import fftn, ifftn, fftfreq
+from scipy.fft import rfftn, irfftn, fftfreq, rfftfreq
+from scipy.spatial import cKDTree
 import json
 import os
 import datetime
 import logging
+import functools
+import copy
+import sys
+from collections import OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+
+from ufrf_primes import is_prime_array
+from ufrf_io import write_array_file, read_array_file, DiagnosticsWriter, read_diagnostics, save_results
+from ufrf_kernels import (harmonic_unity, phi_power, direct_angle_to_source, multi_scale_unity_rate,
+                          spiral_intersection_mask, intersection_candidates,
+                          INTERFERENCE_RATIO, interference_from_higher_scales, cross)
 
 # Create output directory
 output_dir = "ufrf_simulation_results"
@@ -21,19 +34,706 @@ logging.basicConfig(
     ]
 )
 
+class SpiralCache:
+    """Bounded LRU cache of read-only spiral arrays keyed by (type, scale, resolution)"""
+    
+    def __init__(self, max_bytes=256 * 2**20):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, key, build):
+        """Return the cached spiral for key, building it on a miss"""
+        spiral = self.entries.get(key)
+        if spiral is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return spiral
+        
+        self.misses += 1
+        spiral = build()
+        spiral.flags.writeable = False
+        self.entries[key] = spiral
+        self.nbytes += spiral.nbytes
+        
+        # Evict least recently used spirals once over the memory cap
+        while self.nbytes > self.max_bytes and len(self.entries) > 1:
+            _, evicted = self.entries.popitem(last=False)
+            self.nbytes -= evicted.nbytes
+            self.evictions += 1
+        
+        return spiral
+    
+    def clear(self):
+        """Drop every cached spiral (counters are kept)"""
+        self.entries.clear()
+        self.nbytes = 0
+    
+    def get_statistics(self):
+        """Hit/miss/eviction counters and current memory use"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self.entries),
+            'nbytes': self.nbytes
+        }
+
+def cached_spiral(spiral_type):
+    """Serve a create_*_spiral method through the instance's spiral cache"""
+    def decorator(create_spiral):
+        @functools.wraps(create_spiral)
+        def wrapper(self, scale):
+            key = (spiral_type, scale, self.spiral_resolution)
+            return self.spiral_cache.get(key, lambda: create_spiral(self, scale))
+        return wrapper
+    return decorator
+
+class SpiralIntersectionIndex:
+    """
+    KD-tree over spiral points for finding every near-crossing between spirals,
+    not only samples at the same parameter index.
+    
+    Points are indexed in (log|z| / log-tolerance, phase / phase-tolerance)
+    coordinates, so the UFRF intersection criterion (relative magnitude
+    difference < mag_tolerance, phase difference < phase_tolerance) becomes a
+    Chebyshev ball of radius 1. Tree candidates are re-checked with the exact
+    criterion. Several spirals (e.g. one per prime center) can be indexed
+    together and joined in a single batched query.
+    """
+    
+    def __init__(self, spirals, mag_tolerance=1/10, phase_tolerance=np.pi / 6):
+        self.spirals = np.atleast_2d(spirals)
+        self.mag_tolerance = mag_tolerance
+        self.phase_tolerance = phase_tolerance
+        
+        points = self.spirals.ravel()
+        self.magnitudes = np.abs(points)
+        self.phases = np.angle(points)
+        
+        # |m1 - m2| / max(m1, m2) < t  <=>  |log m1 - log m2| < -log(1 - t)
+        log_tolerance = -np.log1p(-mag_tolerance)
+        self.flat_index = np.flatnonzero(self.magnitudes > 0)  # log|0| cannot be indexed
+        coords = np.column_stack((np.log(self.magnitudes[self.flat_index]) / log_tolerance,
+                                  self.phases[self.flat_index] / phase_tolerance))
+        self.tree = cKDTree(coords)
+    
+    def query(self, other=None):
+        """
+        All near-crossings with another index, or among the indexed spirals
+        themselves when other is None (a self-join that also reports each
+        spiral's crossings with itself, ordered (spiral1, sample1) <= (spiral2, sample2)).
+        Returns (spiral1, sample1, spiral2, sample2) index arrays.
+        """
+        # Slightly widened radius keeps the tree a superset of the exact test
+        radius = 1 + 1e-9
+        if other is None:
+            other = self
+            pairs = self.tree.query_pairs(radius, p=np.inf, output_type='ndarray')
+            # Pairs come back with i < j; every indexed point also meets itself
+            flat1 = np.concatenate((self.flat_index[pairs[:, 0]], self.flat_index))
+            flat2 = np.concatenate((self.flat_index[pairs[:, 1]], self.flat_index))
+        else:
+            pairs = self.tree.sparse_distance_matrix(other.tree, radius, p=np.inf,
+                                                     output_type='ndarray')
+            flat1 = self.flat_index[pairs['i']]
+            flat2 = other.flat_index[pairs['j']]
+        
+        exact = spiral_intersection_mask(self.magnitudes[flat1], other.magnitudes[flat2],
+                                         self.phases[flat1], other.phases[flat2],
+                                         self.mag_tolerance, self.phase_tolerance)
+        flat1 = flat1[exact]
+        flat2 = flat2[exact]
+        
+        # Deterministic order regardless of tree traversal
+        order = np.lexsort((flat2, flat1))
+        spiral1, sample1 = np.divmod(flat1[order], self.spirals.shape[1])
+        spiral2, sample2 = np.divmod(flat2[order], other.spirals.shape[1])
+        return spiral1, sample1, spiral2, sample2
+    
+    def magnitudes_at(self, spiral, sample):
+        """Magnitudes of the indexed points at (spiral, sample)"""
+        return self.magnitudes[spiral * self.spirals.shape[1] + sample]
+
+class PrimeCenterRegistry:
+    """
+    Struct-of-arrays registry of prime centers.
+    
+    Each center is one row of the prime, scale, position and type-code
+    columns, kept in registration order. A per-scale row index and a list of
+    dynamic rows make active-center lookups independent of the total number
+    of centers, and no spiral data is stored: spirals come from the shared
+    spiral cache keyed by the center's scale.
+    """
+    
+    TYPES = ('void', 'unity', 'prime', 'dynamic_prime')
+    SPIRAL_TYPES = ('prime', 'dynamic_prime')  # Centers that carry a spiral system
+    
+    def __init__(self, capacity=64):
+        self.size = 0
+        self.prime = np.empty(capacity, dtype=np.int64)
+        self.scale = np.empty(capacity, dtype=np.int64)
+        self.position = np.empty(capacity, dtype=np.int64)
+        self.type_code = np.empty(capacity, dtype=np.int8)
+        self.rows = {}  # prime -> row
+        self.scale_rows = {}  # scale -> rows of spiral centers at that scale
+        self.dynamic_rows = []
+        self.active_cache = {}  # scale -> active rows, reset on every add
+        self.spiral_codes = [self.TYPES.index(t) for t in self.SPIRAL_TYPES]
+    
+    def __len__(self):
+        return self.size
+    
+    def __contains__(self, prime):
+        return prime in self.rows
+    
+    def add(self, prime, scale, position, center_type):
+        """Register a center; returns False if the prime is already registered"""
+        if prime in self.rows:
+            return False
+        
+        if self.size == len(self.prime):
+            self._grow(2 * len(self.prime))
+        
+        row = self.size
+        self.prime[row] = prime
+        self.scale[row] = scale
+        self.position[row] = position
+        self.type_code[row] = self.TYPES.index(center_type)
+        self.rows[prime] = row
+        self.size += 1
+        
+        if center_type in self.SPIRAL_TYPES:
+            self.scale_rows.setdefault(scale, []).append(row)
+            if center_type == 'dynamic_prime':
+                self.dynamic_rows.append(row)
+        self.active_cache.clear()
+        return True
+    
+    @classmethod
+    def from_columns(cls, prime, scale, position, type_code):
+        """Registry holding these rows, registered in order"""
+        registry = cls(capacity=max(64, len(prime)))
+        for row in zip(prime.tolist(), scale.tolist(), position.tolist(), type_code.tolist()):
+            registry.add(*row[:3], cls.TYPES[row[3]])
+        return registry
+    
+    def columns(self):
+        """{column: registered rows} of the four columns"""
+        return {name: getattr(self, name)[:self.size] for name in ('prime', 'scale', 'position', 'type_code')}
+    
+    def _grow(self, capacity):
+        """Reallocate the columns with room for capacity rows"""
+        for name in ('prime', 'scale', 'position', 'type_code'):
+            column = getattr(self, name)
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[:self.size] = column[:self.size]
+            setattr(self, name, grown)
+    
+    def get(self, prime):
+        """Center info dict for prime (KeyError if unknown)"""
+        row = self.rows[prime]
+        return {
+            'scale': int(self.scale[row]),
+            'position': int(self.position[row]),
+            'type': self.TYPES[self.type_code[row]]
+        }
+    
+    def has_spirals(self, prime):
+        """Whether prime is a registered center with its own spiral system"""
+        row = self.rows.get(prime)
+        return row is not None and self.TYPES[self.type_code[row]] in self.SPIRAL_TYPES
+    
+    def scale_of(self, prime):
+        """Scale level of a registered center"""
+        return int(self.scale[self.rows[prime]])
+    
+    def primes(self, center_type=None):
+        """Registered primes (optionally of one type) in registration order"""
+        primes = self.prime[:self.size]
+        if center_type is not None:
+            primes = primes[self.type_code[:self.size] == self.TYPES.index(center_type)]
+        return primes
+    
+    def spiral_primes(self):
+        """Primes that carry a spiral system, in registration order"""
+        return self.prime[:self.size][np.isin(self.type_code[:self.size], self.spiral_codes)]
+    
+    def active_rows(self, scale):
+        """Rows of spiral centers at this scale or dynamic, in registration order"""
+        rows = self.active_cache.get(scale)
+        if rows is None:
+            rows = np.union1d(np.array(self.scale_rows.get(scale, []), dtype=np.int64),
+                              np.array(self.dynamic_rows, dtype=np.int64))
+            self.active_cache[scale] = rows
+        return rows
+    
+    def active_primes(self, scale):
+        """Primes of the spiral centers active at this scale"""
+        return self.prime[self.active_rows(scale)]
+    
+    def distribution(self, column):
+        """Counts per distinct value of a column, in order of first appearance"""
+        values, first, counts = np.unique(getattr(self, column)[:self.size],
+                                          return_index=True, return_counts=True)
+        order = np.argsort(first)
+        if column == 'type_code':
+            return {self.TYPES[values[i]]: int(counts[i]) for i in order}
+        return {int(values[i]): int(counts[i]) for i in order}
+    
+    def as_dict(self):
+        """Plain {prime: center info} dict, e.g. for JSON output"""
+        return {int(prime): self.get(int(prime)) for prime in self.primes()}
+    
+    @property
+    def nbytes(self):
+        return self.prime.nbytes + self.scale.nbytes + self.position.nbytes + self.type_code.nbytes
+
+class PrimeCentersView(Mapping):
+    """Read-only {prime: {'scale', 'position', 'type'}} view of a PrimeCenterRegistry"""
+    
+    def __init__(self, registry):
+        self.registry = registry
+    
+    def __getitem__(self, prime):
+        return self.registry.get(prime)
+    
+    def __contains__(self, prime):
+        return prime in self.registry
+    
+    def __iter__(self):
+        return iter(self.registry.primes().tolist())
+    
+    def __len__(self):
+        return len(self.registry)
+
+class PrimeSpiralSystemsView(Mapping):
+    """
+    Read-only {prime: spiral system} view; each system dict is assembled on
+    access from the registry and the spiral cache, so nothing is stored per center
+    """
+    
+    def __init__(self, ufrf):
+        self.ufrf = ufrf
+    
+    def __getitem__(self, prime):
+        registry = self.ufrf.prime_center_registry
+        if not registry.has_spirals(prime):
+            raise KeyError(prime)
+        
+        info = registry.get(prime)
+        system = {f'{spiral_type}_spiral': self.ufrf.create_prime_center_spiral(prime, spiral_type)
+                  for spiral_type in ['golden', 'krystal', 'log', 'prime', 'unity', 'harmonic']}
+        system.update({
+            '13_cycle': self.ufrf.create_complete_13_cycle(info['scale']),
+            'center_position': info['position'],
+            'scale_level': info['scale'],
+            'generated_primes': [],
+            'intersection_points': []
+        })
+        return system
+    
+    def __contains__(self, prime):
+        return self.ufrf.prime_center_registry.has_spirals(prime)
+    
+    def __iter__(self):
+        return iter(self.ufrf.prime_center_registry.spiral_primes().tolist())
+    
+    def __len__(self):
+        return len(self.ufrf.prime_center_registry.spiral_primes())
+
+class PairLedger:
+    """
+    Record of evaluated prime-center pairs and scale pairs for incremental passes.
+    
+    Centers are paired in registration order, so the ledger only keeps how many
+    centers of each selection have been paired: every pair among those is done
+    and only pairs involving later centers are new. Meetings are kept for the
+    center pairs that produced any, and primes for every scale pair.
+    """
+    
+    def __init__(self):
+        self.paired_counts = {}  # selection -> number of centers already paired
+        self.center_meetings = {}  # (prime1, prime2) -> [(meeting_point, new_scale)]
+        self.scale_primes = {}  # (scale1, scale2) -> validated primes
+        self.evaluated_pairs = 0
+        self.skipped_pairs = 0
+    
+    def new_center_pairs(self, centers, selection):
+        """Pairs (prime_i, prime_j), i < j, involving a center added since the last pass"""
+        done = min(self.paired_counts.get(selection, 0), len(centers))
+        pairs = [(centers[i], centers[j])
+                 for i in range(len(centers))
+                 for j in range(max(i + 1, done), len(centers))]
+        self.skipped_pairs += done * (done - 1) // 2
+        return pairs
+    
+    def record_center_pairs(self, centers, selection, pairs, meetings):
+        """Store the meetings of newly evaluated pairs and advance the selection"""
+        for pair, pair_meetings in zip(pairs, meetings):
+            if pair_meetings:
+                self.center_meetings[pair] = pair_meetings
+        self.paired_counts[selection] = len(centers)
+        self.evaluated_pairs += len(pairs)
+    
+    def meetings_among(self, centers):
+        """Meetings of every recorded pair whose centers are both in centers"""
+        eligible = set(centers)
+        return [meetings for (prime1, prime2), meetings in self.center_meetings.items()
+                if prime1 in eligible and prime2 in eligible]
+    
+    def new_scale_pairs(self, scale_pairs):
+        """Scale pairs without recorded primes"""
+        pairs = [pair for pair in scale_pairs if pair not in self.scale_primes]
+        self.skipped_pairs += len(scale_pairs) - len(pairs)
+        return pairs
+    
+    def record_scale_pairs(self, pairs, primes):
+        """Store the primes of newly evaluated scale pairs"""
+        self.scale_primes.update(zip(pairs, primes))
+        self.evaluated_pairs += len(pairs)
+    
+    def get_statistics(self):
+        """Evaluated/skipped pair counters and ledger size"""
+        return {
+            'evaluated_pairs': self.evaluated_pairs,
+            'skipped_pairs': self.skipped_pairs,
+            'center_pairs_with_meetings': len(self.center_meetings),
+            'scale_pairs': len(self.scale_primes)
+        }
+
+class FieldWorkspace:
+    """
+    Arena of reusable scratch arrays for the solver loop, keyed by name and
+    (optionally) scale. A buffer is allocated the first time it is asked for
+    and handed out again on every later request with the same shape and
+    dtype, so after the first step the hot loop allocates no large arrays;
+    `allocations` counts the arrays the arena has had to create.
+    """
+    
+    def __init__(self):
+        self.buffers = {}  # (name, scale) -> array
+        self.allocations = 0
+        self.requests = 0
+        self.nbytes = 0
+    
+    def get(self, name, shape, dtype=np.float64, scale=None):
+        """Scratch array (contents undefined) for this name and scale"""
+        key = (name, scale)
+        self.requests += 1
+        buffer = self.buffers.get(key)
+        if buffer is None or buffer.shape != tuple(shape) or buffer.dtype != dtype:
+            if buffer is not None:
+                self.nbytes -= buffer.nbytes
+            buffer = np.empty(shape, dtype=dtype)
+            self.buffers[key] = buffer
+            self.allocations += 1
+            self.nbytes += buffer.nbytes
+        return buffer
+    
+    def zeros(self, name, shape, dtype=np.float64, scale=None):
+        """Zero-filled scratch array for this name and scale"""
+        buffer = self.get(name, shape, dtype, scale)
+        buffer.fill(0)
+        return buffer
+    
+    def clear(self):
+        """Release every buffer"""
+        self.buffers.clear()
+        self.nbytes = 0
+    
+    def get_statistics(self):
+        """Buffers held, bytes held and allocations made"""
+        return {
+            'buffers': len(self.buffers),
+            'nbytes': self.nbytes,
+            'allocations': self.allocations,
+            'requests': self.requests
+        }
+
+class DerivedFieldCache:
+    """
+    Per-scale cache of quantities derived from a velocity field: vorticity,
+    |omega|, clipped |omega|, kinetic energy and lambda_eff at the scale's
+    own level. Entries belong to one field array; they are dropped when
+    time_step writes new fields or when a different array is passed in.
+    Array quantities are computed into per-scale workspace buffers and
+    handed out as read-only views, valid until the fields change.
+    """
+    
+    QUANTITIES = ('vorticity', 'vorticity_magnitude', 'safe_vorticity_magnitude', 'energy', 'lambda_eff')
+    
+    def __init__(self, ufrf):
+        self.ufrf = ufrf
+        self.entries = {}  # scale -> {'field': u, quantity: value}
+        self.computed = {name: 0 for name in self.QUANTITIES}
+        self.reused = {name: 0 for name in self.QUANTITIES}
+        self.invalidations = 0
+    
+    def _get(self, scale, u, name, compute):
+        entry = self.entries.get(scale)
+        if entry is None or entry['field'] is not u:
+            entry = {'field': u}
+            self.entries[scale] = entry
+        
+        if name in entry:
+            self.reused[name] += 1
+            return entry[name]
+        
+        self.computed[name] += 1
+        value = compute()
+        if isinstance(value, np.ndarray):
+            value = value.view()
+            value.flags.writeable = False
+        entry[name] = value
+        return value
+    
+    def vorticity(self, scale, u):
+        """Spectral vorticity of u"""
+        return self._get(scale, u, 'vorticity', lambda: self.ufrf.compute_vorticity(u))
+    
+    def _buffer(self, name, scale, u):
+        return self.ufrf.workspace.get(name, u.shape[:-1], u.dtype, scale=scale)
+    
+    def _vorticity_magnitude(self, scale, u):
+        omega = self.vorticity(scale, u)
+        squared = self.ufrf.workspace.get('vorticity_squared', omega.shape, omega.dtype)
+        magnitude = self._buffer('vorticity_magnitude', scale, u)
+        np.square(omega, out=squared)
+        np.sum(squared, axis=-1, out=magnitude)
+        return np.sqrt(magnitude, out=magnitude)
+    
+    def vorticity_magnitude(self, scale, u):
+        """|omega| of u"""
+        return self._get(scale, u, 'vorticity_magnitude', lambda: self._vorticity_magnitude(scale, u))
+    
+    def safe_vorticity_magnitude(self, scale, u):
+        """|omega| clipped to [1/1000, 1000] for regularization"""
+        return self._get(scale, u, 'safe_vorticity_magnitude',
+                         lambda: np.clip(self.vorticity_magnitude(scale, u), 1/1000, 1000,
+                                         out=self._buffer('safe_vorticity_magnitude', scale, u)))
+    
+    def energy(self, scale, u):
+        """Kinetic energy 1/2 <|u|^2>"""
+        return self._get(scale, u, 'energy', lambda: field_energy(u))
+    
+    def lambda_eff(self, scale, u):
+        """lambda_eff of u at the scale's own level"""
+        return self._get(scale, u, 'lambda_eff',
+                         lambda: self.ufrf.compute_lambda_eff(self.safe_vorticity_magnitude(scale, u), scale,
+                                                              out=self._buffer('lambda_eff', scale, u)))
+    
+    def invalidate(self, scale=None):
+        """Drop the derived quantities of one scale (or of all scales)"""
+        if scale is None:
+            self.invalidations += len(self.entries)
+            self.entries.clear()
+        elif self.entries.pop(scale, None) is not None:
+            self.invalidations += 1
+    
+    def get_statistics(self):
+        """Recomputations done and avoided, per quantity"""
+        return {
+            'computed': dict(self.computed),
+            'reused': dict(self.reused),
+            'invalidations': self.invalidations
+        }
+
+class SpectralOperator:
+    """
+    Real-to-complex transforms, wavenumbers, k^2 and diffusion factors for
+    (N, N, N, 3) vector fields of a real dtype in a periodic box of side L.
+    
+    All three components go through one batched rfftn/irfftn over the
+    spatial axes, giving (N, N, N//2 + 1, 3) spectra. Wavenumber axes are
+    kept as broadcastable (N,1,1)/(1,N,1)/(1,1,N//2+1) arrays, so only k^2
+    and each diffusion factor take half-spectrum memory. The derivative
+    wavenumbers zero the unpaired Nyquist mode of even N, whose derivative
+    has no real part (the complex transforms used to drop it via np.real).
+    """
+    
+    MAX_DIFFUSION_FACTORS = 8
+    
+    def __init__(self, N, L, dtype=np.float64):
+        self.N = N
+        self.L = L
+        self.dtype = np.dtype(dtype)
+        self.k = fftfreq(N, d=L / N) * 2 * np.pi
+        self.k_half = rfftfreq(N, d=L / N) * 2 * np.pi
+        self.k2 = (self.k[:, None, None]**2 + self.k[None, :, None]**2 +
+                   self.k_half[None, None, :]**2)
+        self.diffusion_factors = OrderedDict()
+        
+        k_derivative = self.k.astype(self.dtype)
+        k_half_derivative = self.k_half.astype(self.dtype)
+        if N % 2 == 0:
+            k_derivative[N // 2] = 0
+            k_half_derivative[-1] = 0
+        self.kx = k_derivative[:, None, None]
+        self.ky = k_derivative[None, :, None]
+        self.kz = k_half_derivative[None, None, :]
+        
+        for array in (self.k, self.k_half, self.k2):
+            array.flags.writeable = False
+    
+    def forward(self, u, workers=None):
+        """Half spectrum of every component of a real (..., N, N, N, 3) field"""
+        return rfftn(u, axes=(-4, -3, -2), workers=workers)
+    
+    def inverse(self, u_hat, workers=None):
+        """Real (..., N, N, N, 3) field from its half spectrum"""
+        return irfftn(u_hat, s=(self.N,) * 3, axes=(-4, -3, -2), workers=workers)
+    
+    def wavenumber(self, axis):
+        """Broadcastable half-spectrum derivative wavenumbers along axis 0, 1 or 2"""
+        return (self.kx, self.ky, self.kz)[axis]
+    
+    def diffusion_factor(self, nu, dt):
+        """exp(-nu k^2 dt) on the half spectrum, cached per (nu, dt)"""
+        key = (nu, dt)
+        factor = self.diffusion_factors.get(key)
+        if factor is None:
+            factor = np.exp(-nu * self.k2 * dt).astype(self.dtype, copy=False)
+            factor.flags.writeable = False
+            self.diffusion_factors[key] = factor
+            if len(self.diffusion_factors) > self.MAX_DIFFUSION_FACTORS:
+                self.diffusion_factors.popitem(last=False)
+        else:
+            self.diffusion_factors.move_to_end(key)
+        return factor
+
+def field_energy(u):
+    """Kinetic energy 1/2 <|u|^2> of an (N, N, N, 3) field, without temporaries"""
+    u = u.ravel()
+    return 1/2 * float(np.dot(u, u)) / (u.size // 3)
+
+@functools.lru_cache(maxsize=None)
+def get_spectral_operator(N, L, dtype=np.dtype(np.float64)):
+    """Shared SpectralOperator for an (N, L) box and field dtype"""
+    return SpectralOperator(N, L, dtype)
+
+class PrecisionMonitor:
+    """
+    Round-off drift monitor for a single-precision run. A float64 shadow and
+    a float32 twin of the run, both at reduced resolution, start from the
+    same initial state and advance in lock-step with it; every `interval`
+    steps their total energy and max |omega| are compared, so the relative
+    drift measures precision loss alone, not resolution.
+    """
+    
+    def __init__(self, ufrf, interval=100, shadow_N=None, tolerance=1/100):
+        self.interval = interval
+        self.tolerance = tolerance
+        self.steps = 0
+        self.history = []  # One record per comparison
+        
+        shadow_N = shadow_N or max(ufrf.N // 4, 8)
+        options = dict(N=shadow_N, L=ufrf.L, scale_range=(ufrf.scale_range.start, ufrf.scale_range.stop),
+                       spiral_resolution=ufrf.spiral_resolution,
+                       prime_force_sources=ufrf.prime_force_sources,
+                       prime_force_tolerance=ufrf.prime_force_tolerance,
+                       fft_workers=ufrf.fft_workers, drift_check_interval=None)
+        self.reference = type(ufrf)(precision='float64', **options)
+        self.twin = type(ufrf)(precision=ufrf.dtype.name, **options)
+    
+    def step(self, dt, nu):
+        """Advance both shadows and compare them every `interval` steps"""
+        self.reference.time_step(dt, nu)
+        self.twin.time_step(dt, nu)
+        self.steps += 1
+        if self.steps % self.interval == 0:
+            self.compare()
+    
+    def compare(self):
+        """Record the relative energy and max |omega| drift of the twin"""
+        record = {'step': self.steps}
+        for name, quantity in (('energy', 'compute_total_energy'), ('max_vorticity', 'compute_max_vorticity')):
+            reference = getattr(self.reference, quantity)()
+            value = getattr(self.twin, quantity)()
+            record[f'{name}_drift'] = abs(value - reference) / max(abs(reference), np.finfo(float).tiny)
+        self.history.append(record)
+        
+        if max(record['energy_drift'], record['max_vorticity_drift']) > self.tolerance:
+            logging.warning(f"Precision drift above {self.tolerance} at step {self.steps}: "
+                            f"energy {record['energy_drift']:.2e}, max|ω| {record['max_vorticity_drift']:.2e}")
+        return record
+    
+    def checkpoint_state(self):
+        """(arrays, metadata) of both shadows and the comparison history"""
+        arrays, metadata = {}, {'steps': self.steps, 'history': self.history}
+        for name in ('reference', 'twin'):
+            shadow_arrays, metadata[name] = getattr(self, name).checkpoint_state()
+            arrays.update({f'{name}/{key}': value for key, value in shadow_arrays.items()})
+        return arrays, metadata
+    
+    def restore_checkpoint_state(self, arrays, metadata):
+        """Restore the state saved by checkpoint_state"""
+        self.steps = metadata['steps']
+        self.history = list(metadata['history'])
+        for name in ('reference', 'twin'):
+            prefix = f'{name}/'
+            getattr(self, name).restore_checkpoint_state(
+                {key[len(prefix):]: value for key, value in arrays.items() if key.startswith(prefix)},
+                metadata[name])
+    
+    def get_statistics(self):
+        """Comparisons made and the largest drifts seen"""
+        return {
+            'comparisons': len(self.history),
+            'shadow_N': self.reference.N,
+            'max_energy_drift': max((r['energy_drift'] for r in self.history), default=0.0),
+            'max_vorticity_drift': max((r['max_vorticity_drift'] for r in self.history), default=0.0)
+        }
+
 class InfiniteRecursiveUFRF:
-    def __init__(self, N=32, L=2*np.pi, scale_range=(-10, 11)):
+    # 13-cycle force per phase. Use only ratios: 1/2, 1/5, 1/10, etc. - no arbitrary decimals
+    CYCLE_PHASE_DELTAS = {
+        1: 1/2, 2: 1/2, 3: 1/2,      # Seed/Amplify (1/2 ratio)
+        4: -1/5, 5: -1/5, 6: -1/5,   # Harmonize (-1/5 ratio)
+        7: 0, 8: 0, 9: 0,            # Peak (zero)
+        10: -1,                       # REST (-1 ratio)
+        11: 1/3, 12: 1/3, 13: 1/3    # Completion (1/3 ratio)
+    }
+    
+    def __init__(self, N=32, L=2*np.pi, scale_range=(-10, 11),
+                 spiral_resolution=1000, spiral_cache_bytes=256 * 2**20,
+                 prime_force_sources=None, prime_force_tolerance=1/100, fft_workers=-1,
+                 contiguous_fields=False, precision='float64', drift_check_interval=100,
+                 drift_shadow_N=None, drift_tolerance=1/100):
         self.N = N
         self.L = L
         self.dx = L / N
+        
+        # Field precision: 'float64' or 'float32' (fields, spectra and scratch buffers)
+        if precision not in ('float64', 'float32'):
+            raise ValueError("precision must be 'float64' or 'float32'")
+        self.dtype = np.dtype(precision)
+        self.complex_dtype = np.result_type(self.dtype, np.complex64)
+        self.spectral = get_spectral_operator(N, L, self.dtype)  # Wavenumbers and diffusion factors
+        self.fft_workers = fft_workers  # FFT threads (-1 uses every core)
         self.scale_range = range(scale_range[0], scale_range[1])
         self.phi = (1 + np.sqrt(5)) / 2  # Golden ratio
         
+        # Spirals are pure functions of (type, scale, resolution) - build each once
+        self.spiral_resolution = spiral_resolution
+        self.spiral_cache = SpiralCache(max_bytes=spiral_cache_bytes)
+        self.prime_residue_tables = {}
+        
+        # φ^s row and φ^-|s| weights shared by batch resonance scoring
+        self.resonance_scales = np.arange(-10, 11)
+        self.resonance_phi = phi_power(self.resonance_scales)
+        self.resonance_weights = phi_power(-np.abs(self.resonance_scales))
+        
         # Initialize grids
         self.x = np.linspace(0, L, N, endpoint=False)
         self.y = np.linspace(0, L, N, endpoint=False)
         self.z = np.linspace(0, L, N, endpoint=False)
         self.X, self.Y, self.Z = np.meshgrid(self.x, self.y, self.z, indexing='ij')
+        self.center_distance = np.sqrt((self.X - L/2)**2 + (self.Y - L/2)**2 +
+                                       (self.Z - L/2)**2).astype(self.dtype, copy=False)
         
         # Multi-scale field systems
         self.scale_systems = {}
@@ -41,7 +741,7 @@ class InfiniteRecursiveUFRF:
         self.energy_scales = {}
         
         # CRITICAL: Prime spiral centers - each prime creates its own spiral system
-        self.prime_centers = {
+        initial_centers = {
             0: {'scale': 0, 'position': 0, 'type': 'void'},      # Void prime
             1: {'scale': 0, 'position': 1, 'type': 'unity'},     # Unity prime  
             2: {'scale': 0, 'position': 2, 'type': 'unity'},     # Unity echo
@@ -57,9 +757,30 @@ class InfiniteRecursiveUFRF:
             31: {'scale': 5, 'position': 31, 'type': 'prime'}
         }
         
+        # Centers live in a columnar registry; prime_centers and
+        # prime_spiral_systems are read-only views onto it
+        self.prime_center_registry = PrimeCenterRegistry()
+        for prime, center_info in initial_centers.items():
+            self.prime_center_registry.add(prime, center_info['scale'], center_info['position'],
+                                           center_info['type'])
+        self.prime_centers = PrimeCentersView(self.prime_center_registry)
+        
         # Track dynamically generated primes
         self.dynamic_primes = set()
-        self.prime_spiral_systems = {}  # Each prime gets its own spiral system
+        self.prime_spiral_systems = PrimeSpiralSystemsView(self)  # Each prime gets its own spiral system
+        self.pair_ledger = PairLedger()  # Pairs already evaluated by incremental passes
+        
+        # Prime-center force aggregation: None evaluates every center, otherwise
+        # centers are merged into at most this many effective sources
+        self.prime_force_sources = prime_force_sources
+        self.prime_force_tolerance = prime_force_tolerance
+        self.prime_force_stats = {'calls': 0, 'centers': 0, 'sources': 0, 'max_error_bound': 0.0}
+        
+        # Reusable scratch buffers for the solver loop
+        self.workspace = FieldWorkspace()
+        
+        # Vorticity, energy and lambda_eff of the current fields, shared within a step
+        self.derived_fields = DerivedFieldCache(self)
         
         # Initialize complete framework at each scale
         for scale in self.scale_range:
@@ -67,39 +788,49 @@ class InfiniteRecursiveUFRF:
             self.phase_cycles[scale] = 1  # Start at position 1
             self.energy_scales[scale] = 0.0
         
+        # Optionally keep every scale's velocity field in one (S, N, N, N, 3) tensor
+        self.field_tensor = None
+        if contiguous_fields:
+            self.attach_field_tensor()
+        
         # Initialize prime spiral systems for known primes
         self.initialize_prime_spiral_systems()
         
+        # Single-precision runs are checked against a float64 shadow at reduced resolution
+        self.precision_monitor = None
+        if self.dtype != np.float64 and drift_check_interval:
+            self.precision_monitor = PrecisionMonitor(self, drift_check_interval, drift_shadow_N,
+                                                      drift_tolerance)
+        
         logging.info(f"Initialized UFRF with {len(self.scale_range)} scales: {min(self.scale_range)} to {max(self.scale_range)}")
         logging.info(f"Initialized {len(self.prime_centers)} prime centers")
     
+    def attach_field_tensor(self):
+        """
+        Move all velocity fields into one contiguous (S, N, N, N, 3) tensor.
+        Each scale's 'velocity_field' becomes a view of its slice, and
+        time_step then updates every scale with single vectorized operations.
+        """
+        self.field_tensor = np.stack([self.scale_systems[scale]['velocity_field']
+                                      for scale in self.scale_range])
+        for i, scale in enumerate(self.scale_range):
+            self.scale_systems[scale]['velocity_field'] = self.field_tensor[i]
+        self.derived_fields.invalidate()
+    
     def initialize_prime_spiral_systems(self):
         """Initialize spiral systems for each prime center"""
-        for prime, center_info in self.prime_centers.items():
-            if center_info['type'] == 'prime':
-                # Each prime creates its own spiral system at its scale
-                prime_scale = center_info['scale']
-                self.prime_spiral_systems[prime] = {
-                    'golden_spiral': self.create_golden_spiral(prime_scale),
-                    'krystal_spiral': self.create_krystal_spiral(prime_scale),
-                    'log_spiral': self.create_log_spiral(prime_scale),
-                    'prime_spiral': self.create_prime_spiral(prime_scale),
-                    'unity_spiral': self.create_unity_spiral(prime_scale),
-                    'harmonic_spiral': self.create_harmonic_spiral(prime_scale),
-                    '13_cycle': self.create_complete_13_cycle(prime_scale),
-                    'center_position': center_info['position'],
-                    'scale_level': prime_scale,
-                    'generated_primes': [],
-                    'intersection_points': []
-                }
+        # Each prime creates its own spiral system at its scale; the spirals
+        # are shared through the spiral cache, so warming it is all that's needed
+        for prime in self.prime_center_registry.spiral_primes().tolist():
+            for spiral_type in ['golden', 'krystal', 'log', 'prime', 'unity', 'harmonic']:
+                self.create_prime_center_spiral(prime, spiral_type)
     
     def create_prime_center_spiral(self, prime, spiral_type='golden'):
         """Create spiral for a specific prime center"""
-        if prime not in self.prime_centers:
+        if prime not in self.prime_center_registry:
             return None
         
-        center_info = self.prime_centers[prime]
-        prime_scale = center_info['scale']
+        prime_scale = self.prime_center_registry.scale_of(prime)
         
         # Each prime creates spirals at its own scale
         if spiral_type == 'golden':
@@ -119,120 +850,335 @@ class InfiniteRecursiveUFRF:
     
     def generate_primes_from_center_intersection(self, prime1, prime2):
         """Generate new primes when two prime centers' spirals intersect"""
-        if prime1 not in self.prime_spiral_systems or prime2 not in self.prime_spiral_systems:
+        meetings = self.find_center_intersection_primes(prime1, prime2)
+        
+        # CRITICAL: Add to dynamic primes and create new centers
+        for meeting_point, new_scale in meetings:
+            self.register_dynamic_prime(meeting_point, new_scale)
+        
+        return list(set(meeting_point for meeting_point, _ in meetings))
+    
+    def find_spiral_intersections(self, spiral1, spiral2, mid_scale):
+        """
+        Find where two complex spirals sampled on the same parameter grid meet.
+        Returns (sample_indices, candidates) arrays, candidates being the
+        meeting points scaled by φ^mid_scale and bounded to [2, 1000).
+        """
+        mag1 = np.abs(spiral1)
+        mag2 = np.abs(spiral2)
+        indices = np.flatnonzero(spiral_intersection_mask(
+            mag1, mag2, np.angle(spiral1), np.angle(spiral2)))
+        candidates = intersection_candidates(mag1[indices], mag2[indices], phi_power(mid_scale))
+        return indices, candidates
+    
+    def find_spiral_crossings(self, spiral1, spiral2, mid_scale):
+        """
+        Find every near-crossing of two complex spirals, at any pair of samples.
+        Returns (samples1, samples2, candidates) arrays.
+        """
+        index1 = SpiralIntersectionIndex(spiral1)
+        _, samples1, _, samples2 = index1.query(SpiralIntersectionIndex(spiral2))
+        candidates = intersection_candidates(np.abs(spiral1[samples1]), np.abs(spiral2[samples2]),
+                                             phi_power(mid_scale))
+        return samples1, samples2, candidates
+    
+    def find_center_intersection_primes(self, prime1, prime2, all_crossings=False):
+        """
+        Find primes generated where two prime centers' spirals intersect.
+        Returns (meeting_point, new_scale) pairs in discovery order without
+        modifying any state, so pairs can be evaluated in worker processes.
+        With all_crossings=True every near-crossing is considered (not only
+        aligned samples) and each spiral type reports its distinct meeting
+        points in increasing order.
+        """
+        registry = self.prime_center_registry
+        if not registry.has_spirals(prime1) or not registry.has_spirals(prime2):
             return []
         
-        system1 = self.prime_spiral_systems[prime1]
-        system2 = self.prime_spiral_systems[prime2]
+        scale1 = registry.scale_of(prime1)
+        scale2 = registry.scale_of(prime2)
+        new_scale = max(scale1, scale2) + 1
         
-        generated_primes = []
+        mid_scale = (scale1 + scale2) / 2
+        meetings = []
         
         # Check intersections between all spiral types
         spiral_types = ['golden', 'krystal', 'log', 'prime', 'unity', 'harmonic']
         
         for spiral_type in spiral_types:
-            spiral1 = system1[f'{spiral_type}_spiral']
-            spiral2 = system2[f'{spiral_type}_spiral']
+            spiral1 = self.create_prime_center_spiral(prime1, spiral_type)
+            spiral2 = self.create_prime_center_spiral(prime2, spiral_type)
             
-            # Find intersection points
-            for i in range(len(spiral1)):
-                mag1 = abs(spiral1[i])
-                mag2 = abs(spiral2[i])
-                phase1 = np.angle(spiral1[i])
-                phase2 = np.angle(spiral2[i])
-                
-                # Check for intersection
-                mag_diff = abs(mag1 - mag2) / max(mag1, mag2)
-                phase_diff = abs(phase1 - phase2) % (2 * np.pi)
-                
-                if mag_diff < 1/10 and phase_diff < np.pi / 6:
-                    # Generate candidate from intersection
-                    # The meeting point becomes the new center
-                    meeting_point = int((mag1 + mag2) / 2 * (self.phi ** ((system1['scale_level'] + system2['scale_level']) / 2)))
-                    meeting_point = max(2, meeting_point % 1000)
-                    
-                    # Check if this creates a new prime
-                    if self.is_prime_via_geometric_resonance(meeting_point, (system1['scale_level'] + system2['scale_level']) / 2):
-                        generated_primes.append(meeting_point)
-                        
-                        # CRITICAL: Add to dynamic primes and create new center
-                        if meeting_point not in self.prime_centers:
-                            self.dynamic_primes.add(meeting_point)
-                            new_scale = max(system1['scale_level'], system2['scale_level']) + 1
-                            self.prime_centers[meeting_point] = {
-                                'scale': new_scale,
-                                'position': meeting_point % 13,
-                                'type': 'dynamic_prime'
-                            }
-                            
-                            # Create new spiral system for this prime
-                            self.prime_spiral_systems[meeting_point] = {
-                                'golden_spiral': self.create_golden_spiral(new_scale),
-                                'krystal_spiral': self.create_krystal_spiral(new_scale),
-                                'log_spiral': self.create_log_spiral(new_scale),
-                                'prime_spiral': self.create_prime_spiral(new_scale),
-                                'unity_spiral': self.create_unity_spiral(new_scale),
-                                'harmonic_spiral': self.create_harmonic_spiral(new_scale),
-                                '13_cycle': self.create_complete_13_cycle(new_scale),
-                                'center_position': meeting_point % 13,
-                                'scale_level': new_scale,
-                                'generated_primes': [],
-                                'intersection_points': []
-                            }
-        
-        return list(set(generated_primes))
+            # The meeting points become the new centers
+            if all_crossings:
+                _, _, meeting_points = self.find_spiral_crossings(spiral1, spiral2, mid_scale)
+                meeting_points = np.unique(meeting_points)
+            else:
+                _, meeting_points = self.find_spiral_intersections(spiral1, spiral2, mid_scale)
+            
+            # Check which of them create a new prime
+            creates_prime = self.is_prime_via_geometric_resonance_batch(meeting_points, mid_scale)
+            meetings.extend((meeting_point, new_scale)
+                            for meeting_point in meeting_points[creates_prime].tolist())
+        
+        return meetings
+    
+    def find_center_crossing_primes_batch(self, primes=None):
+        """
+        Batched all-crossings search across many prime centers.
+        Centers at the same scale level share their spirals, so each spiral
+        type indexes one spiral per level in a single KD-tree and self-joins
+        it; the meeting points of each level pair are then fanned out to the
+        center pairs. Returns {(prime1, prime2): meetings} matching
+        find_center_intersection_primes(prime1, prime2, all_crossings=True)
+        for every pair with at least one meeting.
+        """
+        registry = self.prime_center_registry
+        if primes is None:
+            primes = registry.spiral_primes().tolist()
+        primes = [p for p in primes if registry.has_spirals(p)]
+        
+        # Group centers by scale level
+        levels = sorted(set(registry.scale_of(p) for p in primes))
+        level_ids = {level: i for i, level in enumerate(levels)}
+        centers = [level_ids[registry.scale_of(p)] for p in primes]
+        
+        # Center pairs (in the order of primes) behind every level pair
+        level_pairs = {}
+        for i in range(len(primes)):
+            for j in range(i + 1, len(primes)):
+                key = tuple(sorted((centers[i], centers[j])))
+                level_pairs.setdefault(key, []).append((primes[i], primes[j]))
+        
+        results = {}
+        if not level_pairs:
+            return results
+        
+        level_values = np.array(levels)
+        for spiral_type in ['golden', 'krystal', 'log', 'prime', 'unity', 'harmonic']:
+            create_spiral = getattr(self, f'create_{spiral_type}_spiral')
+            index = SpiralIntersectionIndex(np.stack([create_spiral(level) for level in levels]))
+            level1, sample1, level2, sample2 = index.query()
+            
+            mid_scale = (level_values[level1] + level_values[level2]) / 2
+            candidates = intersection_candidates(index.magnitudes_at(level1, sample1),
+                                                 index.magnitudes_at(level2, sample2),
+                                                 phi_power(mid_scale))
+            creates_prime = self.is_prime_via_geometric_resonance_batch(candidates, mid_scale)
+            
+            # Distinct meeting points per level pair, in increasing order
+            keys = np.unique((level1[creates_prime] * len(levels) + level2[creates_prime]) * 1000
+                             + candidates[creates_prime])
+            pair_ids, meeting_points = np.divmod(keys, 1000)
+            for pair_id, meeting_point in zip(pair_ids.tolist(), meeting_points.tolist()):
+                key = divmod(pair_id, len(levels))
+                new_scale = max(levels[key[0]], levels[key[1]]) + 1
+                for pair in level_pairs.get(key, []):
+                    results.setdefault(pair, []).append((meeting_point, new_scale))
+        
+        return results
+    
+    def register_dynamic_prime(self, meeting_point, new_scale):
+        """Add a generated prime as a new dynamic center with its own spiral system"""
+        if not self.prime_center_registry.add(meeting_point, new_scale, meeting_point % 13,
+                                              'dynamic_prime'):
+            return
+        
+        self.dynamic_primes.add(meeting_point)
     
     def compute_prime_center_forces(self, u, scale):
         """Compute forces from all prime centers at this scale"""
-        force = np.zeros_like(u)
+        if self.prime_force_sources is not None:
+            return self.compute_aggregated_prime_center_forces(u, scale)
         
-        # Get all primes active at this scale
-        active_primes = [p for p, info in self.prime_centers.items() 
-                        if info['scale'] == scale or p in self.dynamic_primes]
+        force = np.zeros_like(u)
         
-        for prime in active_primes:
-            if prime in self.prime_spiral_systems:
-                # Each prime center contributes its own force
-                prime_force = self.compute_single_prime_center_force(u, prime, scale)
-                force += prime_force
+        # Get all primes active at this scale (per-scale index lookup)
+        for prime in self.prime_center_registry.active_primes(scale).tolist():
+            # Each prime center contributes its own force
+            prime_force = self.compute_single_prime_center_force(u, prime, scale)
+            force += prime_force
         
         return np.clip(force, -1000, 1000)
     
-    def compute_single_prime_center_force(self, u, prime, scale):
-        """Compute force from a single prime center"""
-        if prime not in self.prime_spiral_systems:
+    def compute_aggregated_prime_center_forces(self, u, scale):
+        """Compute prime center forces from a bounded set of effective sources"""
+        levels, vectors = self.prime_center_force_sources(scale)
+        if len(levels) == 0:
             return np.zeros_like(u)
         
-        system = self.prime_spiral_systems[prime]
-        
-        # Compute vorticity
-        omega = self.compute_vorticity(u)
-        omega_mag = np.sqrt(np.sum(omega**2, axis=-1))
-        omega_mag_safe = np.clip(omega_mag, 1/1000, 1000)
-        
-        # Scale-dependent regularization
-        scale_factor = self.phi ** system['scale_level']
-        lambda_eff = omega_mag_safe / (10 * scale_factor + omega_mag_safe)
-        lambda_eff = np.clip(lambda_eff, 0, 1)
-        
-        # Current phase for this prime's 13-cycle
+        # Vorticity is shared by every source
+        omega = self.derived_fields.vorticity(scale, u)
+        omega_mag_safe = self.derived_fields.safe_vorticity_magnitude(scale, u)
+        return self.prime_center_force_from_sources(omega, omega_mag_safe, levels, vectors)
+    
+    def compute_fused_spiral_forces(self, u, scale, out=None):
+        """
+        Spiral resonance and prime center forces in one pass.
+        
+        Both forces are lambda_eff * (omega x v), linear in the spiral vectors,
+        so vorticity and |omega| are computed once, lambda_eff once per scale
+        level, and the spiral vectors are summed before a single cross product
+        per force. Returns (spiral_force, prime_center_force), each clipped
+        like compute_spiral_resonance_force / compute_prime_center_forces,
+        written into the two arrays of `out` when given.
+        """
+        spiral_force, prime_center_force = (np.empty_like(u), np.empty_like(u)) if out is None else out
+        omega = self.derived_fields.vorticity(scale, u)
+        omega_mag_safe = self.derived_fields.safe_vorticity_magnitude(scale, u)
+        
+        # Spiral resonance: mean of the five spiral vectors at this scale
         t = self.phase_cycles[scale] * 2 * np.pi / 13
-        
-        # Evaluate all spiral types for this prime
+        spiral_vector = np.mean(self.spiral_resonance_vectors(scale, t), axis=0).astype(u.dtype)
+        weighted = self.workspace.get('weighted_spiral_vector', u.shape, u.dtype)
+        np.multiply(self.derived_fields.lambda_eff(scale, u)[..., None], spiral_vector, out=weighted)
+        self.clipped_cross(omega, weighted, spiral_force)
+        
+        levels, vectors = self.prime_center_force_sources(scale)
+        if len(levels) == 0:
+            prime_center_force.fill(0)
+            return spiral_force, prime_center_force
+        self.prime_center_force_from_sources(omega, omega_mag_safe, levels, vectors, out=prime_center_force)
+        return spiral_force, prime_center_force
+    
+    def clipped_cross(self, omega, weighted, out):
+        """omega x weighted clipped to [-1000, 1000], written into out"""
+        cross(omega, weighted, out=out,
+              scratch=self.workspace.get('cross_component', out.shape[:-1], out.dtype))
+        return np.clip(out, -1000, 1000, out=out)
+    
+    def compute_lambda_eff(self, omega_mag_safe, level, out=None):
+        """Scale-dependent regularization lambda_eff = |omega| / (10 φ^level + |omega|)"""
+        lambda_eff = np.add(10 * self.phi ** level, omega_mag_safe, out=out)
+        np.divide(omega_mag_safe, lambda_eff, out=lambda_eff)
+        return np.clip(lambda_eff, 0, 1, out=lambda_eff)
+    
+    def prime_center_force_from_sources(self, omega, omega_mag_safe, levels, vectors, out=None):
+        """Sum lambda_eff(level) * vector over the sources, then take one cross product with omega"""
+        weighted = self.workspace.zeros('weighted_center_vectors', omega.shape, omega.dtype)
+        term = self.workspace.get('weighted_center_term', omega.shape, omega.dtype)
+        lambda_eff = self.workspace.get('center_lambda_eff', omega_mag_safe.shape, omega_mag_safe.dtype)
+        for level, vector in zip(levels, np.asarray(vectors, dtype=omega.dtype)):
+            self.compute_lambda_eff(omega_mag_safe, level, out=lambda_eff)
+            weighted += np.multiply(lambda_eff[..., None], vector, out=term)
+        return self.clipped_cross(omega, weighted, np.empty_like(omega) if out is None else out)
+    
+    def prime_center_force_sources(self, scale):
+        """
+        (levels, vectors) of the prime center force sources at this scale:
+        merged effective sources in aggregation mode, exact per-level
+        sources otherwise
+        """
+        if self.prime_force_sources is None:
+            return self.prime_center_level_sources(scale)
+        
+        levels, vectors, error_bound = self.aggregate_prime_center_sources(scale)
+        stats = self.prime_force_stats
+        stats['calls'] += 1
+        stats['centers'] += len(self.prime_center_registry.active_rows(scale))
+        stats['sources'] += len(levels)
+        stats['max_error_bound'] = max(stats['max_error_bound'], error_bound)
+        return levels, vectors
+    
+    def prime_center_level_sources(self, scale):
+        """
+        Exact sources of the prime centers active at this scale: one per scale
+        level, its vector summing the mean spiral vector of every center there
+        """
+        registry = self.prime_center_registry
+        levels, counts = np.unique(registry.scale[registry.active_rows(scale)], return_counts=True)
+        t = self.phase_cycles[scale] * 2 * np.pi / 13
+        vectors = np.array([count * np.mean(self.prime_center_spiral_vectors(level, t), axis=0)
+                            for level, count in zip(levels.tolist(), counts.tolist())]).reshape(-1, 3)
+        return levels, vectors
+    
+    def aggregate_prime_center_sources(self, scale):
+        """
+        Merge the prime centers active at this scale into effective sources.
+        
+        A center's force is lambda_eff(level) * (omega x v), v being the mean of
+        its spiral vectors at the current phase. Both depend only on the
+        center's scale level, so centers at one level collapse exactly into a
+        single source with a summed vector. Adjacent levels are then merged
+        while over the prime_force_sources budget, or while the error bound
+        stays within prime_force_tolerance. Because
+        sup_omega |lambda_a - lambda_b| = tanh(|a - b| ln(φ) / 4), moving a
+        source by |a - b| levels errs by at most that fraction of its |v|.
+        
+        Returns (levels, vectors, error_bound) with the bound relative to the
+        summed source magnitude.
+        """
+        groups = [{'levels': [level], 'weights': [np.linalg.norm(vector)], 'vector': vector}
+                  for level, vector in zip(*self.prime_center_level_sources(scale))]
+        
+        def merged_level(levels, weights):
+            total = sum(weights)
+            return sum(l * w for l, w in zip(levels, weights)) / total if total > 0 else float(np.mean(levels))
+        
+        def merge_error(levels, weights):
+            level = merged_level(levels, weights)
+            return sum(w * np.tanh(abs(l - level) * np.log(self.phi) / 4) for l, w in zip(levels, weights))
+        
+        total_weight = sum(sum(g['weights']) for g in groups)
+        error = 0.0
+        while len(groups) > 1:
+            # Cheapest merge of two adjacent groups
+            costs = [merge_error(a['levels'] + b['levels'], a['weights'] + b['weights']) -
+                     merge_error(a['levels'], a['weights']) - merge_error(b['levels'], b['weights'])
+                     for a, b in zip(groups, groups[1:])]
+            i = int(np.argmin(costs))
+            within_tolerance = total_weight > 0 and (error + costs[i]) / total_weight <= self.prime_force_tolerance
+            if len(groups) <= self.prime_force_sources and not within_tolerance:
+                break
+            
+            a, b = groups[i], groups[i + 1]
+            groups[i:i + 2] = [{'levels': a['levels'] + b['levels'],
+                                'weights': a['weights'] + b['weights'],
+                                'vector': a['vector'] + b['vector']}]
+            error += costs[i]
+        
+        levels = np.array([merged_level(g['levels'], g['weights']) for g in groups])
+        vectors = np.array([g['vector'] for g in groups]).reshape(-1, 3)
+        return levels, vectors, float(error / total_weight) if total_weight > 0 else 0.0
+    
+    def prime_center_spiral_vectors(self, level, t):
+        """3D vectors of the six spirals of a center at this level, evaluated at phase t"""
         spiral_vectors = []
         for spiral_type in ['golden', 'krystal', 'log', 'prime', 'unity', 'harmonic']:
-            spiral = system[f'{spiral_type}_spiral']
+            spiral = getattr(self, f'create_{spiral_type}_spiral')(level)
             # Evaluate at current phase
             phase_index = int(t * len(spiral) / (2 * np.pi)) % len(spiral)
             spiral_val = spiral[phase_index]
             
             # Convert to 3D vector
-            spiral_vec = np.array([
+            spiral_vectors.append([
                 np.real(spiral_val),
                 np.imag(spiral_val),
                 np.abs(spiral_val) * np.sin(t)
             ])
-            spiral_vectors.append(spiral_vec)
+        return np.array(spiral_vectors)
+    
+    def compute_single_prime_center_force(self, u, prime, scale):
+        """Compute force from a single prime center"""
+        if not self.prime_center_registry.has_spirals(prime):
+            return np.zeros_like(u)
+        
+        scale_level = self.prime_center_registry.scale_of(prime)
+        
+        # Vorticity is shared by every prime center at this scale
+        omega = self.derived_fields.vorticity(scale, u)
+        omega_mag_safe = self.derived_fields.safe_vorticity_magnitude(scale, u)
+        
+        # Scale-dependent regularization
+        scale_factor = self.phi ** scale_level
+        lambda_eff = omega_mag_safe / (10 * scale_factor + omega_mag_safe)
+        lambda_eff = np.clip(lambda_eff, 0, 1)
+        
+        # Current phase for this prime's 13-cycle
+        t = self.phase_cycles[scale] * 2 * np.pi / 13
+        
+        # Evaluate all spiral types for this prime
+        spiral_vectors = self.prime_center_spiral_vectors(scale_level, t)
         
         # Combine forces from all spirals
         force = np.zeros_like(u)
@@ -262,7 +1208,7 @@ class InfiniteRecursiveUFRF:
         cycle_positions = self.create_complete_13_cycle(scale)
         
         # Initialize velocity field scaled to this level
-        u = np.zeros((self.N, self.N, self.N, 3))
+        u = np.zeros((self.N, self.N, self.N, 3), dtype=self.dtype)
         k_scale = 2 * np.pi / (self.L * scale_factor)
         u[..., 0] = scale_factor * np.sin(k_scale * self.X) * np.cos(k_scale * self.Y) * np.cos(k_scale * self.Z)
         u[..., 1] = -scale_factor * np.cos(k_scale * self.X) * np.sin(k_scale * self.Y) * np.cos(k_scale * self.Z)
@@ -282,76 +1228,86 @@ class InfiniteRecursiveUFRF:
             'scale_connections': {}
         }
     
+    def spiral_parameter(self):
+        """Spiral parameter samples t in [0, 4π] at the configured resolution"""
+        return np.linspace(0, 4*np.pi, self.spiral_resolution)
+    
+    @cached_spiral('golden')
     def create_golden_spiral(self, scale):
         """Create golden spiral at specific scale"""
-        t = np.linspace(0, 4*np.pi, 1000)
+        t = self.spiral_parameter()
         scale_factor = self.phi ** scale
         return scale_factor * np.exp(1j * t * self.phi)
     
+    @cached_spiral('krystal')
     def create_krystal_spiral(self, scale):
         """Create krystal spiral at specific scale"""
-        t = np.linspace(0, 4*np.pi, 1000)
+        t = self.spiral_parameter()
         scale_factor = self.phi ** scale
         return scale_factor * np.exp(-1j * t / self.phi)
     
+    @cached_spiral('log')
     def create_log_spiral(self, scale):
         """Create logarithmic spiral at specific scale"""
-        t = np.linspace(0, 4*np.pi, 1000)
+        t = self.spiral_parameter()
         scale_factor = self.phi ** scale
         return scale_factor * np.exp(1j * t * np.log(self.phi))
     
+    @cached_spiral('prime')
     def create_prime_spiral(self, scale):
         """Create prime spiral at specific scale - generates primes through geometric resonance"""
-        t = np.linspace(0, 4*np.pi, 1000)
+        t = self.spiral_parameter()
         scale_factor = self.phi ** scale
         
         # Prime spiral uses φ^scale * exp(i * t * π) for prime generation
         # The π factor creates resonance at prime positions
         prime_spiral = scale_factor * np.exp(1j * t * np.pi)
         
-        # Add prime-specific modulation
+        # Add prime-specific modulation where the time point corresponds to a prime position
+        prime_position = (t * scale_factor).astype(np.int64) % 100
+        is_prime_position = self.prime_residue_table(scale)[prime_position]
         prime_modulation = np.zeros_like(t, dtype=complex)
-        for i, time_val in enumerate(t):
-            # Check if this time point corresponds to a prime position
-            prime_position = int(time_val * scale_factor) % 100
-            if self.is_prime_via_geometric_resonance(prime_position, scale):
-                prime_modulation[i] = self.phi * np.exp(1j * prime_position * np.pi / 13)
+        prime_modulation[is_prime_position] = self.phi * np.exp(1j * prime_position[is_prime_position] * np.pi / 13)
         
         return prime_spiral + prime_modulation
     
+    def prime_residue_table(self, scale):
+        """Geometric-resonance primality of the 100 prime-spiral residues at this scale"""
+        if scale not in self.prime_residue_tables:
+            self.prime_residue_tables[scale] = self.is_prime_via_geometric_resonance_batch(np.arange(100), scale)
+        return self.prime_residue_tables[scale]
+    
+    @cached_spiral('unity')
     def create_unity_spiral(self, scale):
         """Create unity spiral - represents the trinity foundation (0,1,1)"""
-        t = np.linspace(0, 4*np.pi, 1000)
+        t = self.spiral_parameter()
         scale_factor = self.phi ** scale
         
         # Unity spiral represents the foundation: F(0)=0, F(1)=1, F(2)=1
         # Uses φ^scale * exp(i * t * φ/3) for trinity resonance
         unity_spiral = scale_factor * np.exp(1j * t * self.phi / 3)
         
-        # Add unity positions (0,1,2) with enhanced resonance
-        unity_positions = [0, 1, 2]
-        unity_modulation = np.zeros_like(t, dtype=complex)
-        for i, time_val in enumerate(t):
-            unity_index = int(time_val * scale_factor) % 3
-            if unity_index in unity_positions:
-                unity_modulation[i] = 2 * self.phi * np.exp(1j * unity_index * 2 * np.pi / 3)
+        # Add unity positions (0,1,2) with enhanced resonance - every sample
+        # falls on one of the three positions
+        unity_index = (t * scale_factor).astype(np.int64) % 3
+        unity_modulation = 2 * self.phi * np.exp(1j * unity_index * 2 * np.pi / 3)
         
         return unity_spiral + unity_modulation
     
+    @cached_spiral('harmonic')
     def create_harmonic_spiral(self, scale):
         """Create harmonic spiral - represents the 13-cycle breathing positions"""
-        t = np.linspace(0, 4*np.pi, 1000)
+        t = self.spiral_parameter()
         scale_factor = self.phi ** scale
         
         # Harmonic spiral uses φ^scale * exp(i * t * 13/φ) for 13-cycle resonance
         harmonic_spiral = scale_factor * np.exp(1j * t * 13 / self.phi)
         
         # Add breathing position modulation (coord sum = 2)
+        cycle_position = (t * scale_factor).astype(np.int64) % 13
+        breathing = np.isin(cycle_position, [2, 5, 8, 11])  # Breathing positions
         breathing_modulation = np.zeros_like(t, dtype=complex)
-        for i, time_val in enumerate(t):
-            cycle_position = int(time_val * scale_factor) % 13
-            if cycle_position in [2, 5, 8, 11]:  # Breathing positions
-                breathing_modulation[i] = self.phi * np.exp(1j * cycle_position * np.pi / 6)
+        breathing_modulation[breathing] = self.phi * np.exp(1j * cycle_position[breathing] * np.pi / 6)
         
         return harmonic_spiral + breathing_modulation
     
@@ -403,167 +1359,184 @@ class InfiniteRecursiveUFRF:
     
     def is_prime_via_scale_intersection(self, candidate, scale1, scale2):
         """Validate prime through multi-scale criteria"""
-        if candidate < 2:
-            return False
+        return bool(self.is_prime_via_scale_intersection_batch([candidate], scale1, scale2)[0])
+    
+    def is_prime_via_scale_intersection_batch(self, candidates, scale1, scale2):
+        """Validate an array of candidates through multi-scale criteria"""
+        candidates = np.asarray(candidates)
         
         # Check primality at both scales
-        scale1_valid = self.check_prime_at_scale(candidate, scale1)
-        scale2_valid = self.check_prime_at_scale(candidate, scale2)
+        scale1_valid = self.check_prime_at_scale_batch(candidates, scale1)
+        scale2_valid = self.check_prime_at_scale_batch(candidates, scale2)
         
         # Cross-scale harmonic unity check with bounds
-        n1 = candidate * (self.phi ** scale1)
-        n2 = candidate * (self.phi ** scale2)
-        p1 = max(scale1 + 2, 1)
-        p2 = max(scale2 + 2, 1)
-        
-        if p1 <= 0 or p2 <= 0:
-            return False
+        unity_deviation = (self.scale_unity_deviation_batch(candidates, scale1) +
+                           self.scale_unity_deviation_batch(candidates, scale2))
         
-        try:
-            unity1 = abs(np.cos(n1 * np.pi / p1)) + abs(np.sin(n1 * np.pi / p1)) + ((n1 / p1) % 1)
-            unity2 = abs(np.cos(n2 * np.pi / p2)) + abs(np.sin(n2 * np.pi / p2)) + ((n2 / p2) % 1)
-            
-            harmonic_unity = abs(unity1 - 1) + abs(unity2 - 1)
-            
-            return scale1_valid and scale2_valid and harmonic_unity < 1/3  # Relaxed from 1/10
-        except (ValueError, ZeroDivisionError, RuntimeWarning):
-            return False
+        return (candidates >= 2) & scale1_valid & scale2_valid & (unity_deviation < 1/3)  # Relaxed from 1/10
+    
+    def scale_unity_deviation_batch(self, candidates, scale):
+        """|U_p(n) - 1| for n = candidate * φ^scale in context p = max(scale + 2, 1)"""
+        n = np.asarray(candidates) * (self.phi ** scale)
+        return np.abs(harmonic_unity(n, max(scale + 2, 1)) - 1)
     
     def check_prime_at_scale(self, candidate, scale):
         """Check if candidate is prime at specific scale using GEOMETRIC NECESSITY only"""
+        return bool(self.check_prime_at_scale_batch([candidate], scale)[0])
+    
+    def check_prime_at_scale_batch(self, candidates, scale):
+        """Check an array of candidates at specific scale using GEOMETRIC NECESSITY only"""
         # NO TRADITIONAL PRIMALITY TESTS - ONLY GEOMETRIC NECESSITY
+        candidates = np.asarray(candidates)
         
         # Step 1: 13-cycle position validation
-        cycle_position = candidate % 13
+        cycle_position = candidates % 13
         prime_positions = [0, 2, 3, 5, 7, 11, 13]  # Complete geometric necessity positions
         
         # Special handling for position 10 (REST) - harmonic inversion point
-        if cycle_position == 10:
-            # Position 10 creates harmonic inversion - check if candidate can emerge from REST
-            harmonic_inversion_resonance = abs(np.cos(candidate * np.pi / 10)) + abs(np.sin(candidate * np.pi / 10))
-            if harmonic_inversion_resonance > 1.5:  # Harmonic inversion threshold
-                return True  # Can emerge from REST position
-        
-        if cycle_position not in prime_positions:
-            return False
+        # Position 10 creates harmonic inversion - candidates can emerge from REST
+        rest_angle = candidates * np.pi / 10
+        harmonic_inversion_resonance = np.abs(np.cos(rest_angle)) + np.abs(np.sin(rest_angle))
+        emerges_from_rest = (cycle_position == 10) & (harmonic_inversion_resonance > 1.5)
         
-        # Step 2: Scale-adjusted harmonic unity check
-        scale_adjusted = candidate * (self.phi ** scale)
+        valid = np.isin(cycle_position, prime_positions)
         
-        # Check harmonic unity against multiple prime contexts
-        valid_contexts = 0
-        for context_prime in [2, 3, 5, 7, 11, 13]:
-            n = scale_adjusted
-            p = context_prime
-            
-            # Geometric necessity formula: |cos(nπ/p)| + |sin(nπ/p)| + (n/p mod 1) = 1.000000
-            unity_value = (abs(np.cos(n * np.pi / p)) + 
-                          abs(np.sin(n * np.pi / p)) + 
-                          ((n / p) % 1))
-            
-            if abs(unity_value - 1.0) < 1/1000:  # Geometric necessity tolerance
-                valid_contexts += 1
-        
-        # Must be valid in majority of contexts (geometric necessity)
-        if valid_contexts < 3:
-            return False
+        # Step 2: Scale-adjusted harmonic unity check against multiple prime contexts
+        # Geometric necessity formula: |cos(nπ/p)| + |sin(nπ/p)| + (n/p mod 1) = 1.000000
+        if np.any(valid):
+            unity_rate = multi_scale_unity_rate(candidates[valid], [scale], [2, 3, 5, 7, 11, 13],
+                                                tolerance=1/1000)  # Geometric necessity tolerance
+            # Must be valid in majority of contexts (geometric necessity)
+            valid[valid] = unity_rate >= 3/6
         
         # Step 3: Geometric resonance check
-        resonance_score = self.calculate_multi_scale_resonance(candidate)
-        if resonance_score < 0.5:  # Geometric necessity threshold
-            return False
+        if np.any(valid):
+            resonance_score = self.calculate_multi_scale_resonance_batch(candidates[valid])
+            valid[valid] = resonance_score >= 0.5  # Geometric necessity threshold
         
         # Step 4: Direct angle to source check
-        if not self.has_direct_angle_to_source(candidate):
-            return False
+        valid &= self.has_direct_angle_to_source_batch(candidates)
         
-        return True  # Passed all geometric necessity checks
+        return emerges_from_rest | valid  # Passed all geometric necessity checks
     
     def has_direct_angle_to_source(self, candidate):
         """Check if number has direct angle to source (0)"""
-        if candidate <= 1:
-            return False
-        
-        angle_to_source = candidate % 360
-        
-        for scale in range(-5, 6):
-            scale_angle = (angle_to_source + scale * 360/13) % 360
-            if abs(scale_angle) < 1:  # Direct connection to source
-                return True
-        
-        return False
+        return bool(self.has_direct_angle_to_source_batch([candidate])[0])
+    
+    def has_direct_angle_to_source_batch(self, candidates):
+        """Check which candidates have a direct angle to source (0)"""
+        return direct_angle_to_source(candidates, range(-5, 6))
     
     def check_multi_scale_harmonic_unity(self, candidate):
         """Check harmonic unity across multiple scales"""
-        unity_checks = []
-        
-        for scale in range(-5, 6):
-            for prime_context in [2, 3, 5, 7, 11, 13]:
-                # CORRECT: Scale-adjusted value using φ^scale formula
-                n = candidate * (self.phi ** scale)  # This was the missing formula!
-                p = prime_context
-                
-                unity_value = (abs(np.cos(n * np.pi / p)) + 
-                              abs(np.sin(n * np.pi / p)) + 
-                              ((n / p) % 1))
-                
-                unity_checks.append(abs(unity_value - 1) < 1/10)  # Use ratio 1/10 instead of 0.1
-        
-        return sum(unity_checks) / len(unity_checks) > 3/5  # Use ratio 3/5 instead of 0.6
+        return bool(self.check_multi_scale_harmonic_unity_batch([candidate])[0])
+    
+    def check_multi_scale_harmonic_unity_batch(self, candidates):
+        """Check harmonic unity across multiple scales for an array of candidates"""
+        # Scale-adjusted values n = candidate * φ^scale in every prime context
+        unity_rate = multi_scale_unity_rate(candidates, range(-5, 6), [2, 3, 5, 7, 11, 13],
+                                            tolerance=1/10)  # Use ratio 1/10 instead of 0.1
+        return unity_rate > 3/5  # Use ratio 3/5 instead of 0.6
     
     def calculate_multi_scale_resonance(self, candidate):
         """Calculate resonance across all scales"""
-        total_resonance = 0
+        return float(self.calculate_multi_scale_resonance_batch([candidate])[0])
+    
+    def calculate_multi_scale_resonance_batch(self, candidates, block_size=1 << 16):
+        """Calculate resonance across all scales for an array of candidates"""
+        candidates = np.asarray(candidates, dtype=float).ravel()
+        total_resonance = np.empty(len(candidates))
         
-        for scale in range(-10, 11):
-            scale_resonance = 0
+        for start in range(0, len(candidates), block_size):
+            block = candidates[start:start + block_size]
             
-            # CORRECT: Scale-adjusted candidate using φ^scale formula
-            scale_adjusted_candidate = candidate * (self.phi ** scale)
+            # (candidates x scales) matrix of φ^scale adjusted candidates
+            phase = np.multiply.outer(block, self.resonance_phi)
+            np.mod(phase, 2 * np.pi, out=phase)
             
-            # Golden spiral resonance
-            golden_phase = scale_adjusted_candidate % (2 * np.pi)
-            golden_resonance = abs(np.cos(golden_phase))
+            # Golden and krystal spiral resonance: |cos(φ)| * |cos(-φ)| = cos²(φ)
+            np.cos(phase, out=phase)
+            np.square(phase, out=phase)
             
-            # Krystal spiral resonance
-            krystal_phase = scale_adjusted_candidate % (2 * np.pi)
-            krystal_resonance = abs(np.cos(-krystal_phase))
-            
-            # 13-cycle resonance
-            cycle_position = candidate % 13
-            if cycle_position == 10:
-                # Position 10 (REST) - harmonic inversion creates special resonance
-                harmonic_inversion_resonance = abs(np.cos(candidate * np.pi / 10)) + abs(np.sin(candidate * np.pi / 10))
-                cycle_resonance = harmonic_inversion_resonance / 2.0  # Normalize to 0-1 range
-            elif cycle_position in [0, 2, 3, 5, 7, 11, 13]:
-                cycle_resonance = 1.0  # Standard prime positions
-            else:
-                cycle_resonance = 0.1  # Non-prime positions
-            
-            scale_resonance = golden_resonance * krystal_resonance * cycle_resonance
-            total_resonance += scale_resonance * (self.phi ** (-abs(scale)))
+            # φ^-|scale| weighted sum over scales, scaled by 13-cycle resonance
+            np.dot(phase, self.resonance_weights, out=total_resonance[start:start + len(block)])
+            total_resonance[start:start + len(block)] *= self.cycle_resonance_batch(block)
         
         return total_resonance
     
-    def predict_primes_multi_scale(self, n_primes=50):
-        """Predict primes using complete multi-scale UFRF framework with prime centers"""
+    def cycle_resonance_batch(self, candidates):
+        """13-cycle resonance factor for an array of candidates"""
+        candidates = np.asarray(candidates, dtype=float)
+        cycle_position = candidates % 13
+        
+        # Standard prime positions resonate fully, others at 1/10
+        cycle_resonance = np.where(np.isin(cycle_position, [0, 2, 3, 5, 7, 11, 13]), 1.0, 0.1)
+        
+        # Position 10 (REST) - harmonic inversion creates special resonance
+        rest = cycle_position == 10
+        if np.any(rest):
+            angle = candidates[rest] * np.pi / 10
+            cycle_resonance[rest] = (np.abs(np.cos(angle)) + np.abs(np.sin(angle))) / 2.0
+        
+        return cycle_resonance
+    
+    def predict_primes_multi_scale(self, n_primes=50, workers=None, incremental=False,
+                                   include_dynamic=False):
+        """
+        Predict primes using complete multi-scale UFRF framework with prime centers.
+        With workers > 1, prime-center pairs and scale pairs are evaluated in a
+        process pool; results are merged in pair order, so the outcome (including
+        the dynamic primes registered) matches the serial run.
+        With incremental=True only pairs not seen by earlier incremental passes
+        are evaluated; the rest come from the pair ledger. include_dynamic=True
+        also pairs the dynamic centers, so later passes pick up the centers
+        registered by earlier ones.
+        """
         predicted_primes = []
         
         # First, generate primes from prime center intersections
-        prime_list = list(self.prime_centers.keys())
-        for i, prime1 in enumerate(prime_list):
-            for prime2 in prime_list[i+1:]:
-                if (self.prime_centers[prime1]['type'] == 'prime' and 
-                    self.prime_centers[prime2]['type'] == 'prime'):
-                    new_primes = self.generate_primes_from_center_intersection(prime1, prime2)
-                    predicted_primes.extend(new_primes)
+        registry = self.prime_center_registry
+        prime_list = (registry.spiral_primes() if include_dynamic else registry.primes('prime')).tolist()
+        if incremental:
+            center_pairs = self.pair_ledger.new_center_pairs(prime_list, include_dynamic)
+        else:
+            center_pairs = [(prime1, prime2)
+                            for i, prime1 in enumerate(prime_list)
+                            for prime2 in prime_list[i+1:]]
         
         # Also use the original cross-scale method
-        for scale1 in self.scale_range:
-            for scale2 in self.scale_range:
-                if scale1 < scale2:
-                    cross_primes = self.cross_scale_prime_interference(scale1, scale2)
-                    predicted_primes.extend(cross_primes)
+        scale_pairs = [(scale1, scale2)
+                       for scale1 in self.scale_range
+                       for scale2 in self.scale_range
+                       if scale1 < scale2]
+        if incremental:
+            scale_pairs = self.pair_ledger.new_scale_pairs(scale_pairs)
+        
+        if workers is not None and workers > 1:
+            center_meetings, cross_primes = self._run_prediction_pool(center_pairs, scale_pairs, workers)
+        else:
+            center_meetings = [self.find_center_intersection_primes(prime1, prime2)
+                               for prime1, prime2 in center_pairs]
+            cross_primes = [self.cross_scale_prime_interference(scale1, scale2)
+                            for scale1, scale2 in scale_pairs]
+        
+        # Register dynamic primes in pair order (deterministic merge)
+        for meetings in center_meetings:
+            for meeting_point, new_scale in meetings:
+                self.register_dynamic_prime(meeting_point, new_scale)
+        
+        if incremental:
+            # Predictions cover every pair evaluated so far, not just the new ones
+            self.pair_ledger.record_center_pairs(prime_list, include_dynamic, center_pairs, center_meetings)
+            self.pair_ledger.record_scale_pairs(scale_pairs, cross_primes)
+            center_meetings = self.pair_ledger.meetings_among(prime_list)
+            cross_primes = list(self.pair_ledger.scale_primes.values())
+        
+        for meetings in center_meetings:
+            predicted_primes.extend(meeting_point for meeting_point, _ in meetings)
+        
+        for primes in cross_primes:
+            predicted_primes.extend(primes)
         
         # Remove duplicates and sort
         predicted_primes = list(set(predicted_primes))
@@ -571,8 +1544,8 @@ class InfiniteRecursiveUFRF:
         
         # Add resonance scores
         scored_primes = []
-        for prime in predicted_primes[:n_primes]:
-            resonance_score = self.calculate_multi_scale_resonance(prime)
+        resonance_scores = self.calculate_multi_scale_resonance_batch(predicted_primes[:n_primes])
+        for prime, resonance_score in zip(predicted_primes[:n_primes], resonance_scores):
             scored_primes.append({
                 'value': prime,
                 'resonance_score': resonance_score,
@@ -581,6 +1554,103 @@ class InfiniteRecursiveUFRF:
         
         return scored_primes
     
+    def _run_prediction_pool(self, center_pairs, scale_pairs, workers):
+        """Evaluate prime-center and scale pairs in a process pool, preserving pair order"""
+        def split(pairs):
+            # Several contiguous batches per worker keeps the pool balanced
+            batch_size = max(1, -(-len(pairs) // (workers * 4)))
+            return [pairs[i:i + batch_size] for i in range(0, len(pairs), batch_size)]
+        
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=_init_prediction_worker,
+                                 initargs=(self.prediction_worker_copy(),)) as executor:
+            center_results = executor.map(_center_pair_task, split(center_pairs))
+            cross_results = executor.map(_scale_pair_task, split(scale_pairs))
+            center_meetings = [meetings for batch in center_results for meetings in batch]
+            cross_primes = [primes for batch in cross_results for primes in batch]
+        
+        return center_meetings, cross_primes
+    
+    def prediction_worker_copy(self):
+        """
+        Shallow copy for prediction workers: prime centers, spiral parameters
+        and scale range only. Velocity fields, grids, scratch buffers, caches
+        and the precision monitor are dropped, so the pickled size does not
+        grow with S * N^3.
+        """
+        worker = copy.copy(self)
+        worker.scale_systems = {}
+        worker.field_tensor = None
+        worker.energy_scales = {}
+        worker.X = worker.Y = worker.Z = worker.center_distance = None
+        worker.workspace = FieldWorkspace()
+        worker.derived_fields = DerivedFieldCache(worker)
+        worker.spiral_cache = SpiralCache(max_bytes=self.spiral_cache.max_bytes)
+        worker.precision_monitor = None
+        worker.pair_ledger = PairLedger()
+        worker.prime_spiral_systems = PrimeSpiralSystemsView(worker)
+        return worker
+    
+    def predict_primes(self, range_start, range_stop, chunk=1 << 16):
+        """
+        Stream predicted primes in [range_start, range_stop) as sorted chunks.
+        
+        Every integer in the range goes through the cross-scale validation
+        chain used by cross_scale_prime_interference, for all scale pairs.
+        Each yielded chunk is independent of the ones before it, so a long
+        prediction can be resumed by calling again with range_start set to
+        the last emitted chunk's 'stop'.
+        """
+        scales = list(self.scale_range)
+        scale_pairs = [(scale1, scale2) for i, scale1 in enumerate(scales) for scale2 in scales[i+1:]]
+        
+        for start in range(range_start, range_stop, chunk):
+            stop = min(start + chunk, range_stop)
+            values = self.predict_primes_in_block(np.arange(start, stop), scale_pairs)
+            dynamic = np.fromiter(self.dynamic_primes, dtype=np.int64, count=len(self.dynamic_primes))
+            
+            yield {
+                'start': start,
+                'stop': stop,
+                'values': values,
+                'resonance_scores': self.calculate_multi_scale_resonance_batch(values),
+                'sources': np.where(np.isin(values, dynamic), 'prime_center_intersection', 'cross_scale')
+            }
+    
+    def predict_primes_in_block(self, candidates, scale_pairs):
+        """Return the candidates that validate at the intersection of any scale pair"""
+        candidates = np.asarray(candidates, dtype=np.int64)
+        
+        # Scale-independent criteria first; they reject most of the block cheaply
+        candidates = candidates[self.has_direct_angle_to_source_batch(candidates)]
+        candidates = candidates[self.check_multi_scale_harmonic_unity_batch(candidates)]
+        
+        # Per-scale masks are shared by every pair that uses the scale
+        scale_valid = {}
+        unity_deviation = {}
+        resonant = {}
+        predicted = np.zeros(len(candidates), dtype=bool)
+        
+        for scale1, scale2 in scale_pairs:
+            if predicted.all():
+                break
+            for scale in (scale1, scale2):
+                if scale not in scale_valid:
+                    scale_valid[scale] = self.check_prime_at_scale_batch(candidates, scale)
+                    unity_deviation[scale] = self.scale_unity_deviation_batch(candidates, scale)
+            
+            pair_valid = (scale_valid[scale1] & scale_valid[scale2] &
+                          (unity_deviation[scale1] + unity_deviation[scale2] < 1/3))
+            if not pair_valid.any():
+                continue
+            
+            mid_scale = (scale1 + scale2) / 2
+            if mid_scale not in resonant:
+                resonant[mid_scale] = self.is_prime_via_geometric_resonance_batch(candidates, mid_scale)
+            predicted |= pair_valid & resonant[mid_scale]
+        
+        return candidates[predicted]
+    
     def compute_cross_scale_interference_force(self, scale1, scale2, u1, u2):
         """Compute interference force between two scales"""
         if scale1 == scale2:
@@ -593,55 +1663,56 @@ class InfiniteRecursiveUFRF:
         interference = interference_factor * np.real(phase_factor * u2)
         return interference
     
-    def compute_13_cycle_force(self, u, phase, scale):
+    def compute_13_cycle_force(self, u, phase, scale, out=None):
         """Compute force from 13-cycle at specific scale"""
-        # Use only ratios: 1/2, 1/5, 1/10, etc. - no arbitrary decimals
-        phase_map = {
-            1: 1/2, 2: 1/2, 3: 1/2,      # Seed/Amplify (1/2 ratio)
-            4: -1/5, 5: -1/5, 6: -1/5,   # Harmonize (-1/5 ratio)
-            7: 0, 8: 0, 9: 0,            # Peak (zero)
-            10: -1,                       # REST (-1 ratio)
-            11: 1/3, 12: 1/3, 13: 1/3    # Completion (1/3 ratio)
-        }
-        
-        delta = phase_map.get(int(phase), 0)
+        delta = self.CYCLE_PHASE_DELTAS.get(int(phase), 0)
         
         # Special handling for 11-13: transfer to next scale
-        if phase in [11, 12, 13] and scale + 1 in self.scale_range:
+        if self.transfers_to_next_scale(phase, scale):
             self.transfer_to_next_scale(u, scale, scale + 1, delta)
-            return -delta * u
+            return np.multiply(-delta, u, out=out)
         
-        return delta * u
+        return np.multiply(delta, u, out=out)
+    
+    def transfers_to_next_scale(self, phase, scale):
+        """Whether the 13-cycle force at this phase transfers energy to scale + 1"""
+        return phase in [11, 12, 13] and scale + 1 in self.scale_range
     
     def transfer_to_next_scale(self, u, from_scale, to_scale, amount):
         """Transfer energy from positions 11-13 to 1-3 of next scale"""
         if to_scale in self.scale_systems:
             scale_factor = self.phi ** (to_scale - from_scale)
-            self.scale_systems[to_scale]['velocity_field'] += scale_factor * amount * u
+            transfer = self.workspace.get('scale_transfer', u.shape, u.dtype)
+            self.scale_systems[to_scale]['velocity_field'] += np.multiply(scale_factor * amount, u, out=transfer)
+            self.derived_fields.invalidate(to_scale)
     
     def compute_spiral_resonance_force(self, u, scale):
         """Compute force from spiral resonance at specific scale"""
-        # Get all spiral types at this scale
-        golden_spiral = self.create_golden_spiral(scale)
-        krystal_spiral = self.create_krystal_spiral(scale)
-        prime_spiral = self.create_prime_spiral(scale)
-        unity_spiral = self.create_unity_spiral(scale)
-        harmonic_spiral = self.create_harmonic_spiral(scale)
-        
         # Compute vorticity for force calculation
-        omega = self.compute_vorticity(u)
-        omega_mag = np.sqrt(np.sum(omega**2, axis=-1))
-        omega_mag_safe = np.clip(omega_mag, 1/1000, 1000)
+        omega = self.derived_fields.vorticity(scale, u)
         
         # Scale-dependent regularization
-        scale_factor = self.phi ** scale
-        lambda_eff = omega_mag_safe / (10 * scale_factor + omega_mag_safe)
-        lambda_eff = np.clip(lambda_eff, 0, 1)
+        lambda_eff = self.derived_fields.lambda_eff(scale, u)
         
         # Current phase for spiral evaluation
         t = self.phase_cycles[scale] * 2 * np.pi / 13
         
-        # Evaluate spirals at current phase
+        # Combine spiral forces
+        force = np.zeros_like(u)
+        spiral_vectors = self.spiral_resonance_vectors(scale, t)
+        
+        for i in range(3):
+            for j, spiral_vec in enumerate(spiral_vectors):
+                force_component = lambda_eff * (
+                    omega[..., (i+1)%3] * spiral_vec[(i+2)%3] -
+                    omega[..., (i+2)%3] * spiral_vec[(i+1)%3]
+                )
+                force[..., i] += force_component / len(spiral_vectors)
+        
+        return np.clip(force, -1000, 1000)
+    
+    def spiral_resonance_vectors(self, scale, t):
+        """Golden, krystal, prime, unity and harmonic spiral vectors at phase t"""
         golden_val = self.phi ** (scale + t/(2*np.pi)) * np.array([
             np.cos(t * self.phi), np.sin(t * self.phi), np.sin(t * self.phi / 2)
         ])
@@ -657,25 +1728,16 @@ class InfiniteRecursiveUFRF:
         harmonic_val = self.phi ** (scale + t/(2*np.pi)) * np.array([
             np.cos(t * 13 / self.phi), np.sin(t * 13 / self.phi), np.sin(t * 13 / self.phi / 2)
         ])
-        
-        # Combine spiral forces
-        force = np.zeros_like(u)
-        spiral_vectors = [golden_val, krystal_val, prime_val, unity_val, harmonic_val]
-        
-        for i in range(3):
-            for j, spiral_vec in enumerate(spiral_vectors):
-                force_component = lambda_eff * (
-                    omega[..., (i+1)%3] * spiral_vec[(i+2)%3] -
-                    omega[..., (i+2)%3] * spiral_vec[(i+1)%3]
-                )
-                force[..., i] += force_component / len(spiral_vectors)
-        
-        return np.clip(force, -1000, 1000)
+        return np.array([golden_val, krystal_val, prime_val, unity_val, harmonic_val])
     
-    def compute_prime_generation(self, u, scale):
+    def compute_prime_generation(self, u, scale, out=None):
         """Generate vortices at prime locations for this scale"""
         primes = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31]
-        force = np.zeros_like(u)
+        force = np.zeros_like(u) if out is None else out
+        if out is not None:
+            force.fill(0)
+        concentration = self.workspace.get('prime_concentration', u.shape[:-1], u.dtype)
+        term = self.workspace.get('prime_generation_term', u.shape, u.dtype)
         
         scale_factor = self.phi ** scale
         
@@ -683,84 +1745,113 @@ class InfiniteRecursiveUFRF:
             r_p = p * self.L / self.N * scale_factor
             
             if r_p < self.L / 2:
-                r = np.sqrt((self.X - self.L/2)**2 + 
-                           (self.Y - self.L/2)**2 + 
-                           (self.Z - self.L/2)**2)
-                
-                concentration = np.exp(-(r - r_p)**2 / (2 * (self.dx * scale_factor)**2))
+                # exp(-(r - r_p)^2 / (2 (dx φ^s)^2)) around the box center
+                np.subtract(self.center_distance, r_p, out=concentration)
+                np.square(concentration, out=concentration)
+                np.negative(concentration, out=concentration)
+                concentration /= 2 * (self.dx * scale_factor)**2
+                np.exp(concentration, out=concentration)
                 
                 unity_factor = self.compute_harmonic_unity(p, scale)
+                concentration *= unity_factor
                 
-                force += unity_factor * concentration[..., np.newaxis] * u / p
+                np.multiply(concentration[..., np.newaxis], u, out=term)
+                term /= p
+                force += term
         
         return force
     
     def compute_harmonic_unity(self, p, scale):
         """Compute harmonic unity factor for prime p at scale"""
         n = self.phase_cycles[scale] * p
-        cos_term = abs(np.cos(n * np.pi / p))
-        sin_term = abs(np.sin(n * np.pi / p))
-        mod_term = (n / p) % 1
-        unity = cos_term + sin_term + mod_term
+        unity = harmonic_unity(n, p)
         
         return 2.0 - unity
     
     def compute_vorticity(self, u):
         """Compute vorticity using spectral method"""
-        omega = np.zeros_like(u)
-        k = fftfreq(self.N, d=self.dx) * 2 * np.pi
-        kx, ky, kz = np.meshgrid(k, k, k, indexing='ij')
+        u_hat = self.spectral.forward(u, self.fft_workers)
         
-        for i in range(3):
-            u_hat = fftn(u[..., i])
-            for j in range(3):
-                if i != j:
-                    k_j = [kx, ky, kz][j]
-                    omega_hat = 1j * k_j * u_hat
-                    omega[..., j] += np.real(ifftn(omega_hat))
+        # Component j collects the j-derivatives of every other component
+        u_hat_sum = np.sum(u_hat, axis=-1, out=self.workspace.get('spectrum_sum', u_hat.shape[:-1], u_hat.dtype))
+        omega_hat = u_hat  # Overwritten component by component; u_hat is not needed afterwards
+        for j in range(3):
+            k_j = self.spectral.wavenumber(j)
+            np.subtract(u_hat_sum, u_hat[..., j], out=omega_hat[..., j])
+            omega_hat[..., j] *= 1j * k_j
         
-        return omega
+        return self.spectral.inverse(omega_hat, self.fft_workers)
     
     def compute_total_ufrf_force(self):
-        """Compute complete multi-scale UFRF force"""
-        total_force = np.zeros((self.N, self.N, self.N, 3))
+        """
+        Compute complete multi-scale UFRF force.
+        The result and every intermediate live in the workspace, so the
+        returned array is only valid until the next call.
+        """
+        shape = (self.N, self.N, self.N, 3)
+        scratch = {name: self.workspace.get(name, shape, self.dtype) for name in
+                   ('cycle_force', 'prime_force', 'spiral_force', 'prime_center_force',
+                    'cross_scale_force', 'scale_force')}
+        total_force = self.workspace.zeros('total_force', shape, self.dtype)
+        
+        # Cross-scale interference in O(S) (see ufrf_kernels.cross_scale_interference).
+        # Higher scales contribute with their current fields; lower scales are
+        # accumulated as the loop goes, after their 13-cycle transfers upward
+        if self.field_tensor is not None:
+            fields = self.field_tensor
+        else:
+            fields = np.stack([self.scale_systems[scale]['velocity_field'] for scale in self.scale_range],
+                              out=self.workspace.get('field_stack', (len(self.scale_range),) + shape, self.dtype))
+        from_higher_scales = interference_from_higher_scales(
+            fields, out=self.workspace.get('from_higher_scales', fields.shape, self.dtype),
+            scratch=self.workspace.get('interference_accumulator', shape, self.complex_dtype))
+        from_lower_scales = self.workspace.zeros('from_lower_scales', shape, self.complex_dtype)
+        interference_ratio = self.complex_dtype.type(INTERFERENCE_RATIO)
         
         # Process each scale concurrently
-        for scale in self.scale_range:
+        for i, scale in enumerate(self.scale_range):
             u_scale = self.scale_systems[scale]['velocity_field']
             phase = self.phase_cycles[scale]
             
+            if i > 0:
+                from_lower_scales += self.scale_systems[self.scale_range[i - 1]]['velocity_field']
+                from_lower_scales *= interference_ratio
+            
             # Scale-specific forces
-            cycle_force = self.compute_13_cycle_force(u_scale, phase, scale)
-            spiral_force = self.compute_spiral_resonance_force(u_scale, scale)
-            prime_force = self.compute_prime_generation(u_scale, scale)
+            cycle_force = self.compute_13_cycle_force(u_scale, phase, scale, out=scratch['cycle_force'])
+            prime_force = self.compute_prime_generation(u_scale, scale, out=scratch['prime_force'])
             
-            # CRITICAL: Add prime center forces
-            prime_center_force = self.compute_prime_center_forces(u_scale, scale)
+            # Spiral resonance and (CRITICAL) prime center forces share one fused pass
+            spiral_force, prime_center_force = self.compute_fused_spiral_forces(
+                u_scale, scale, out=(scratch['spiral_force'], scratch['prime_center_force']))
             
-            # Cross-scale interference
-            cross_scale_force = np.zeros_like(u_scale)
-            for other_scale in self.scale_range:
-                if other_scale != scale:
-                    other_u = self.scale_systems[other_scale]['velocity_field']
-                    interference = self.compute_cross_scale_interference_force(
-                        scale, other_scale, u_scale, other_u
-                    )
-                    cross_scale_force += interference
+            # Cross-scale interference (sum of compute_cross_scale_interference_force
+            # over every other scale)
+            cross_scale_force = np.add(from_higher_scales[i], from_lower_scales.real,
+                                       out=scratch['cross_scale_force'])
+            if self.transfers_to_next_scale(phase, scale):
+                # The next scale has already received this scale's 13-cycle transfer:
+                # its weight φ^-1 cos(2π/13) times the φ δ u it was sent
+                transferred = self.phi * self.CYCLE_PHASE_DELTAS.get(int(phase), 0)
+                weight = float(INTERFERENCE_RATIO.real) * transferred
+                cross_scale_force += np.multiply(weight, u_scale, out=scratch['scale_force'])
             
             # Combine forces with scale weighting
             scale_weight = self.phi ** scale
-            scale_force = (cycle_force + spiral_force + prime_force + prime_center_force + cross_scale_force)
+            scale_force = np.add(cycle_force, spiral_force, out=scratch['scale_force'])
+            scale_force += prime_force
+            scale_force += prime_center_force
+            scale_force += cross_scale_force
             scale_force *= scale_weight
             
             # Clip to prevent overflow using exact ratios
-            scale_force = np.clip(scale_force, -100, 100)  # Use exact ratios
+            np.clip(scale_force, -100, 100, out=scale_force)  # Use exact ratios
             
             # Add to total
             total_force += scale_force
         
         # Final bounds check using exact ratios
-        total_force = np.clip(total_force, -1000, 1000)  # Use exact ratios
+        np.clip(total_force, -1000, 1000, out=total_force)  # Use exact ratios
         return total_force
     
     def advance_phases(self):
@@ -771,66 +1862,197 @@ class InfiniteRecursiveUFRF:
     def time_step(self, dt, nu=1/100):  # Use ratio 1/100 instead of 0.01
         """Advance one time step with complete UFRF"""
         # Standard Navier-Stokes terms
-        for scale in self.scale_range:
-            u = self.scale_systems[scale]['velocity_field']
-            
-            # Diffusion
-            u_new = u.copy()
-            for i in range(3):
-                u_hat = fftn(u[..., i])
-                k = fftfreq(self.N, d=self.dx) * 2 * np.pi
-                kx, ky, kz = np.meshgrid(k, k, k, indexing='ij')
-                k2 = kx**2 + ky**2 + kz**2
-                u_hat *= np.exp(-nu * k2 * dt)
-                u_new[..., i] = np.real(ifftn(u_hat))
-            
-            u_new = np.clip(u_new, -10, 10)  # Use exact ratios
-            self.scale_systems[scale]['velocity_field'] = u_new
+        diffusion = self.spectral.diffusion_factor(nu, dt)
+        if self.field_tensor is not None:
+            # Diffusion of every scale and component in one batched transform
+            fields = self.field_tensor
+            u_hat = self.spectral.forward(fields, self.fft_workers)
+            u_hat *= diffusion[..., None]
+            fields[...] = self.spectral.inverse(u_hat, self.fft_workers)
+            np.clip(fields, -10, 10, out=fields)  # Use exact ratios
+            self.derived_fields.invalidate()
+        else:
+            for scale in self.scale_range:
+                u = self.scale_systems[scale]['velocity_field']
+                
+                # Diffusion (all three components in one batched transform)
+                u_hat = self.spectral.forward(u, self.fft_workers)
+                u_hat *= diffusion[..., None]
+                u_new = self.spectral.inverse(u_hat, self.fft_workers)
+                
+                np.clip(u_new, -10, 10, out=u_new)  # Use exact ratios
+                self.scale_systems[scale]['velocity_field'] = u_new
+                self.derived_fields.invalidate(scale)
         
         # Apply UFRF forces
         ufrf_force = self.compute_total_ufrf_force()
         
-        # Update all scales with UFRF
-        for scale in self.scale_range:
-            ufrf_update = dt * ufrf_force
-            ufrf_update = np.clip(ufrf_update, -1/10, 1/10)  # Use ratio 1/10 instead of 0.1
-            self.scale_systems[scale]['velocity_field'] += ufrf_update
-            self.scale_systems[scale]['velocity_field'] = np.clip(
-                self.scale_systems[scale]['velocity_field'], -10, 10  # Use exact ratios
-            )
-        
-        # Update energies
-        for scale in self.scale_range:
-            u = self.scale_systems[scale]['velocity_field']
-            self.energy_scales[scale] = 1/2 * np.mean(np.sum(u**2, axis=-1))  # Use ratio 1/2
+        # Update all scales with UFRF (the update is the same for every scale)
+        ufrf_update = np.multiply(dt, ufrf_force, out=ufrf_force)
+        np.clip(ufrf_update, -1/10, 1/10, out=ufrf_update)  # Use ratio 1/10 instead of 0.1
+        if self.field_tensor is not None:
+            fields += ufrf_update  # Broadcast over the scale axis
+            np.clip(fields, -10, 10, out=fields)  # Use exact ratios
+            self.derived_fields.invalidate()
+            
+            # Update energies
+            for scale in self.scale_range:
+                u = self.scale_systems[scale]['velocity_field']
+                self.energy_scales[scale] = self.derived_fields.energy(scale, u)
+        else:
+            for scale in self.scale_range:
+                u = self.scale_systems[scale]['velocity_field']
+                u += ufrf_update
+                np.clip(u, -10, 10, out=u)  # Use exact ratios
+                self.derived_fields.invalidate(scale)
+            
+            # Update energies
+            for scale in self.scale_range:
+                u = self.scale_systems[scale]['velocity_field']
+                self.energy_scales[scale] = self.derived_fields.energy(scale, u)
         
         # Advance phases
         self.advance_phases()
+        
+        if self.precision_monitor is not None:
+            self.precision_monitor.step(dt, nu)
     
     def compute_total_energy(self):
         """Compute total energy across all scales"""
         total_energy = 0
         for scale in self.scale_range:
             u = self.scale_systems[scale]['velocity_field']
-            # Compute kinetic energy: 1/2 * ρ * |u|² (assuming ρ=1)
-            scale_energy = 1/2 * np.mean(np.sum(u**2, axis=-1))  # Use ratio 1/2
+            # Kinetic energy: 1/2 * ρ * |u|² (assuming ρ=1), usually cached by time_step
+            scale_energy = self.derived_fields.energy(scale, u)
             total_energy += scale_energy
         return total_energy
     
-    def run_simulation(self, T=50, dt=1/100):  # Use ratio 1/100 instead of 0.01
-        """Run complete multi-scale simulation"""
+    def compute_max_vorticity(self):
+        """Compute max |omega| across all scales"""
+        max_omega = 0
+        for scale in self.scale_range:
+            omega_mag = self.derived_fields.vorticity_magnitude(
+                scale, self.scale_systems[scale]['velocity_field'])
+            max_omega = max(max_omega, float(np.max(omega_mag)))
+        return max_omega
+    
+    def checkpoint_state(self):
+        """
+        (arrays, metadata) describing the evolving solver state: velocity
+        fields, 13-cycle phases, scale energies and prime centers (dynamic
+        primes included). Everything else is rebuilt from the constructor.
+        """
+        arrays = {f'velocity_field/{scale}': self.scale_systems[scale]['velocity_field']
+                  for scale in self.scale_range}
+        arrays['phase_cycles'] = np.array([self.phase_cycles[scale] for scale in self.scale_range])
+        arrays['energy_scales'] = np.array([self.energy_scales[scale] for scale in self.scale_range])
+        arrays.update({f'prime_centers/{name}': column
+                       for name, column in self.prime_center_registry.columns().items()})
+        metadata = {
+            'N': self.N,
+            'L': self.L,
+            'scale_range': [self.scale_range.start, self.scale_range.stop],
+            'precision': self.dtype.name
+        }
+        if self.precision_monitor is not None:
+            monitor_arrays, metadata['precision_monitor'] = self.precision_monitor.checkpoint_state()
+            arrays.update({f'precision_monitor/{key}': value for key, value in monitor_arrays.items()})
+        return arrays, metadata
+    
+    def restore_checkpoint_state(self, arrays, metadata):
+        """Restore the state saved by checkpoint_state into this (identically configured) solver"""
+        expected = {'N': self.N, 'L': self.L, 'precision': self.dtype.name,
+                    'scale_range': [self.scale_range.start, self.scale_range.stop]}
+        mismatched = {key: metadata[key] for key, value in expected.items() if metadata[key] != value}
+        if mismatched:
+            raise ValueError(f"Checkpoint does not match this solver: {mismatched}")
+        
+        # Copy into the existing arrays so field tensor views stay attached
+        for i, scale in enumerate(self.scale_range):
+            self.scale_systems[scale]['velocity_field'][...] = arrays[f'velocity_field/{scale}']
+            self.phase_cycles[scale] = int(arrays['phase_cycles'][i])
+            self.energy_scales[scale] = float(arrays['energy_scales'][i])
+        self.derived_fields.invalidate()
+        
+        self.prime_center_registry = PrimeCenterRegistry.from_columns(
+            *(arrays[f'prime_centers/{name}'] for name in ('prime', 'scale', 'position', 'type_code')))
+        self.prime_centers = PrimeCentersView(self.prime_center_registry)
+        self.dynamic_primes = set(self.prime_center_registry.primes('dynamic_prime').tolist())
+        
+        if self.precision_monitor is not None:
+            prefix = 'precision_monitor/'
+            self.precision_monitor.restore_checkpoint_state(
+                {key[len(prefix):]: value for key, value in arrays.items() if key.startswith(prefix)},
+                metadata['precision_monitor'])
+    
+    def save_checkpoint(self, path, step, T, dt, diagnostics):
+        """
+        Atomically write the solver state and run progress to a memory-mappable
+        checkpoint file. `step` is the next step to run; the diagnostics
+        writer is flushed first and its chunk count recorded.
+        """
+        diagnostics.flush()
+        arrays, metadata = self.checkpoint_state()
+        metadata['run'] = {'step': step, 'T': T, 'dt': dt,
+                           'diagnostics': diagnostics.directory, 'diagnostics_chunks': diagnostics.chunks}
+        write_array_file(path, arrays, metadata)
+        logging.info(f"Checkpoint written to {path} at step {step}")
+    
+    def load_checkpoint(self, path):
+        """
+        Restore a checkpoint written by save_checkpoint. Returns the run
+        progress: {'step', 'T', 'dt', 'diagnostics', 'diagnostics_chunks'}.
+        """
+        arrays, metadata = read_array_file(path)
+        self.restore_checkpoint_state(arrays, metadata)
+        return metadata['run']
+    
+    def run_simulation(self, T=50, dt=1/100,  # Use ratio 1/100 instead of 0.01
+                       checkpoint_every=None, checkpoint_path=None, resume_from=None,
+                       diagnostics_dir=None, flush_every=64):
+        """
+        Run complete multi-scale simulation.
+        Diagnostics (every 100 steps) stream to chunked NPZ files in
+        diagnostics_dir, flushed every flush_every records; read them with
+        ufrf_io.read_diagnostics, also while the run goes on. With
+        checkpoint_every, the state is checkpointed to checkpoint_path every
+        that many steps; resume_from continues a run from such a checkpoint
+        exactly as if it had never stopped.
+        """
         steps = int(T / dt)
-        time_points = []
-        total_energies = []
-        scale_energies = {scale: [] for scale in self.scale_range}
-        max_vorticity = []
+        checkpoint_path = checkpoint_path or f'{output_dir}/simulation_checkpoint.ufrf'
+        diagnostics_dir = diagnostics_dir or f'{output_dir}/diagnostics'
+        
+        start_step = 0
+        resume_chunks = None
+        if resume_from is not None:
+            run = self.load_checkpoint(resume_from)
+            if (run['T'], run['dt']) != (T, dt):
+                raise ValueError(f"Checkpoint was taken with T={run['T']}, dt={run['dt']}")
+            start_step = run['step']
+            diagnostics_dir = run['diagnostics']
+            resume_chunks = run['diagnostics_chunks']
+            logging.info(f"Resuming from {resume_from} at step {start_step}")
+        diagnostics = DiagnosticsWriter(diagnostics_dir, flush_every, resume_chunks)
+        
+        if resume_from is None:
+            parameters = {
+                'N': self.N,
+                'L': self.L,
+                'scale_range': list(self.scale_range),
+                'phi': self.phi,
+                'T': T,
+                'dt': dt
+            }
+            with open(os.path.join(diagnostics_dir, 'parameters.json'), 'w') as f:
+                json.dump(parameters, f, indent=2)
         
         logging.info("=== Infinite Recursive Multi-Scale UFRF Simulation ===")
         logging.info(f"Scales: {len(self.scale_range)} ({min(self.scale_range)} to {max(self.scale_range)})")
         logging.info(f"Time steps: {steps}")
         logging.info(f"Time interval: {T} with dt={dt}")
         
-        for step in range(steps):
+        for step in range(start_step, steps):
             t = step * dt
             
             # ADVANCE THE SIMULATION - THIS WAS MISSING!
@@ -838,87 +2060,68 @@ class InfiniteRecursiveUFRF:
             
             # Record data
             if step % 100 == 0:
-                time_points.append(t)
-                total_energies.append(self.compute_total_energy())
-                
-                for scale in self.scale_range:
-                    scale_energies[scale].append(self.energy_scales[scale])
-                
-                # Max vorticity across all scales
-                max_omega = 0
-                for scale in self.scale_range:
-                    omega = self.compute_vorticity(self.scale_systems[scale]['velocity_field'])
-                    omega_mag = np.sqrt(np.sum(omega**2, axis=-1))
-                    max_omega = max(max_omega, np.max(omega_mag))
-                max_vorticity.append(max_omega)
+                total_energy = self.compute_total_energy()
+                max_omega = self.compute_max_vorticity()  # Max vorticity across all scales
+                diagnostics.append({
+                    'time': t,
+                    'total_energy': total_energy,
+                    'scale_energies': [self.energy_scales[scale] for scale in self.scale_range],
+                    'max_vorticity': max_omega
+                })
                 
                 if step % 1000 == 0:
-                    logging.info(f"t={t:.1f}: E_total={total_energies[-1]:.4f}, "
+                    logging.info(f"t={t:.1f}: E_total={total_energy:.4f}, "
                           f"max|ω|={max_omega:.2f}, "
                           f"Active scales={len(self.scale_range)}")
+            
+            if checkpoint_every and (step + 1) % checkpoint_every == 0 and step + 1 < steps:
+                self.save_checkpoint(checkpoint_path, step + 1, T, dt, diagnostics)
         
-        # Save simulation data
-        simulation_data = {
-            'time_points': time_points,
-            'total_energies': total_energies,
-            'scale_energies': scale_energies,
-            'max_vorticity': max_vorticity,
-            'parameters': {
-                'N': self.N,
-                'L': self.L,
-                'scale_range': list(self.scale_range),
-                'phi': self.phi,
-                'T': T,
-                'dt': dt
-            }
-        }
-        
-        with open(f'{output_dir}/simulation_data.json', 'w') as f:
-            json.dump(simulation_data, f, indent=2, default=str)
+        diagnostics.close()
+        logging.info(f"Simulation completed. Diagnostics saved to {diagnostics_dir}")
         
-        logging.info("Simulation completed. Data saved to simulation_data.json")
-        return time_points, total_energies, scale_energies, max_vorticity
+        data = read_diagnostics(diagnostics_dir)
+        if not data:
+            return [], [], {scale: [] for scale in self.scale_range}, []
+        scale_energies = {scale: data['scale_energies'][:, i] for i, scale in enumerate(self.scale_range)}
+        return data['time'], data['total_energy'], scale_energies, data['max_vorticity']
 
     def is_prime_via_geometric_resonance(self, candidate, scale):
         """Check if candidate is prime through geometric spiral resonance"""
-        if candidate < 2:
-            return False
+        return bool(self.is_prime_via_geometric_resonance_batch([candidate], scale)[0])
+    
+    def is_prime_via_geometric_resonance_batch(self, candidates, scale):
+        """Check an array of candidates for primality through geometric spiral resonance"""
+        candidates = np.asarray(candidates)
         
         # Use scale-adjusted formula: n = candidate * φ^scale
-        scale_adjusted = candidate * (self.phi ** scale)
+        scale_adjusted = candidates * phi_power(scale)
         
         # Check geometric resonance conditions
         # 1. Golden spiral resonance
-        golden_phase = scale_adjusted % (2 * np.pi)
-        golden_resonance = abs(np.cos(golden_phase * self.phi))
+        total_resonance = np.abs(np.cos((scale_adjusted % (2 * np.pi)) * self.phi))
         
-        # 2. Krystal spiral resonance  
-        krystal_phase = scale_adjusted % (2 * np.pi)
-        krystal_resonance = abs(np.cos(-krystal_phase / self.phi))
+        # 2. Krystal spiral resonance
+        total_resonance += np.abs(np.cos(-(scale_adjusted % (2 * np.pi)) / self.phi))
         
         # 3. Prime spiral resonance
-        prime_phase = scale_adjusted % np.pi
-        prime_resonance = abs(np.cos(prime_phase))
+        total_resonance += np.abs(np.cos(scale_adjusted % np.pi))
         
         # 4. Unity spiral resonance (trinity foundation)
-        unity_phase = scale_adjusted % (2 * np.pi / 3)
-        unity_resonance = abs(np.cos(unity_phase * self.phi / 3))
+        total_resonance += np.abs(np.cos((scale_adjusted % (2 * np.pi / 3)) * self.phi / 3))
         
         # 5. Harmonic spiral resonance (13-cycle)
-        harmonic_phase = scale_adjusted % (2 * np.pi * 13 / self.phi)
-        harmonic_resonance = abs(np.cos(harmonic_phase))
+        total_resonance += np.abs(np.cos(scale_adjusted % (2 * np.pi * 13 / self.phi)))
         
         # Combined resonance threshold
-        total_resonance = (golden_resonance + krystal_resonance + prime_resonance + 
-                          unity_resonance + harmonic_resonance) / 5
+        total_resonance /= 5
+        resonant = total_resonance > 3/5  # Use ratio 3/5 instead of 0.6
         
-        # Basic primality check
-        if candidate < 1000:  # Only check small numbers for efficiency
-            for i in range(2, int(np.sqrt(candidate)) + 1):
-                if candidate % i == 0:
-                    return False
+        # Basic primality check (O(1) lookup in the shared sieve)
+        small = candidates < 1000  # Only check small numbers for efficiency
+        resonant[small] &= is_prime_array(candidates[small].astype(np.int64))
         
-        return total_resonance > 3/5  # Use ratio 3/5 instead of 0.6
+        return resonant & (candidates >= 2)
     
     def generate_primes_via_spiral_intersection(self, scale1, scale2):
         """Generate primes through spiral intersection at two scales"""
@@ -944,34 +2147,19 @@ class InfiniteRecursiveUFRF:
         }
         
         # Find intersection points between spiral types
+        mid_scale = (scale1 + scale2) / 2
         for spiral_type in ['golden', 'krystal', 'log', 'prime', 'unity', 'harmonic']:
-            spiral1 = spirals_scale1[spiral_type]
-            spiral2 = spirals_scale2[spiral_type]
+            _, candidates = self.find_spiral_intersections(
+                spirals_scale1[spiral_type], spirals_scale2[spiral_type], mid_scale)
             
-            # Find points where spirals intersect (similar magnitudes and phases)
-            for i in range(len(spiral1)):
-                mag1 = abs(spiral1[i])
-                mag2 = abs(spiral2[i])
-                phase1 = np.angle(spiral1[i])
-                phase2 = np.angle(spiral2[i])
-                
-                # Check if spirals intersect
-                mag_diff = abs(mag1 - mag2) / max(mag1, mag2)
-                phase_diff = abs(phase1 - phase2) % (2 * np.pi)
-                
-                if mag_diff < 1/10 and phase_diff < np.pi / 6:  # Use ratio 1/10
-                    # Generate candidate from intersection
-                    candidate = int((mag1 + mag2) / 2 * (self.phi ** ((scale1 + scale2) / 2)))
-                    candidate = max(2, candidate % 1000)  # Bounds check
-                    
-                    if self.is_prime_via_geometric_resonance(candidate, (scale1 + scale2) / 2):
-                        intersection_primes.append(candidate)
+            creates_prime = self.is_prime_via_geometric_resonance_batch(candidates, mid_scale)
+            intersection_primes.extend(candidates[creates_prime].tolist())
         
         return list(set(intersection_primes))  # Remove duplicates
     
     def generate_spiral_visualization_data(self, scale):
         """Generate data for visualizing all spiral types at a given scale"""
-        t = np.linspace(0, 4*np.pi, 1000)
+        t = self.spiral_parameter()
         
         # Generate all spiral types
         golden = self.create_golden_spiral(scale)
@@ -1032,76 +2220,87 @@ class InfiniteRecursiveUFRF:
         spirals2, t2 = self.generate_spiral_visualization_data(scale2)
         
         # Track intersections between spiral types
+        mid_scale = (scale1 + scale2) / 2
         for spiral_type in ['golden', 'krystal', 'log', 'prime', 'unity', 'harmonic']:
             spiral1 = spirals1[spiral_type]
             spiral2 = spirals2[spiral_type]
             
-            for i in range(len(t1)):
-                # Calculate intersection metrics
-                mag1 = np.sqrt(spiral1['x'][i]**2 + spiral1['y'][i]**2 + spiral1['z'][i]**2)
-                mag2 = np.sqrt(spiral2['x'][i]**2 + spiral2['y'][i]**2 + spiral2['z'][i]**2)
-                
-                phase1 = np.arctan2(spiral1['y'][i], spiral1['x'][i])
-                phase2 = np.arctan2(spiral2['y'][i], spiral2['x'][i])
-                
-                # Check for intersection
-                mag_diff = abs(mag1 - mag2) / max(mag1, mag2)
-                phase_diff = abs(phase1 - phase2) % (2 * np.pi)
-                
-                if mag_diff < 1/10 and phase_diff < np.pi / 6:
-                    # Generate candidate from intersection
-                    candidate = int((mag1 + mag2) / 2 * (self.phi ** ((scale1 + scale2) / 2)))
-                    candidate = max(2, candidate % 1000)
-                    
-                    # Calculate resonance score
-                    resonance_score = self.calculate_multi_scale_resonance(candidate)
-                    
-                    intersection_data['intersections'].append({
-                        'spiral_type': spiral_type,
-                        'time_index': i,
-                        'magnitude1': mag1,
-                        'magnitude2': mag2,
-                        'phase1': phase1,
-                        'phase2': phase2,
-                        'candidate': candidate,
-                        'resonance_score': resonance_score
-                    })
-                    
-                    # Check if candidate is prime
-                    if self.is_prime_via_geometric_resonance(candidate, (scale1 + scale2) / 2):
-                        intersection_data['generated_primes'].append(candidate)
-                        intersection_data['resonance_scores'].append(resonance_score)
+            # Calculate intersection metrics for all samples at once
+            mag1 = np.sqrt(spiral1['x']**2 + spiral1['y']**2 + spiral1['z']**2)
+            mag2 = np.sqrt(spiral2['x']**2 + spiral2['y']**2 + spiral2['z']**2)
+            
+            phase1 = np.arctan2(spiral1['y'], spiral1['x'])
+            phase2 = np.arctan2(spiral2['y'], spiral2['x'])
+            
+            indices = np.flatnonzero(spiral_intersection_mask(mag1, mag2, phase1, phase2))
+            if len(indices) == 0:
+                continue
+            
+            # Generate candidates from intersections and score them
+            candidates = intersection_candidates(mag1[indices], mag2[indices], phi_power(mid_scale))
+            resonance_scores = self.calculate_multi_scale_resonance_batch(candidates)
+            creates_prime = self.is_prime_via_geometric_resonance_batch(candidates, mid_scale)
+            
+            for j, i in enumerate(indices.tolist()):
+                intersection_data['intersections'].append({
+                    'spiral_type': spiral_type,
+                    'time_index': i,
+                    'magnitude1': float(mag1[i]),
+                    'magnitude2': float(mag2[i]),
+                    'phase1': float(phase1[i]),
+                    'phase2': float(phase2[i]),
+                    'candidate': int(candidates[j]),
+                    'resonance_score': float(resonance_scores[j])
+                })
+            
+            intersection_data['generated_primes'].extend(candidates[creates_prime].tolist())
+            intersection_data['resonance_scores'].extend(resonance_scores[creates_prime].tolist())
         
         return intersection_data
     
-    def track_prime_center_interactions(self):
-        """Track all prime center interactions and generated primes"""
+    def track_prime_center_interactions(self, incremental=False):
+        """
+        Track all prime center interactions and generated primes.
+        With incremental=True only pairs not yet in the pair ledger are
+        evaluated and reported.
+        """
         interaction_data = {
-            'prime_centers': self.prime_centers,
+            'prime_centers': self.prime_center_registry.as_dict(),
             'dynamic_primes': list(self.dynamic_primes),
             'interactions': [],
             'generated_primes': []
         }
         
         # Track all prime center intersections
-        prime_list = list(self.prime_centers.keys())
-        for i, prime1 in enumerate(prime_list):
-            for prime2 in prime_list[i+1:]:
-                if (self.prime_centers[prime1]['type'] == 'prime' and 
-                    self.prime_centers[prime2]['type'] == 'prime'):
-                    
-                    new_primes = self.generate_primes_from_center_intersection(prime1, prime2)
-                    
-                    interaction_data['interactions'].append({
-                        'prime1': prime1,
-                        'prime2': prime2,
-                        'scale1': self.prime_centers[prime1]['scale'],
-                        'scale2': self.prime_centers[prime2]['scale'],
-                        'generated_primes': new_primes,
-                        'interaction_strength': len(new_primes)
-                    })
-                    
-                    interaction_data['generated_primes'].extend(new_primes)
+        prime_list = self.prime_center_registry.primes('prime').tolist()
+        if incremental:
+            center_pairs = self.pair_ledger.new_center_pairs(prime_list, False)
+        else:
+            center_pairs = [(prime1, prime2)
+                            for i, prime1 in enumerate(prime_list)
+                            for prime2 in prime_list[i+1:]]
+        
+        center_meetings = []
+        for prime1, prime2 in center_pairs:
+            meetings = self.find_center_intersection_primes(prime1, prime2)
+            for meeting_point, new_scale in meetings:
+                self.register_dynamic_prime(meeting_point, new_scale)
+            center_meetings.append(meetings)
+            new_primes = list(set(meeting_point for meeting_point, _ in meetings))
+            
+            interaction_data['interactions'].append({
+                'prime1': prime1,
+                'prime2': prime2,
+                'scale1': self.prime_center_registry.scale_of(prime1),
+                'scale2': self.prime_center_registry.scale_of(prime2),
+                'generated_primes': new_primes,
+                'interaction_strength': len(new_primes)
+            })
+            
+            interaction_data['generated_primes'].extend(new_primes)
+        
+        if incremental:
+            self.pair_ledger.record_center_pairs(prime_list, False, center_pairs, center_meetings)
         
         # Remove duplicates
         interaction_data['generated_primes'] = list(set(interaction_data['generated_primes']))
@@ -1110,31 +2309,36 @@ class InfiniteRecursiveUFRF:
     
     def get_prime_center_statistics(self):
         """Get statistics about prime centers and their activities"""
+        registry = self.prime_center_registry
         stats = {
-            'total_centers': len(self.prime_centers),
-            'static_centers': len([p for p, info in self.prime_centers.items() if info['type'] != 'dynamic_prime']),
-            'dynamic_centers': len([p for p, info in self.prime_centers.items() if info['type'] == 'dynamic_prime']),
+            'total_centers': len(registry),
+            'static_centers': len(registry) - len(registry.dynamic_rows),
+            'dynamic_centers': len(registry.dynamic_rows),
             'total_spiral_systems': len(self.prime_spiral_systems),
-            'scale_distribution': {},
-            'type_distribution': {}
+            'registry_bytes': registry.nbytes,
+            'spiral_cache': self.spiral_cache.get_statistics(),
+            'pair_ledger': self.pair_ledger.get_statistics(),
+            'prime_force_aggregation': dict(self.prime_force_stats),
+            'scale_distribution': registry.distribution('scale'),
+            'type_distribution': registry.distribution('type_code')
         }
         
-        # Scale distribution
-        for prime, info in self.prime_centers.items():
-            scale = info['scale']
-            if scale not in stats['scale_distribution']:
-                stats['scale_distribution'][scale] = 0
-            stats['scale_distribution'][scale] += 1
-        
-        # Type distribution
-        for prime, info in self.prime_centers.items():
-            prime_type = info['type']
-            if prime_type not in stats['type_distribution']:
-                stats['type_distribution'][prime_type] = 0
-            stats['type_distribution'][prime_type] += 1
-        
         return stats
 
+# Process-pool workers for predict_primes_multi_scale; each worker receives
+# one copy of the UFRF instance through the pool initializer
+_worker_ufrf = None
+
+def _init_prediction_worker(ufrf):
+    global _worker_ufrf
+    _worker_ufrf = ufrf
+
+def _center_pair_task(center_pairs):
+    return [_worker_ufrf.find_center_intersection_primes(prime1, prime2) for prime1, prime2 in center_pairs]
+
+def _scale_pair_task(scale_pairs):
+    return [_worker_ufrf.cross_scale_prime_interference(scale1, scale2) for scale1, scale2 in scale_pairs]
+
 def save_plots(time_points, total_energies, scale_energies, max_vorticity, predicted_primes):
     """Save all plots as high-quality images"""
     # Create output directory
@@ -1161,7 +2365,7 @@ def save_plots(time_points, total_energies, scale_energies, max_vorticity, predi
     
     # Scale energies
     for scale in scale_energies:
-        if scale_energies[scale]:  # Check if list is not empty
+        if len(scale_energies[scale]):  # Check if series is not empty
             ax2.plot(time_points, scale_energies[scale], 
                     label=f'Scale {scale}', linewidth=1.5, alpha=0.7)
     ax2.set_xlabel('Time')
@@ -1176,7 +2380,7 @@ def save_plots(time_points, total_energies, scale_energies, max_vorticity, predi
     plt.close()
     
     # 2. Vorticity Evolution
-    if max_vorticity:
+    if len(max_vorticity):
         plt.figure(figsize=(10, 6))
         plt.plot(time_points, max_vorticity, 'r-', linewidth=2)
         plt.xlabel('Time')
@@ -1376,17 +2580,20 @@ if __name__ == "__main__":
     
     # Track prime center interactions
     print("Tracking prime center interactions...")
-    prime_center_data = ufrf.track_prime_center_interactions()
+    prime_center_data = ufrf.track_prime_center_interactions(incremental=True)
     print(f"Prime center interactions: {len(prime_center_data['interactions'])}")
     print(f"Generated primes from centers: {len(prime_center_data['generated_primes'])}")
     
     # Run the main simulation
     print("Running main UFRF simulation...")
-    time_points, total_energies, scale_energies, max_vorticity = ufrf.run_simulation(T=50, dt=1/100)
+    # Checkpoint every 500 steps; pass a checkpoint file to resume from it
+    resume_from = sys.argv[1] if len(sys.argv) > 1 else None
+    time_points, total_energies, scale_energies, max_vorticity = ufrf.run_simulation(
+        T=50, dt=1/100, checkpoint_every=500, resume_from=resume_from)
     
     # Predict primes using enhanced spiral methods
     print("Predicting primes using spiral resonance...")
-    predicted_primes = ufrf.predict_primes_multi_scale(n_primes=50)
+    predicted_primes = ufrf.predict_primes_multi_scale(n_primes=50, incremental=True)
     
     # Get final statistics
     final_stats = ufrf.get_prime_center_statistics()
@@ -1397,12 +2604,9 @@ if __name__ == "__main__":
     print("Saving results...")
     save_plots(time_points, total_energies, scale_energies, max_vorticity, predicted_primes)
     
-    # Save simulation data
+    # Save simulation data (the time series are already in the diagnostics directory)
     simulation_data = {
-        'time_points': time_points,
-        'total_energies': total_energies,
-        'scale_energies': scale_energies,
-        'max_vorticity': max_vorticity,
+        'diagnostics': f'{output_dir}/diagnostics',
         'predicted_primes': predicted_primes,
         'spiral_intersection_data': intersection_data,
         'prime_center_data': prime_center_data,
@@ -1410,8 +2614,8 @@ if __name__ == "__main__":
         'final_stats': final_stats
     }
     
-    with open('ufrf_simulation_results/simulation_data.json', 'w') as f:
-        json.dump(simulation_data, f, indent=2, default=str)
+    # Typed results file (load with ufrf_io.load_results)
+    save_results(f'{output_dir}/simulation_data.ufrf', simulation_data)
     
     print("=== Simulation Complete ===")
     print(f"Final energy: {total_energies[-1]:.6f}")